@@ -0,0 +1 @@
+# 모의 서버 및 성능 벤치마크 (python -m benchmarks.<모듈>)
@@ -0,0 +1,221 @@
+# 병합/후처리 벤치마크용 합성 데이터 생성기
+# 실제 수집 결과와 같은 컬럼/폴더 구조(output/{mode}_law/{info,relation,download_link}/*.csv)를 만듭니다.
+#   - 베트남어 텍스트(법령명, 기관, 서명자), "-" 자리표시자
+#   - 청크 파일 간 중복 행(정보량이 적은 사본 포함 → 정보량 점수 로직 경유)
+#   - 중앙/지방 간 동일 문서코드+법령명
+#   python -m benchmarks.datagen --rows 100k --root /tmp/bench
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CENTRAL_SHARE = 0.3      # 중앙(TW) 문서 비율
+PLACEHOLDER_RATE = 0.08  # 컬럼별 "-" 비율
+DUP_RATE = 0.15          # 다른 청크에 다시 등장하는 행 비율
+SAME_DOC_RATE = 0.02     # 다른 itemID와 문서코드+법령명이 같은 행 비율 (중앙/지방 중복 게시)
+CHUNK_ROWS = 300         # 청크 파일당 신규 행 수 (목록 10페이지 × 30건)
+
+REGIONS = ["hanoi", "thanhphohochiminh", "danang", "haiphong", "cantho", "backan", "laichau", "quangninh",
+           "thuathienhue", "nghean", "thanhhoa", "binhduong", "dongnai", "lamdong", "kiengiang"]
+DOC_TYPES = ["Luật", "Nghị định", "Thông tư", "Quyết định", "Nghị quyết", "Chỉ thị", "Công văn", "Kế hoạch"]
+ISSUERS = ["Quốc hội", "Chính phủ", "Thủ tướng Chính phủ", "Bộ Tài chính", "Bộ Tư pháp", "Bộ Công an",
+           "Ủy ban nhân dân tỉnh", "Hội đồng nhân dân tỉnh", "Bộ Giáo dục và Đào tạo", "Bộ Y tế"]
+SIGNER_TITLES = ["Chủ tịch", "Phó Chủ tịch", "Bộ trưởng", "Thứ trưởng", "Thủ tướng", "Phó Thủ tướng"]
+SIGNERS = ["Nguyễn Văn An", "Trần Thị Bình", "Lê Hoàng Cường", "Phạm Minh Đức", "Võ Thị Hạnh",
+           "Đặng Quốc Khánh", "Bùi Thị Lan", "Hồ Đức Mạnh", "Ngô Thanh Nga", "Dương Văn Phúc"]
+STATUSES = ["Còn hiệu lực", "Hết hiệu lực toàn bộ", "Hết hiệu lực một phần", "Chưa có hiệu lực"]
+SCOPES = ["Toàn quốc", "Tỉnh", "Thành phố trực thuộc trung ương", "Huyện"]
+RELATION_TYPES = ["Văn bản căn cứ", "Văn bản được hướng dẫn", "Văn bản hết hiệu lực",
+                  "Văn bản sửa đổi, bổ sung", "Văn bản liên quan cùng nội dung"]
+CODE_SUFFIXES = ["NĐ-CP", "TT-BTC", "QĐ-UBND", "QH14", "NQ-HĐND", "CT-TTg", "TT-BGDĐT"]
+WORDS = ["quy định", "chi tiết", "thi hành", "một số", "điều", "về", "quản lý", "ngân sách", "nhà nước",
+         "đất đai", "thuế", "giáo dục", "y tế", "môi trường", "đầu tư", "công", "xử phạt", "vi phạm",
+         "hành chính", "lĩnh vực", "giao thông", "đường bộ", "xây dựng", "bảo hiểm", "xã hội", "phí", "lệ phí"]
+EXTENSIONS = ["doc", "docx", "pdf"]
+
+
+def parse_rows(text: str) -> int:
+    """'10k' → 10000, '5m' → 5000000"""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def _pick(rng, values, n) -> np.ndarray:
+    return np.asarray(values, dtype=object)[rng.integers(0, len(values), n)]
+
+
+def _dates(rng, n) -> np.ndarray:
+    days = rng.integers(0, 30 * 365, n)
+    return (np.datetime64("1995-01-01") + days.astype("timedelta64[D]")).astype(str).astype(object)
+
+
+def _placeholders(rng, df: pd.DataFrame, cols, rate=PLACEHOLDER_RATE) -> pd.DataFrame:
+    for c in cols:
+        df.loc[rng.random(len(df)) < rate, c] = "-"
+    return df
+
+
+def _titles(rng, doc_types, n) -> np.ndarray:
+    # 단어 조합 풀에서 골라 문서코드로 구분 (행마다 join하는 것보다 빠름)
+    pool = np.array([" ".join(rng.choice(WORDS, rng.integers(5, 15))) for _ in range(4096)], dtype=object)
+    return doc_types + " " + pool[rng.integers(0, len(pool), n)]
+
+
+def _regions(rng, n) -> np.ndarray:
+    region = _pick(rng, REGIONS, n)
+    region[rng.random(n) < CENTRAL_SHARE] = "TW"
+    return region
+
+
+def make_info(n: int, seed=0) -> pd.DataFrame:
+    """법령 기본정보 n행 (itemID 고유)"""
+    rng = np.random.default_rng(seed)
+    region = _regions(rng, n)
+    item_id = np.arange(1, n + 1) + 10_000
+    doc_type = _pick(rng, DOC_TYPES, n)
+    code = (pd.Series(item_id % 9973).astype(str) + "/" + pd.Series(rng.integers(1995, 2026, n)).astype(str)
+            + "/" + _pick(rng, CODE_SUFFIXES, n)).to_numpy(dtype=object)
+    df = pd.DataFrame({
+        "regionID": region,
+        "itemID": item_id,
+        "문서코드": code,
+        "법령명": _titles(rng, doc_type, n),
+        "문서유형": doc_type,
+        "발급기관": _pick(rng, ISSUERS, n),
+        "유효상태": _pick(rng, STATUSES, n),
+        "발행일": _dates(rng, n),
+        "발효일": _dates(rng, n),
+        "서명자 직위": _pick(rng, SIGNER_TITLES, n),
+        "서명자": _pick(rng, SIGNERS, n),
+        "유효범위": _pick(rng, SCOPES, n),
+    })
+    df["url"] = "https://vbpl.vn/" + df["regionID"] + "/Pages/vbpq-toanvan.aspx?ItemID=" + df["itemID"].astype(str)
+
+    same = np.flatnonzero(rng.random(n) < SAME_DOC_RATE)
+    src = rng.integers(0, n, len(same))
+    df.loc[same, ["문서코드", "법령명"]] = df.loc[src, ["문서코드", "법령명"]].to_numpy()
+    return _placeholders(rng, df, ["문서유형", "발급기관", "유효상태", "발행일", "발효일", "서명자 직위", "서명자", "유효범위"])
+
+
+def _regions_of(rng, item_id, region_of) -> np.ndarray:
+    """기본정보의 지역을 따르도록 (region_of[itemID - 10001]), 없으면 무작위"""
+    return _regions(rng, len(item_id)) if region_of is None else np.asarray(region_of)[item_id - 10_001]
+
+
+def make_relation(n: int, n_docs: int, seed=1, region_of=None) -> pd.DataFrame:
+    """관계정보 n행 (문서당 평균 n/n_docs건)"""
+    rng = np.random.default_rng(seed)
+    item_id = rng.integers(1, n_docs + 1, n) + 10_000
+    related = rng.integers(1, n_docs + 1, n) + 10_000
+    df = pd.DataFrame({
+        "regionID": _regions_of(rng, item_id, region_of),
+        "itemID": item_id,
+        "신규문서코드": (pd.Series(related % 9973).astype(str) + "/" + _pick(rng, CODE_SUFFIXES, n)).to_numpy(dtype=object),
+        "relation_itemID": related.astype(str).astype(object),
+        "관계유형": _pick(rng, RELATION_TYPES, n),
+    })
+    return _placeholders(rng, df, ["신규문서코드", "relation_itemID"])
+
+
+def make_download_link(n: int, n_docs: int, seed=2, region_of=None) -> pd.DataFrame:
+    """다운로드 링크 n행"""
+    rng = np.random.default_rng(seed)
+    item_id = rng.integers(1, n_docs + 1, n) + 10_000
+    df = pd.DataFrame({
+        "regionID": _regions_of(rng, item_id, region_of),
+        "itemID": item_id,
+        "문서코드": (pd.Series(item_id % 9973).astype(str) + "/" + _pick(rng, CODE_SUFFIXES, n)).to_numpy(dtype=object),
+    })
+    df["다운로드 링크"] = ("https://vbpl.vn/" + df["regionID"] + "/Attachments/" + df["itemID"].astype(str)
+                       + "/vb_" + pd.Series(np.arange(n)).astype(str) + "." + _pick(rng, EXTENSIONS, n))
+    return _placeholders(rng, df, ["문서코드"], rate=0.03)
+
+
+def make_directive(n: int, seed=3) -> pd.DataFrame:
+    """행정지시문서 기본정보 n행"""
+    rng = np.random.default_rng(seed)
+    docid = np.arange(1, n + 1)
+    df = pd.DataFrame({
+        "docid": docid,
+        "문서코드": (pd.Series(docid % 999).astype(str) + "/CT-TTg").to_numpy(dtype=object),
+        "발행일": _dates(rng, n),
+        "발효일": _dates(rng, n),
+        "문서유형": "Chỉ thị",
+        "발급기관": _pick(rng, ISSUERS, n),
+        "서명자": _pick(rng, SIGNERS, n),
+        "문서명": _titles(rng, np.full(n, "Chỉ thị", dtype=object), n),
+        "다운로드링크": "https://chinhphu.vn/files/" + pd.Series(docid).astype(str) + ".pdf",
+    })
+    df["url"] = "https://chinhphu.vn/van-ban?docid=" + df["docid"].astype(str)
+    return _placeholders(rng, df, ["발효일", "서명자", "다운로드링크"])
+
+
+def _degrade(rng, df: pd.DataFrame) -> pd.DataFrame:
+    """재수집 사본 - 일부 필드가 비어 정보량이 적은 행"""
+    df = df.copy()
+    for c in ("발급기관", "유효상태", "발효일", "서명자"):
+        if c in df.columns:
+            df.loc[rng.random(len(df)) < 0.5, c] = "-"
+    return df
+
+
+def write_chunks(df: pd.DataFrame, folder: Path, name: str, chunk_rows=CHUNK_ROWS, dup_rate=DUP_RATE,
+                 prefix="", seed=4) -> int:
+    """df를 청크 CSV 여러 개로 나눠 저장, 일부 행은 다른 청크에 (정보량이 적은) 사본으로 다시 기록 → 총 기록 행 수"""
+    rng = np.random.default_rng(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    written = 0
+    n_chunks = max(1, -(-len(df) // chunk_rows))
+    for i in range(n_chunks):
+        part = df.iloc[i * chunk_rows:(i + 1) * chunk_rows]
+        if dup_rate and i > 0:
+            # 이전 청크 범위에서 중복 사본 추가
+            dup_idx = rng.integers(0, i * chunk_rows, max(1, int(len(part) * dup_rate)))
+            part = pd.concat([part, _degrade(rng, df.iloc[dup_idx])], ignore_index=True)
+        first, last = i * 10 + 1, i * 10 + 10
+        part.to_csv(folder / f"{prefix}{name}_output_{first:03d}_{last:03d}.csv", index=False, encoding="utf-8")
+        written += len(part)
+    return written
+
+
+def generate_tree(root, rows: int, chunk_rows=CHUNK_ROWS, dup_rate=DUP_RATE, seed=0) -> dict:
+    """root/output 아래에 중앙/지방 법령 청크 + 행정지시 merged_result 생성 → 테이블별 기록 행 수"""
+    root = Path(root)
+    info = make_info(rows, seed)
+    region_of = info["regionID"].to_numpy()
+    tables = {
+        "info": (info, "info"),
+        "relation": (make_relation(rows, rows, seed + 1, region_of), "relations"),
+        "download_link": (make_download_link(rows, rows, seed + 2, region_of), "download_link"),
+    }
+
+    counts = {}
+    for sub, (df, name) in tables.items():
+        is_central = df["regionID"] == "TW"
+        for mode, part in (("central", df[is_central]), ("local", df[~is_central])):
+            folder = root / "output" / f"{mode}_law" / sub
+            counts[sub] = counts.get(sub, 0) + write_chunks(part.reset_index(drop=True), folder, name,
+                                                            chunk_rows, dup_rate, seed=seed + 4)
+
+    directive_dir = root / "output" / "directive" / "info"
+    directive_dir.mkdir(parents=True, exist_ok=True)
+    directive = make_directive(max(1, rows // 10), seed + 3)
+    directive.to_csv(directive_dir / "merged_result.csv", index=False, encoding="utf-8")
+    counts["directive"] = len(directive)
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="병합 벤치마크용 합성 데이터 생성")
+    parser.add_argument("--rows", type=parse_rows, default=parse_rows("100k"), help="테이블별 행 수 (예: 10k, 5m)")
+    parser.add_argument("--root", default=".", help="output/ 폴더를 만들 위치")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--dup-rate", type=float, default=DUP_RATE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.root, exist_ok=True)
+    print(generate_tree(args.root, args.rows, args.chunk_rows, args.dup_rate, args.seed))
@@ -0,0 +1,192 @@
+# 모의 서버 대상 end-to-end 수집 벤치마크 (실제 Chrome 사용, 외부 네트워크 불필요)
+#   python -m benchmarks.e2e_benchmark --pipelines central,directive --workers 4 --latency 0.05
+#   python -m benchmarks.e2e_benchmark --error-rate 0.05 --block-rate 0.01 --json output/bench/e2e.json
+#
+# 보고 항목: 파이프라인별 수집 문서 수, docs/sec, 문서당 페이지 로드 수(서버 요청 기준),
+#            주입된 오류/차단 수, 최대 RSS(Chrome 자식 프로세스 포함, psutil 있으면 트리 샘플링)
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from benchmarks.mock_server import MockServer, add_site_arguments, site_from_args
+
+PIPELINES = ("central", "local", "directive")
+SAMPLE_INTERVAL = 0.5
+
+
+class PeakRSS:
+    """현재 프로세스 + 자식(Chrome/chromedriver) 최대 RSS 측정"""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self) -> int:
+        proc = psutil.Process()
+        total = proc.memory_info().rss
+        for child in proc.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._sample())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if psutil is not None:
+            self._thread = threading.Thread(target=self._loop, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            return
+        # psutil이 없으면 resource 최대값 (자기 자신 + 종료된 자식 중 최대, KB 단위)
+        import resource
+        self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        child_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        self.peak = (self_kb + child_kb) * 1024
+
+    @property
+    def mb(self) -> float:
+        return self.peak / (1024 * 1024)
+
+
+def _count_rows(output_dir: Path) -> int:
+    """수집 문서 수 (저장소의 info/directive 테이블)"""
+    from storage import DocStore, STORE_NAME
+
+    path = output_dir / STORE_NAME
+    if not path.exists():
+        return 0
+    store = DocStore(path)
+    return store.count("info") + store.count("directive")
+
+
+def _run_pipeline(name, args, vbpl_url, chinhphu_url, rate_limiter):
+    """파이프라인 1개 실행 → 출력 폴더"""
+    options = {"max_workers": args.workers, "rate_limiter": rate_limiter,
+               "use_undetected": args.engine == "undetected"}
+    if args.pages:
+        options["page_range"] = (1, args.pages)
+
+    if name == "directive":
+        from scraper.directive_scraper import DirectiveScraper, OUTPUT_DIR
+        DirectiveScraper(base_url=chinhphu_url, **options).run()
+        return Path(OUTPUT_DIR)
+
+    from scraper import make_law_scraper
+    scraper = make_law_scraper(name, base_url=vbpl_url, region_workers=args.region_workers, **options)
+    scraper.run()
+    return Path(scraper.output_dir)
+
+
+def run_benchmark(args) -> dict:
+    from scraper.rate_limiter import RateLimiter
+
+    # 모의 서버 2개 (호스트가 달라야 속도 제한기 버킷이 분리됨)
+    vbpl = MockServer(site_from_args(args), host="127.0.0.1").start()
+    chinhphu = MockServer(site_from_args(args), host="localhost").start()
+    rate_limiter = RateLimiter(state_dir="output/.ratelimit", default_rate=(args.rate, args.burst))
+
+    results = {}
+    try:
+        for name in args.pipelines:
+            server = chinhphu if name == "directive" else vbpl
+            before = server.stats()
+            with PeakRSS() as rss:
+                started = time.perf_counter()
+                output_dir = _run_pipeline(name, args, vbpl.url, chinhphu.url, rate_limiter)
+                elapsed = time.perf_counter() - started
+
+            after = server.stats()
+            requests = {k: after.get(k, 0) - before.get(k, 0) for k in after}
+            errors = requests.pop("injected_error", 0)
+            blocks = requests.pop("injected_block", 0)
+            page_loads = sum(requests.values())
+            docs = _count_rows(output_dir)
+
+            results[name] = {
+                "docs": docs,
+                "seconds": round(elapsed, 2),
+                "docs_per_sec": round(docs / elapsed, 3) if elapsed else 0.0,
+                "page_loads": page_loads,
+                "page_loads_per_doc": round(page_loads / docs, 2) if docs else None,
+                "injected_errors": errors,
+                "injected_blocks": blocks,
+                "peak_rss_mb": round(rss.mb, 1),
+                "requests": requests,
+            }
+    finally:
+        vbpl.stop()
+        chinhphu.stop()
+    return results
+
+
+def print_report(results: dict):
+    print(f"{'pipeline':<10} {'docs':>6} {'sec':>8} {'docs/s':>8} {'loads/doc':>10} {'err':>5} {'429':>5} {'RSS MB':>8}")
+    for name, r in results.items():
+        per_doc = "-" if r["page_loads_per_doc"] is None else f"{r['page_loads_per_doc']:.2f}"
+        print(f"{name:<10} {r['docs']:>6} {r['seconds']:>8.1f} {r['docs_per_sec']:>8.2f} {per_doc:>10} "
+              f"{r['injected_errors']:>5} {r['injected_blocks']:>5} {r['peak_rss_mb']:>8.1f}")
+    if psutil is None:
+        print("※ psutil 미설치 - 최대 RSS는 resource 기준(자기 자신 + 종료된 자식 중 최대)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="모의 서버 대상 end-to-end 수집 벤치마크")
+    parser.add_argument("--pipelines", default=",".join(PIPELINES), help="실행할 파이프라인 (예: central,directive)")
+    parser.add_argument("--engine", choices=("selenium", "undetected"), default="selenium")
+    parser.add_argument("--workers", type=int, default=4, help="상세 수집 최대 동시 브라우저 수")
+    parser.add_argument("--region-workers", type=int, default=1, help="지방 법령 지역 작업 병렬 브라우저 수")
+    parser.add_argument("--pages", type=int, default=None, help="지역별 최대 목록 페이지 수")
+    parser.add_argument("--rate", type=float, default=1000.0, help="모의 서버 호스트별 초당 요청 수 제한")
+    parser.add_argument("--burst", type=int, default=100)
+    parser.add_argument("--workdir", default=None, help="출력 폴더 위치 (기본: 임시 폴더)")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    add_site_arguments(parser)
+    args = parser.parse_args(argv)
+    args.pipelines = [p.strip() for p in args.pipelines.split(",") if p.strip() in PIPELINES]
+
+    # 스크래퍼 출력(output/...)이 저장소를 오염시키지 않도록 작업 폴더에서 실행
+    json_path = Path(args.json).resolve() if args.json else None
+    workdir = args.workdir or tempfile.mkdtemp(prefix="vietscrap_e2e_")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    print(f"작업 폴더: {workdir}")
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    if json_path:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps({"args": vars(args), "results": results},
+                                        ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
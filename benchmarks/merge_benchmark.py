@@ -0,0 +1,280 @@
+# 병합/후처리 벤치마크 - DocStore.sync_dir(merge_excel: 청크 CSV 가져오기 + merged_result 내보내기), merge_law_tables 4개 함수
+#   python -m benchmarks.merge_benchmark                          # 10k, 100k 행 + 기준값 비교
+#   python -m benchmarks.merge_benchmark --rows 1m,5m --repeat 3
+#   python -m benchmarks.merge_benchmark --rows 10k,100k --save-baseline
+#
+# 단계마다 별도(spawn) 프로세스에서 실행해 최대 RSS를 분리 측정합니다.
+# 기준값(benchmarks/baselines.json) 대비 rows/sec 또는 메모리 증가량(임포트 직후 RSS 대비)이 허용 오차를 넘게 나빠지면 종료 코드 1.
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from benchmarks.datagen import parse_rows, generate_tree, CHUNK_ROWS, DUP_RATE
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+DEFAULT_ROWS = "10k,100k"
+TOLERANCE = 0.25
+MIN_TIMED_SECONDS = 0.5  # 이보다 짧은 케이스는 시간 편차가 커서 메모리만 비교
+MIN_DELTA_MB = 16.0  # 메모리 증가량 비교 시 무시하는 절대 차이 (작은 케이스의 할당기/페이지 편차)
+
+_MP = mp.get_context("spawn")
+
+MODES = ("central", "local")
+# sync_dir용 저장소 - output/{mode}_law/store.sqlite가 아닌 곳에 두어 merge_law_tables 케이스는 CSV 입력으로 측정
+STORE_DIR = Path("bench_store")
+
+
+# ----- 측정 대상 (자식 프로세스에서 실행, 작업 폴더 기준 상대 경로) -----
+def _store_path(mode) -> Path:
+    return STORE_DIR / f"{mode}_law.sqlite"
+
+
+def _reset_sync(table):
+    """매 반복이 같은 일을 하도록 저장소와 내보낸 merged_result 삭제 (빈 저장소는 merged_result부터 가져오므로)"""
+    from storage.columnar import parquet_path
+    for mode in MODES:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{_store_path(mode)}{suffix}").unlink(missing_ok=True)
+        merged = Path(f"output/{mode}_law/{table}/merged_result.csv")
+        merged.unlink(missing_ok=True)
+        shutil.rmtree(parquet_path(merged), ignore_errors=True)
+
+
+def _sync_dir(table):
+    """merge_excel과 같은 경로 - 청크 CSV를 저장소에 가져온 뒤 merged_result 내보내기 (자식 테이블은 id 부여 포함)"""
+    from storage import DocStore
+    STORE_DIR.mkdir(exist_ok=True)
+    for mode in MODES:
+        store = DocStore(_store_path(mode))
+        try:
+            store.sync_dir(table, Path(f"output/{mode}_law/{table}"))
+        finally:
+            store.close()
+
+
+def _merge_law_tables(name):
+    import merge_law_tables
+    getattr(merge_law_tables, name)()
+
+
+CASES = {
+    "sync_dir[info]": (_sync_dir, ("info",)),
+    "sync_dir[relation]": (_sync_dir, ("relation",)),
+    "sync_dir[download_link]": (_sync_dir, ("download_link",)),
+    "merge_info": (_merge_law_tables, ("merge_info",)),
+    "merge_relation": (_merge_law_tables, ("merge_relation",)),
+    "merge_download_link": (_merge_law_tables, ("merge_download_link",)),
+    "copy_directive": (_merge_law_tables, ("copy_directive",)),
+}
+
+
+def _peak_rss_mb():
+    # Linux: VmHWM (exec 이후 기준) - ru_maxrss는 fork 시 부모 값이 이어져 데이터 생성 메모리가 섞임
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    if psutil is not None:
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    return None
+
+
+def _child(case, workdir, queue):
+    """케이스 1개 실행 → (소요 시간, 최대 RSS, 임포트 직후 RSS)"""
+    import logging
+    logging.disable(logging.WARNING)  # 병합 로그 출력이 측정에 섞이지 않도록
+    os.chdir(workdir)
+    import pandas  # noqa: F401 - 임포트 비용은 측정에서 제외
+    import storage.doc_store  # noqa: F401
+    import merge_law_tables  # noqa: F401
+    import storage.delta  # noqa: F401 - 실행 중에 지연 임포트되는 모듈도 미리 로드
+    import search.fulltext  # noqa: F401
+    from storage.schema import HAS_PYARROW
+    if HAS_PYARROW:
+        import pyarrow.csv  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+
+    func, args = CASES[case]
+    if case == "copy_directive":
+        # 입력 파일이 그대로면 두 번째 반복부터 읽기를 생략하므로 수정 시각을 바꿔 매번 읽게 함
+        os.utime("output/directive/info/merged_result.csv")
+    elif func is _sync_dir:
+        _reset_sync(*args)
+
+    base = _peak_rss_mb()
+    started = time.perf_counter()
+    func(*args)
+    queue.put((time.perf_counter() - started, _peak_rss_mb(), base))
+
+
+def _count_csv_rows(paths) -> int:
+    """CSV 데이터 행 수 (헤더 제외, 값 안에 줄바꿈 없음 가정)"""
+    total = 0
+    for p in paths:
+        with open(p, "rb") as f:
+            total += max(0, sum(1 for _ in f) - 1)
+    return total
+
+
+def _input_rows(case, workdir: Path) -> int:
+    """케이스의 입력 행 수 (rows/sec 기준)"""
+    out = workdir / "output"
+    func, args = CASES[case]
+    if func is _sync_dir:
+        sub = args[0]
+        return _count_csv_rows(p for mode in MODES for p in (out / f"{mode}_law" / sub).glob("*.csv")
+                               if p.name not in {"merged_result.csv", "updated_result.csv"})
+    sub = {"merge_info": "info", "merge_relation": "relation", "merge_download_link": "download_link"}.get(case)
+    if sub is None:
+        return _count_csv_rows([out / "directive" / "info" / "merged_result.csv"])
+    return _count_csv_rows(p for mode in MODES for p in [out / f"{mode}_law" / sub / "merged_result.csv"]
+                           if p.exists())
+
+
+def run_case(case, workdir: Path, repeat=1) -> dict:
+    rows = _input_rows(case, workdir)
+    runs = []
+    for _ in range(repeat):
+        queue = _MP.Queue()
+        proc = _MP.Process(target=_child, args=(case, str(workdir), queue), name=f"bench-{case}")
+        proc.start()
+        result = queue.get()
+        proc.join()
+        runs.append(result)
+
+    seconds = min(r[0] for r in runs)
+    peaks = [r[1] for r in runs if r[1] is not None]
+    bases = [r[2] for r in runs if r[2] is not None]
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_sec": round(rows / seconds, 1) if seconds else 0.0,
+        "peak_mb": round(max(peaks), 1) if peaks else None,
+        "delta_mb": round(max(peaks) - min(bases), 1) if peaks and bases else None,
+    }
+
+
+def run_suite(sizes, repeat=1, chunk_rows=CHUNK_ROWS, dup_rate=DUP_RATE, keep=False) -> dict:
+    """크기별 합성 데이터 생성 → 파이프라인 순서대로 케이스 실행"""
+    results = {}
+    for size in sizes:
+        workdir = Path(tempfile.mkdtemp(prefix=f"vietscrap_merge_{size}_"))
+        try:
+            t0 = time.perf_counter()
+            generate_tree(workdir, size, chunk_rows, dup_rate)
+            print(f"[{size:,}행] 데이터 생성 {time.perf_counter() - t0:.1f}s ({workdir})")
+            for case in CASES:
+                r = run_case(case, workdir, repeat)
+                results[f"{case}@{size}"] = r
+                print(f"  {case:<30} {r['rows']:>10,}행 {r['seconds']:>8.2f}s {r['rows_per_sec']:>12,.0f} rows/s "
+                      f"peak {r['peak_mb'] or 0:>8.1f}MB (+{r['delta_mb'] or 0:.1f})")
+        finally:
+            if not keep:
+                shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare(results: dict, baselines: dict, tolerance=TOLERANCE) -> list:
+    """기준값 대비 회귀 목록 (처리량 감소 또는 메모리 증가량이 허용 오차 + MIN_DELTA_MB 초과)
+
+    메모리는 delta_mb(임포트 직후 RSS 대비 증가량)로 비교 - peak_mb는 임포트 비용이 섞여
+    케이스 자체의 메모리 변화가 가려짐 (delta_mb가 없는 예전 기준값만 peak_mb로 비교)
+    """
+    regressions = []
+    for key, r in results.items():
+        base = baselines.get(key)
+        if not base:
+            continue
+        timed = base.get("seconds", 0) >= MIN_TIMED_SECONDS
+        if timed and r["rows_per_sec"] < base["rows_per_sec"] * (1 - tolerance):
+            regressions.append(f"{key}: rows/sec {r['rows_per_sec']:,.0f} < 기준 {base['rows_per_sec']:,.0f}")
+        metric = "delta_mb" if base.get("delta_mb") is not None and r["delta_mb"] is not None else "peak_mb"
+        if base.get(metric) is None or r[metric] is None:
+            continue
+        if r[metric] > base[metric] * (1 + tolerance) + MIN_DELTA_MB:
+            regressions.append(f"{key}: {metric} {r[metric]:.1f}MB > 기준 {base[metric]:.1f}MB")
+    return regressions
+
+
+def load_baselines(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("cases", {})
+
+
+def save_baselines(path: Path, results: dict):
+    cases = load_baselines(path)
+    cases.update(results)
+    data = {"machine": f"{platform.system()} {platform.machine()} / Python {platform.python_version()}",
+            "updated": time.strftime("%Y-%m-%d"), "cases": dict(sorted(cases.items()))}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="병합/후처리 벤치마크")
+    parser.add_argument("--rows", default=DEFAULT_ROWS, help=f"테이블별 행 수 목록 (기본 {DEFAULT_ROWS}, 최대 5m 권장)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수 (최소 시간, 최대 메모리 사용)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="청크 CSV당 신규 행 수")
+    parser.add_argument("--dup-rate", type=float, default=DUP_RATE, help="청크 간 중복 행 비율")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="허용 오차 비율 (기본 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--json", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--keep", action="store_true", help="생성한 데이터 폴더 유지")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_rows(s) for s in args.rows.split(",") if s.strip()]
+    results = run_suite(sizes, args.repeat, args.chunk_rows, args.dup_rate, args.keep)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        save_baselines(baseline_path, results)
+        print(f"기준값 저장: {baseline_path}")
+        return 0
+
+    baselines = load_baselines(baseline_path)
+    if not baselines:
+        print(f"기준값 없음: {baseline_path} (--save-baseline 으로 생성)")
+        return 0
+    regressions = compare(results, baselines, args.tolerance)
+    for line in regressions:
+        print(f"❌ 회귀: {line}")
+    if not regressions:
+        print(f"✅ 기준값 대비 회귀 없음 (허용 오차 {args.tolerance:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+# vbpl.vn / chinhphu.vn 오프라인 모의 서버 - 실제 페이지 구조(선택자)를 재현한 fixture로 응답
+#   python -m benchmarks.mock_server --port 8080 --latency 0.1 --error-rate 0.02
+#
+# 목록 전환은 실제 사이트와 같이 vbpl은 LoadPage(n) ajax, chinhphu는 __doPostBack('...', 'Page$n') 방식입니다.
+# /__stats 에서 요청 종류별 횟수를 JSON으로 확인할 수 있습니다.
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import ceil
+from pathlib import Path
+from string import Template
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+DEFAULT_REGIONS = {"hanoi": 600, "thanhphohochiminh": 450, "backan": 40, "laichau": 30}
+CENTRAL_KEY = "TW"
+
+# 합성 문서용 어휘
+_DOC_TYPES = ["Luật", "Nghị định", "Thông tư", "Quyết định", "Nghị quyết", "Chỉ thị", "Công văn"]
+_ISSUERS = ["Quốc hội", "Chính phủ", "Thủ tướng Chính phủ", "Bộ Tài chính", "Bộ Tư pháp",
+            "Ủy ban nhân dân", "Hội đồng nhân dân", "Bộ Giáo dục và Đào tạo"]
+_SIGNER_TITLES = ["Chủ tịch", "Phó Chủ tịch", "Bộ trưởng", "Thứ trưởng", "Thủ tướng"]
+_SIGNERS = ["Nguyễn Văn An", "Trần Thị Bình", "Lê Hoàng Cường", "Phạm Minh Đức", "Võ Thị Hạnh"]
+_STATUSES = ["Còn hiệu lực", "Hết hiệu lực toàn bộ", "Hết hiệu lực một phần", "Chưa có hiệu lực"]
+_SCOPES = ["Toàn quốc", "Tỉnh", "Thành phố trực thuộc trung ương"]
+_RELATION_TYPES = ["Văn bản căn cứ", "Văn bản được hướng dẫn", "Văn bản hết hiệu lực",
+                   "Văn bản sửa đổi, bổ sung", "Văn bản liên quan cùng nội dung"]
+_WORDS = ["quy định", "chi tiết", "thi hành", "một số", "điều", "về", "quản lý", "ngân sách", "nhà nước",
+          "đất đai", "thuế", "giáo dục", "y tế", "môi trường", "đầu tư", "công", "xử phạt", "vi phạm",
+          "hành chính", "lĩnh vực", "giao thông", "đường bộ", "xây dựng", "bảo hiểm", "xã hội"]
+
+
+def _load(name: str) -> Template:
+    return Template((FIXTURE_DIR / name).read_text(encoding="utf-8"))
+
+
+def _rng(*key) -> random.Random:
+    """키별 결정적 난수 (같은 문서는 항상 같은 내용)"""
+    return random.Random(zlib.crc32("|".join(map(str, key)).encode()))
+
+
+def _dmy(rng: random.Random, sep: str) -> str:
+    return f"{rng.randint(1, 28):02d}{sep}{rng.randint(1, 12):02d}{sep}{rng.randint(1995, 2025)}"
+
+
+class MockData:
+    """지역별 합성 법령/행정지시 문서"""
+
+    def __init__(self, central_docs=300, regions=None, directive_docs=250,
+                 docs_per_page=30, directive_per_page=50, seed=0):
+        self.counts = {CENTRAL_KEY: central_docs}
+        self.counts.update(DEFAULT_REGIONS if regions is None else regions)
+        self.directive_docs = directive_docs
+        self.docs_per_page = docs_per_page
+        self.directive_per_page = directive_per_page
+        self.seed = seed
+        # 지역별 ItemID 시작값 (지역 간 중복 없음)
+        self.id_base = {code: 100000 * i for i, code in enumerate(self.counts)}
+
+    def item_ids(self, region: str, page: int) -> list:
+        total = self.counts.get(region, 0)
+        first = (page - 1) * self.docs_per_page
+        base = self.id_base[region]
+        return [base + n + 1 for n in range(first, min(first + self.docs_per_page, total))]
+
+    def law(self, region: str, item_id: int) -> dict:
+        rng = _rng(self.seed, region, item_id)
+        doc_type = rng.choice(_DOC_TYPES)
+        return {
+            "region": region,
+            "item_id": item_id,
+            "doc_code": f"{item_id % 1000}/{rng.randint(1995, 2025)}/{rng.choice(['NĐ-CP', 'TT-BTC', 'QĐ-UBND', 'QH14'])}",
+            "doc_type": doc_type,
+            "title": f"{doc_type} " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 16))),
+            "issuer": rng.choice(_ISSUERS),
+            "signer_title": rng.choice(_SIGNER_TITLES),
+            "signer": rng.choice(_SIGNERS),
+            "issued_dmy": _dmy(rng, "/"),
+            "effective_dmy": _dmy(rng, "/"),
+            "status": rng.choice(_STATUSES),
+            "scope": rng.choice(_SCOPES),
+            "body": " ".join(rng.choice(_WORDS) for _ in range(200)),
+            "n_files": rng.choice([0, 1, 1, 2]),
+            "n_relations": rng.choice([0, 1, 2, 3, 5, 8]),
+        }
+
+    def directive(self, docid: int) -> dict:
+        rng = _rng(self.seed, "directive", docid)
+        return {
+            "docid": docid,
+            "doc_code": f"{docid % 1000}/CT-TTg",
+            "issued_dmy": _dmy(rng, "-"),
+            "effective_dmy": _dmy(rng, "-"),
+            "doc_type": "Chỉ thị",
+            "issuer": rng.choice(_ISSUERS),
+            "signer": rng.choice(_SIGNERS),
+            "title": "Chỉ thị " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 16))),
+        }
+
+
+class MockSite:
+    """요청 경로 → (상태코드, HTML) 렌더링, 지연/오류 주입 및 요청 통계"""
+
+    def __init__(self, data: MockData = None, latency=0.0, jitter=0.0, error_rate=0.0, block_rate=0.0, seed=0):
+        self.data = data or MockData()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = Counter()
+        self.t = {name: _load(f"{name}.html") for name in (
+            "vbpl_home", "vbpl_list", "vbpl_list_item", "vbpl_tabs", "vbpl_toanvan", "vbpl_thuoctinh",
+            "vbpl_lienquan", "chinhphu_list", "chinhphu_detail")}
+
+    def handle(self, path: str):
+        parsed = urlparse(path)
+        query = {k.lower(): v[0] for k, v in parse_qs(parsed.query).items()}
+        parts = [p for p in parsed.path.split("/") if p]
+
+        if parts == ["__stats"]:
+            with self._lock:
+                return 200, json.dumps(dict(self.stats)), "application/json"
+
+        kind, render = self._route(parts, query)
+        with self._lock:
+            self.stats[kind] += 1
+            roll = self._rng.random()
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        # 상세 페이지에만 오류/차단 주입 (목록 이동 실패는 전체 페이지 스킵으로 이어지므로 제외)
+        if kind.endswith("detail") or kind.startswith("law_"):
+            if roll < self.error_rate:
+                with self._lock:
+                    self.stats["injected_error"] += 1
+                return 500, "<html><body>Internal Server Error</body></html>", "text/html"
+            if roll < self.error_rate + self.block_rate:
+                with self._lock:
+                    self.stats["injected_block"] += 1
+                return 429, "<html><head><title>Too Many Requests</title></head><body>captcha</body></html>", "text/html"
+
+        if render is None:
+            return 404, "<html><body>Not Found</body></html>", "text/html"
+        return 200, render(), "text/html"
+
+    def _route(self, parts, query):
+        # chinhphu.vn
+        if parts[:1] == ["he-thong-van-ban"]:
+            return "directive_list", lambda: self.directive_list(int(query.get("page", 1)))
+        if parts[:1] == ["van-ban"]:
+            return "directive_detail", lambda: self.directive_detail(int(query.get("docid", 0)))
+
+        # vbpl.vn - /{지역}, /{지역}/Pages/{페이지}.aspx
+        region = parts[0] if parts else CENTRAL_KEY
+        if region not in self.data.counts:
+            return "not_found", None
+        page = parts[2] if len(parts) >= 3 else "home.aspx"
+        item_id = int(query.get("itemid", 0) or 0)
+        routes = {
+            "home.aspx": ("home", lambda: self.home(region)),
+            "vanban.aspx": ("list", lambda: self.law_list(region)),
+            "listvanban.aspx": ("list_ajax", lambda: self.law_list_items(region, int(query.get("page", 1)))),
+            "vbpq-toanvan.aspx": ("law_toanvan", lambda: self.law_page(region, item_id, "vbpl_toanvan")),
+            "vbpq-thuoctinh.aspx": ("law_thuoctinh", lambda: self.law_page(region, item_id, "vbpl_thuoctinh")),
+            "vbpq-vanbanlienquan.aspx": ("law_lienquan", lambda: self.law_page(region, item_id, "vbpl_lienquan")),
+        }
+        return routes.get(page.lower(), ("not_found", None))
+
+    # ----- vbpl.vn -----
+    def home(self, region: str) -> str:
+        items = "\n".join(f'        <li><a href="/{code}">{code.title()}</a></li>'
+                          for code in self.data.counts if code != CENTRAL_KEY)
+        return self.t["vbpl_home"].substitute(region=region, region_name=region.title(), region_items=items)
+
+    def law_list(self, region: str) -> str:
+        return self.t["vbpl_list"].substitute(region=region, region_name=region.title(),
+                                              total_text=f"{self.data.counts[region]:,}".replace(",", "."))
+
+    def law_list_items(self, region: str, page: int) -> str:
+        return "\n".join(self.t["vbpl_list_item"].substitute(self.data.law(region, item_id))
+                         for item_id in self.data.item_ids(region, page))
+
+    def law_page(self, region: str, item_id: int, template: str) -> str:
+        doc = self.data.law(region, item_id)
+        rng = _rng("files", item_id)
+        downloads = "\n".join(
+            f"""    <li><a class="show_hide" href="javascript:downloadfile('{doc['doc_code']}','/{region}/Attachments/{item_id}/vb_{item_id}_{n}.{rng.choice(['doc', 'docx', 'pdf'])}')">tải về</a></li>"""
+            for n in range(doc["n_files"]))
+        relations = []
+        for n in range(doc["n_relations"]):
+            other = self.data.id_base[region] + rng.randint(1, max(1, self.data.counts[region]))
+            relations.append(
+                f"""        <tr><td>{rng.choice(_RELATION_TYPES)}</td><td><ul class="listVB"><li><div>"""
+                f"""<p><a href="/{region}/Pages/vbpq-toanvan.aspx?ItemID={other}">Văn bản {other}</a></p>"""
+                f"""<p>Ban hành: {_dmy(rng, '/')}</p></div></li></ul></td></tr>""")
+        if not relations:
+            relations.append('        <tr><td colspan="2">Nội dung đang cập nhật.</td></tr>')
+        return self.t[template].substitute(doc, tabs=self.t["vbpl_tabs"].substitute(doc),
+                                           downloads=downloads, relation_rows="\n".join(relations))
+
+    # ----- chinhphu.vn -----
+    def directive_list(self, page: int) -> str:
+        total, per_page = self.data.directive_docs, self.data.directive_per_page
+        pages = max(1, ceil(total / per_page))
+        page = min(max(1, page), pages)
+        first = (page - 1) * per_page
+
+        rows = []
+        for n in range(first, min(first + per_page, total)):
+            doc = self.data.directive(n + 1)
+            rows.append(f"""    <tr><td><a href="/van-ban?docid={doc['docid']}">{doc['doc_code']}</a></td>"""
+                        f"""<td>{doc['issued_dmy']}</td><td>{doc['title']}</td></tr>""")
+
+        # 실제 사이트처럼 10페이지 단위 페이저 + 이전/다음 묶음 '...' 버튼
+        block = (page - 1) // 10
+        cells = []
+        if block > 0:
+            cells.append(block * 10)
+        cells.extend(range(block * 10 + 1, min(block * 10 + 10, pages) + 1))
+        if block * 10 + 10 < pages:
+            cells.append(block * 10 + 11)
+        pager = []
+        for i, n in enumerate(cells):
+            label = "..." if (i == 0 and block > 0) or n > block * 10 + 10 else str(n)
+            if n == page:
+                pager.append(f"        <td><span>{n}</span></td>")
+            else:
+                pager.append(f"""        <td><a href="javascript:__doPostBack('ctl00$grid','Page${n}')">{label}</a></td>""")
+
+        return self.t["chinhphu_list"].substitute(rows="\n".join(rows), pager="\n".join(pager),
+                                                  first=first + 1, last=min(first + per_page, total), total=total)
+
+    def directive_detail(self, docid: int) -> str:
+        doc = self.data.directive(docid)
+        return self.t["chinhphu_detail"].substitute(doc, download=f"/files/{docid}.pdf")
+
+
+class MockServer:
+    """백그라운드 스레드에서 동작하는 모의 서버"""
+
+    def __init__(self, site: MockSite = None, host="127.0.0.1", port=0):
+        self.site = site or MockSite()
+        site = self.site
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, body, ctype = site.handle(self.path)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{ctype}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.host = host
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.httpd.server_address[1]}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        with self.site._lock:
+            return dict(self.site.stats)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_site_arguments(parser: argparse.ArgumentParser):
+    """모의 사이트 옵션 (서버 단독 실행/벤치마크 공용)"""
+    parser.add_argument("--central-docs", type=int, default=300, help="중앙(TW) 문서 수")
+    parser.add_argument("--regions", default=",".join(f"{k}:{v}" for k, v in DEFAULT_REGIONS.items()),
+                        help="지역:문서수 목록 (예: hanoi:600,backan:40)")
+    parser.add_argument("--directive-docs", type=int, default=250, help="행정지시문서 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 고정 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="요청당 추가 무작위 지연 상한(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="상세 페이지 500 응답 비율")
+    parser.add_argument("--block-rate", type=float, default=0.0, help="상세 페이지 429(captcha) 응답 비율")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def site_from_args(args) -> MockSite:
+    regions = {}
+    for item in filter(None, args.regions.split(",")):
+        code, _, count = item.partition(":")
+        regions[code.strip()] = int(count or 0)
+    data = MockData(args.central_docs, regions, args.directive_docs, seed=args.seed)
+    return MockSite(data, args.latency, args.jitter, args.error_rate, args.block_rate, args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="vbpl.vn / chinhphu.vn 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockServer(site_from_args(args), args.host, args.port)
+    print(f"모의 서버 실행: {server.url}  (vbpl: {server.url}/TW/Pages/home.aspx, "
+          f"chinhphu: {server.url}/he-thong-van-ban?classid=2&mode=1)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
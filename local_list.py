@@ -1,63 +0,0 @@
-[('hanoi', 'https://vbpl.vn/hanoi'), 
- ('thanhphohochiminh', 'https://vbpl.vn/thanhphohochiminh'), 
- ('danang', 'https://vbpl.vn/danang'), 
- ('haiphong', 'https://vbpl.vn/haiphong'), 
- ('cantho', 'https://vbpl.vn/cantho'), 
- ('angiang', 'https://vbpl.vn/angiang'), 
- ('bariavungtau', 'https://vbpl.vn/bariavungtau'), 
- ('bacgiang', 'https://vbpl.vn/bacgiang'), 
- ('backan', 'https://vbpl.vn/backan'), 
- ('baclieu', 'https://vbpl.vn/baclieu'), 
- ('bacninh', 'https://vbpl.vn/bacninh'), 
- ('bentre', 'https://vbpl.vn/bentre'), 
- ('binhdinh', 'https://vbpl.vn/binhdinh'), 
- ('binhduong', 'https://vbpl.vn/binhduong'), 
- ('binhphuoc', 'https://vbpl.vn/binhphuoc'), 
- ('binhthuan', 'https://vbpl.vn/binhthuan'), 
- ('camau', 'https://vbpl.vn/camau'), 
- ('caobang', 'https://vbpl.vn/caobang'), 
- ('daklak', 'https://vbpl.vn/daklak'), 
- ('daknong', 'https://vbpl.vn/daknong'), 
- ('dienbien', 'https://vbpl.vn/dienbien'), 
- ('dongnai', 'https://vbpl.vn/dongnai'), 
- ('dongthap', 'https://vbpl.vn/dongthap'), 
- ('gialai', 'https://vbpl.vn/gialai'), 
- ('hagiang', 'https://vbpl.vn/hagiang'), 
- ('hanam', 'https://vbpl.vn/hanam'), 
- ('hatinh', 'https://vbpl.vn/hatinh'), 
- ('haiduong', 'https://vbpl.vn/haiduong'), 
- ('haugiang', 'https://vbpl.vn/haugiang'), 
- ('hoabinh', 'https://vbpl.vn/hoabinh'), 
- ('hungyen', 'https://vbpl.vn/hungyen'), 
- ('khanhhoa', 'https://vbpl.vn/khanhhoa'), 
- ('kiengiang', 'https://vbpl.vn/kiengiang'), 
- ('kontum', 'https://vbpl.vn/kontum'), 
- ('laichau', 'https://vbpl.vn/laichau'), 
- ('lamdong', 'https://vbpl.vn/lamdong'), 
- ('langson', 'https://vbpl.vn/langson'), 
- ('laocai', 'https://vbpl.vn/laocai'), 
- ('longan', 'https://vbpl.vn/longan'), 
- ('namdinh', 'https://vbpl.vn/namdinh'), 
- ('nghean', 'https://vbpl.vn/nghean'), 
- ('ninhbinh', 'https://vbpl.vn/ninhbinh'), 
- ('ninhthuan', 'https://vbpl.vn/ninhthuan'), 
- ('phutho', 'https://vbpl.vn/phutho'), 
- ('phuyen', 'https://vbpl.vn/phuyen'), 
- ('quangbinh', 'https://vbpl.vn/quangbinh'), 
- ('quangnam', 'https://vbpl.vn/quangnam'), 
- ('quangngai', 'https://vbpl.vn/quangngai'), 
- ('quangninh', 'https://vbpl.vn/quangninh'), 
- ('quangtri', 'https://vbpl.vn/quangtri'), 
- ('soctrang', 'https://vbpl.vn/soctrang'), 
- ('sonla', 'https://vbpl.vn/sonla'), 
- ('tayninh', 'https://vbpl.vn/tayninh'), 
- ('thaibinh', 'https://vbpl.vn/thaibinh'), 
- ('thainguyen', 'https://vbpl.vn/thainguyen'), 
- ('thanhhoa', 'https://vbpl.vn/thanhhoa'), 
- ('thuathienhue', 'https://vbpl.vn/thuathienhue'), 
- ('tiengiang', 'https://vbpl.vn/tiengiang'), 
- ('travinh', 'https://vbpl.vn/travinh'), 
- ('tuyenquang', 'https://vbpl.vn/tuyenquang'), 
- ('vinhlong', 'https://vbpl.vn/vinhlong'), 
- ('vinhphuc', 'https://vbpl.vn/vinhphuc'), 
- ('yenbai', 'https://vbpl.vn/yenbai')]
\ No newline at end of file
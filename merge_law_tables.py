@@ -1,174 +1,353 @@
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import pandas as pd
+import multiprocessing as mp
+import os
 from typing import Iterable, List, Optional, Tuple, Dict, Any
 
-# 프로젝트 로거 사용 (없어도 동작하도록 예외 처리)
-try:
-    from log_util import setup_logger
-    LOGGER = setup_logger(__name__, "output/law_combined/log/merge_law_tables.log")
-except Exception:
-    import logging
-    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s")
-    LOGGER = logging.getLogger(__name__)
+import logging
+
+from metrics_util import timed
+import profile_util
+from storage import read_table, write_table, link_table, table_exists
+from storage import schema
+from storage.columnar import parquet_path
+# pandas/numpy를 쓰는 delta/search 모듈과 pandas는 실제 병합 시점에 임포트 (임포트만으로 수백 ms)
+
+# 로거 핸들러(로그 파일)는 main() 실행 시 설정 - 임포트만으로 output 폴더를 만들지 않음
+LOGGER = logging.getLogger(__name__)
 
 OUT_BASE = Path("output/law_combined")
+MERGE_WORKERS = 4  # 테이블별 병합 동시 실행 프로세스 수 (1이면 순서대로)
+_MP = mp.get_context("spawn")
+
+# 테이블 → 입력(파이프라인 merged_result) / 통합 출력
+SOURCES = {
+    "info": [Path("output/central_law/info/merged_result.csv"), Path("output/local_law/info/merged_result.csv")],
+    "relation": [Path("output/central_law/relation/merged_result.csv"),
+                 Path("output/local_law/relation/merged_result.csv")],
+    "download_link": [Path("output/central_law/download_link/merged_result.csv"),
+                      Path("output/local_law/download_link/merged_result.csv")],
+    "directive": [Path("output/directive/info/merged_result.csv")],
+}
+OUTPUTS = {
+    "info": OUT_BASE / "info" / "베트남_법령_기본정보.csv",
+    "relation": OUT_BASE / "relation" / "베트남_법령_관계정보.csv",
+    "download_link": OUT_BASE / "download_link" / "베트남_법령_파일링크.csv",
+    "directive": OUT_BASE / "directive" / "베트남_중앙정부_행정_지시_문서_기본정보.csv",
+}
+
+def setup_logging():
+    """프로젝트 로거 사용 (없어도 동작하도록 예외 처리)"""
+    if LOGGER.handlers:
+        return
+    try:
+        from log_util import setup_logger
+        setup_logger(__name__, str(OUT_BASE / "log" / "merge_law_tables.log"))
+    except Exception:
+        logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s")
 
 # -------- 공통 유틸 --------
 def ensure_dir(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     return p
 
-def read_if_exists(path: Path) -> pd.DataFrame:
+def read_if_exists(path: Path, columns=None, filters=None, table: str = None) -> pd.DataFrame:
+    """CSV 또는 같은 이름의 Parquet 읽기 (Parquet이면 필요한 컬럼/파티션만, 타입은 스키마대로)"""
     try:
-        if path.exists() and path.stat().st_size > 0:
-            df = pd.read_csv(path)
+        if table_exists(path) and (not path.exists() or path.stat().st_size > 0):
+            df = read_table(path, columns=columns, filters=filters, table=table)
             LOGGER.info(f"[read] {path} rows={len(df)}")
             return df
     except Exception as e:
         LOGGER.error(f"[read] failed: {path} | {e}")
+    import pandas as pd
+
     return pd.DataFrame()
 
-def concat_and_drop_duplicates(dfs: List[pd.DataFrame], subset: List[str]) -> pd.DataFrame:
-    if not dfs:
-        return pd.DataFrame()
-    df = pd.concat([d for d in dfs if not d.empty], ignore_index=True)
+def open_sources(table: str, srcs: List[Path]) -> List[Tuple[Path, Any]]:
+    """입력별 (merged_result 경로, 저장소) - 출력 폴더에 저장소(store.sqlite)가 없으면 저장소는 None"""
+    from storage import DocStore, STORE_NAME
+
+    sources = []
+    for path in srcs:
+        store_path = path.parent.parent / STORE_NAME  # output/{...}/{sub}/merged_result.csv → output/{...}/store.sqlite
+        store = None
+        if store_path.exists():
+            store = DocStore(store_path, logger=LOGGER)
+            store.import_csv_dir(table, path.parent)  # 저장소 도입 전 결과
+        sources.append((path, store))
+    return sources
+
+def sources_unchanged(table: str, sources, out_path: Path) -> bool:
+    """있는 입력이 모두 저장소이고 마지막 병합 이후 변경이 없으면 True (merged_result, 통합 출력 모두 최신)"""
+    present = [(path, store) for path, store in sources if store is not None or table_exists(path)]
+    return bool(present) and all(store is not None and store.is_exported(table, path)
+                                 and store.is_exported(table, out_path) for path, store in present)
+
+def read_sources(table: str, sources) -> Tuple[List[pd.DataFrame], list]:
+    """입력 읽기 - 저장소가 있으면 저장소에서 한 번만 읽어 파이프라인 merged_result도 같은 프레임으로 저장
+
+    반환: (입력별 DataFrame, 통합 출력 저장 후 기록할 (저장소, 버전) 목록)
+    """
+    dfs, marks = [], []
+    for path, store in sources:
+        if store is None:
+            dfs.append(read_if_exists(path, table=table))
+            continue
+        version = store.version(table)
+        df = store.merged_frame(table)
+        LOGGER.info(f"[read] {store.path}:{table} rows={len(df)}")
+        store.export(table, path, df=df, version=version)  # 변경이 없으면 생략
+        dfs.append(df)
+        marks.append((store, version))
+    return dfs, marks
+
+def save_output(df: pd.DataFrame, out_path: Path, table: str, marks) -> Path:
+    """통합 출력 저장 (출력 형식 VIETSCRAP_FORMAT에 따라 CSV 및/또는 Parquet) 후 delta, 전문 검색 인덱스, 입력 저장소에 버전 기록"""
+    from storage.delta import write_delta
+    from search.fulltext import update_index
+
+    ensure_dir(out_path.parent)
+    write_table(df, out_path, table=table)
+    write_delta(df, out_path, table, LOGGER)
+    update_index(df, out_path, table, LOGGER)  # 제목 전문 검색 (info만)
+    for store, version in marks:
+        store.mark_exported(table, out_path, version)
+    LOGGER.info(f"[{out_path.parent.name}] 저장: {out_path} rows={len(df)}")
+    return out_path
+
+def _duplicated_last(df: pd.DataFrame, subset: List[str]) -> np.ndarray:
+    """df.duplicated(subset, keep="last")와 같은 결과 (numpy bool 배열)
+
+    행 해시가 겹치는 행만 실제 값으로 비교 - string[pyarrow] 컬럼 전체를 사전 인코딩하지 않음
+    (같은 값이면 해시도 같으므로 해시가 유일한 행은 중복일 수 없음)
+    """
+    import numpy as np
+    from storage.delta import hash_rows
+
+    _, inverse, counts = np.unique(hash_rows(df[subset]), return_inverse=True, return_counts=True)
+    candidates = np.flatnonzero(counts[inverse] > 1)
+    dup = np.zeros(len(df), dtype=bool)
+    if len(candidates):
+        dup[candidates] = df.iloc[candidates].duplicated(subset=subset, keep="last").to_numpy()
+    return dup
+
+def concat_and_drop_duplicates(dfs: List[pd.DataFrame], subset: List[str], table: str = None) -> pd.DataFrame:
+    # 타입 통일 - 스키마 타입(storage.schema)을 유지하며 병합 (category는 카테고리를 합쳐서)
+    df = schema.concat(dfs, table)
     if df.empty:
         return df
     # subset에 존재하는 컬럼만 사용 (없으면 무시)
     subset = [c for c in subset if c in df.columns]
     if subset:
-        df = df.drop_duplicates(subset=subset, keep="last").reset_index(drop=True)
-    else:
-        df = df.reset_index(drop=True)
+        dup = _duplicated_last(df, subset)
+        if dup.any():  # schema.concat 결과는 이미 0..n-1 인덱스
+            df = df[~dup].reset_index(drop=True)
     return df
 
 def reassign_pk(df: pd.DataFrame, pk_name: str = "id") -> pd.DataFrame:
     if df.empty:
         return df
-    df = df.copy()
-    if pk_name in df.columns:
-        df = df.drop(columns=[pk_name])
+    # drop도 새 프레임을 돌려주므로 복사는 한 번만
+    df = df.drop(columns=[pk_name]) if pk_name in df.columns else df.copy()
     df.insert(0, pk_name, range(1, len(df) + 1))
     return df
 
-def normalize_types(df: pd.DataFrame, to_str_cols: Iterable[str]) -> pd.DataFrame:
-    if df.empty:
-        return df
-    df = df.copy()
-    for c in to_str_cols:
-        if c in df.columns:
-            df[c] = df[c].astype(str)
-    return df
-
 # -------- 메인 병합 로직 --------
+# 저장소가 있는 입력은 테이블마다 저장소를 한 번만 읽어 파이프라인 merged_result와 law_combined 출력을
+# 같은 프레임으로 저장합니다 (파일당 쓰기 1번, 입력이 바뀌지 않았으면 읽기/쓰기 모두 생략).
+@timed("merge_info")
 def merge_info() -> Optional[Path]:
     """
     중앙/지방 '기본정보' 통합 → 베트남_법령_기본정보.csv
     중복 키: regionID + itemID
     """
-    srcs = [
-        Path("output/central_law/info/merged_result.csv"),
-        Path("output/local_law/info/merged_result.csv"),
-    ]
-    dfs = [read_if_exists(p) for p in srcs]
-    df = concat_and_drop_duplicates(dfs, subset=["regionID", "itemID"])
+    out_path = OUTPUTS["info"]
+    sources = open_sources("info", SOURCES["info"])
+    if sources_unchanged("info", sources, out_path):
+        LOGGER.info(f"[info] 변경 없음, 생략: {out_path}")
+        return out_path
+
+    dfs, marks = read_sources("info", sources)
+    df = concat_and_drop_duplicates(dfs, subset=["regionID", "itemID"], table="info")
+    del dfs  # 병합 전 조각은 바로 해제 (저장 중 최대 메모리)
     if df.empty:
         LOGGER.warning("[info] 입력 데이터가 비었습니다.")
         return None
+    return save_output(df, out_path, "info", marks)
 
-    # 타입 통일(잠재적 조인·후속처리 대비)
-    df = normalize_types(df, ["regionID", "itemID"])
-
-    out_dir = ensure_dir(OUT_BASE / "info")
-    out_path = out_dir / "베트남_법령_기본정보.csv"
-    df.to_csv(out_path, index=False, encoding='utf-8')
-    LOGGER.info(f"[info] 저장: {out_path} rows={len(df)}")
-    return out_path
-
+@timed("merge_relation")
 def merge_relation() -> Optional[Path]:
     """
     중앙/지방 '관계정보' 통합 → 베트남_법령_관계정보.csv
     중복 제거 없이 단순 병합
     """
-    srcs = [
-        Path("output/central_law/relation/merged_result.csv"),
-        Path("output/local_law/relation/merged_result.csv"),
-    ]
-    dfs = [read_if_exists(p) for p in srcs]
-    df = pd.concat([d for d in dfs if not d.empty], ignore_index=True) # 중복체크 하지 않음
+    out_path = OUTPUTS["relation"]
+    sources = open_sources("relation", SOURCES["relation"])
+    if sources_unchanged("relation", sources, out_path):
+        LOGGER.info(f"[relation] 변경 없음, 생략: {out_path}")
+        return out_path
+
+    dfs, marks = read_sources("relation", sources)
+    df = schema.concat(dfs, "relation") # 중복체크 하지 않음
+    del dfs  # 병합 전 조각은 바로 해제 (저장 중 최대 메모리)
     if df.empty:
         LOGGER.warning("[relation] 입력 데이터가 비었습니다.")
         return None
 
-    # 타입 통일
-    df = normalize_types(df, ["regionID", "itemID", "relation_itemID"])
-
     # id 재부여
     df = reassign_pk(df, "id")
+    return save_output(df, out_path, "relation", marks)
 
-    out_dir = ensure_dir(OUT_BASE / "relation")
-    out_path = out_dir / "베트남_법령_관계정보.csv"
-    df.to_csv(out_path, index=False, encoding='utf-8')
-    LOGGER.info(f"[relation] 저장: {out_path} rows={len(df)}")
-    return out_path
-
+@timed("merge_download_link")
 def merge_download_link() -> Optional[Path]:
     """
     중앙/지방 '다운로드링크' 통합 → 베트남_법령_파일링크.csv
     중복 키: regionID, itemID, 다운로드 링크
     """
-    srcs = [
-        Path("output/central_law/download_link/merged_result.csv"),
-        Path("output/local_law/download_link/merged_result.csv"),
-    ]
-    dfs = [read_if_exists(p) for p in srcs]
+    out_path = OUTPUTS["download_link"]
+    sources = open_sources("download_link", SOURCES["download_link"])
+    if sources_unchanged("download_link", sources, out_path):
+        LOGGER.info(f"[download_link] 변경 없음, 생략: {out_path}")
+        return out_path
 
     # 단순 병합 후 중복 제거
-    df = concat_and_drop_duplicates(dfs, subset=["regionID", "itemID", "다운로드 링크"])
+    dfs, marks = read_sources("download_link", sources)
+    df = concat_and_drop_duplicates(dfs, subset=["regionID", "itemID", "다운로드 링크"], table="download_link")
+    del dfs  # 병합 전 조각은 바로 해제 (저장 중 최대 메모리)
     if df.empty:
         LOGGER.warning("[download_link] 입력 데이터가 비었습니다.")
         return None
 
-    # 타입 통일
-    df = normalize_types(df, ["regionID", "itemID", "다운로드 링크"])
-
     # id 재부여
     df = reassign_pk(df, "id")
+    return save_output(df, out_path, "download_link", marks)
 
-    out_dir = ensure_dir(OUT_BASE / "download_link")
-    out_path = out_dir / "베트남_법령_파일링크.csv"
-    df.to_csv(out_path, index=False, encoding='utf-8')
-    LOGGER.info(f"[download_link] 저장: {out_path} rows={len(df)}")
-    return out_path
+def _source_stamp(path: Path) -> str:
+    """저장소 없는 입력의 식별자 - 파일(Parquet은 폴더) 크기/수정 시각 (저장은 항상 교체라 내용이 바뀌면 달라짐)"""
+    stamps = []
+    for p in (path, parquet_path(path)):
+        if p.exists():
+            st = p.stat()
+            stamps.append(f"{p.name}:{st.st_size}:{st.st_mtime_ns}")
+    return "file:" + ",".join(stamps)
 
+@timed("copy_directive")
 def copy_directive() -> Optional[Path]:
     """
     행정지시문서 기본정보를 이름만 바꿔 최종 위치로 복사 저장
+    변환이 없으므로 merged_result를 최신으로 맞춘 뒤 파싱 없이 하드링크(안 되면 파일 복사)
+    delta/인덱스용 프레임은 입력(저장소 버전 또는 파일)이 마지막 delta 이후 바뀌었을 때만 읽음 - 저장소에서 읽으면
+    merged_result 내보내기와 같은 프레임 사용
     """
-    src = Path("output/directive/info/merged_result.csv")
-    df = read_if_exists(src)
-    if df.empty:
+    from storage.delta import delta_source, write_delta
+    from search.fulltext import index_current, update_index
+
+    out_path = OUTPUTS["directive"]
+    sources = open_sources("directive", SOURCES["directive"])
+    if sources_unchanged("directive", sources, out_path):
+        LOGGER.info(f"[directive] 변경 없음, 생략: {out_path}")
+        return out_path
+
+    src, store = sources[0]
+    version, df = None, None
+    if store is not None:
+        version = store.version("directive")
+        if not store.is_exported("directive", src):
+            df = store.merged_frame("directive")
+            store.export("directive", src, df=df, version=version)
+    if not table_exists(src):
         LOGGER.warning("[directive] 입력 데이터가 비었습니다.")
         return None
-    out_dir = ensure_dir(OUT_BASE / "directive")
-    out_path = out_dir / "베트남_중앙정부_행정_지시_문서_기본정보.csv"
-    df.to_csv(out_path, index=False, encoding='utf-8')
-    LOGGER.info(f"[directive] 저장: {out_path} rows={len(df)}")
+
+    source = f"store:{version}" if store is not None else _source_stamp(src)
+    if df is None and (delta_source(out_path, "directive") != source or not index_current(out_path, "directive")):
+        df = read_if_exists(src, table="directive")
+    if not link_table(src, out_path):
+        # 요청한 출력 형식의 원본이 없음 (예: CSV만 있는데 Parquet 출력) → 읽어서 저장
+        if df is None:
+            df = read_if_exists(src, table="directive")
+        if df.empty:
+            LOGGER.warning("[directive] 입력 데이터가 비었습니다.")
+            return None
+        write_table(df, out_path, table="directive")
+    if df is not None:
+        write_delta(df, out_path, "directive", LOGGER, source=source)
+        update_index(df, out_path, "directive", LOGGER)
+    else:
+        LOGGER.info(f"[directive] 입력 변경 없음 ({source}), delta/인덱스 생략")
+    if store is not None:
+        store.mark_exported("directive", out_path, version)
+    LOGGER.info(f"[directive] 저장: {out_path}")
     return out_path
 
-def main():
+# 테이블 → 병합 함수 (서로 다른 파일만 읽고 쓰므로 동시 실행 가능)
+MERGE_STEPS = {
+    "info": merge_info,
+    "relation": merge_relation,
+    "download_link": merge_download_link,
+    "directive": copy_directive,
+}
+
+def _run_step(table: str) -> Optional[str]:
+    """병합 프로세스 작업 (spawn된 프로세스에서 로거/프로파일러 설정 후 실행)"""
+    setup_logging()
+    profile_util.configure(OUT_BASE / "log" / "profile", LOGGER)
+    try:
+        path = MERGE_STEPS[table]()
+    finally:
+        profile_util.flush()
+    return str(path) if path is not None else None
+
+def run_steps(workers: int = MERGE_WORKERS) -> Dict[str, Optional[Path]]:
+    """테이블별 병합 - 변경된 테이블이 둘 이상이면 프로세스 풀에서 동시에 (전체 시간 ≈ 가장 큰 테이블의 병합 시간)"""
+    from search.fulltext import ensure_index
+
+    paths = {}
+    for table in MERGE_STEPS:
+        if sources_unchanged(table, open_sources(table, SOURCES[table]), OUTPUTS[table]):
+            LOGGER.info(f"[{table}] 변경 없음, 생략: {OUTPUTS[table]}")
+            ensure_index(OUTPUTS[table], table, LOGGER)  # 인덱스 도입 전 출력
+            paths[table] = OUTPUTS[table]
+    pending = [t for t in MERGE_STEPS if t not in paths]
+
+    workers = min(workers, len(pending), os.cpu_count() or 1)
+    if workers <= 1:
+        # 프로세스 시작 비용이 병합보다 클 때 (변경 테이블 1개, 단일 CPU) - 실패 처리는 풀과 동일
+        for table in pending:
+            try:
+                paths[table] = MERGE_STEPS[table]()
+            except Exception as e:
+                LOGGER.error(f"[{table}] 병합 실패: {e}")
+                paths[table] = None
+        return {table: paths[table] for table in MERGE_STEPS}
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_MP) as pool:
+        futures = {table: pool.submit(_run_step, table) for table in pending}
+        for table, future in futures.items():
+            try:
+                path = future.result()
+                paths[table] = Path(path) if path else None
+            except Exception as e:
+                LOGGER.error(f"[{table}] 병합 실패: {e}")
+                paths[table] = None
+    return {table: paths[table] for table in MERGE_STEPS}
+
+def main(workers: int = MERGE_WORKERS):
+    setup_logging()
     ensure_dir(OUT_BASE / "log")
+    profile_util.configure(OUT_BASE / "log" / "profile", LOGGER)
     LOGGER.info("=== 법령/행정지시 최종 통합 시작 ===")
-    paths = {
-        "베트남_법령_기본정보": merge_info(),
-        "베트남_법령_관계정보": merge_relation(),
-        "베트남_법령_파일링크": merge_download_link(),
-        "베트남_중앙정부_행정_지시_문서_기본정보": copy_directive(),
-    }
-    ok = [k for k, v in paths.items() if v is not None]
-    miss = [k for k, v in paths.items() if v is None]
+    paths = run_steps(workers)
+    if paths["relation"] and paths["info"]:
+        from search.graph import update_graph
+
+        update_graph(paths["relation"], paths["info"], LOGGER)  # 관계 그래프 (relation/info 둘 다 필요)
+    ok = [OUTPUTS[t].stem for t, v in paths.items() if v is not None]
+    miss = [OUTPUTS[t].stem for t, v in paths.items() if v is None]
     LOGGER.info(f"[요약] 생성 완료: {ok} | 미생성: {miss}")
+    profile_util.flush()
     print("[merge_law_tables] done")
 
 if __name__ == "__main__":
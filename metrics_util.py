@@ -0,0 +1,318 @@
+### metrics_util.py ###
+# 단계별 소요시간/카운터/게이지 계측 - Prometheus textfile(node_exporter textfile collector) + 실행별 JSON 요약
+#
+#   from metrics_util import METRICS, timed
+#   @timed("go_to_law_list")                  → vietscrap_stage_seconds{stage="go_to_law_list"} 히스토그램
+#   METRICS.inc("docs_total", result="ok")    → vietscrap_docs_total{result="ok"} 카운터
+#   METRICS.set_gauge("queue_depth", 12)      → vietscrap_queue_depth 게이지
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, ExitStack
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from log_util import KST
+
+METRIC_PREFIX = "vietscrap_"
+METRICS_DIR = "output/log/metrics"
+EXPORT_INTERVAL = 30  # textfile 갱신 주기(초)
+# 요소 대기(수십 ms)부터 safe_extract 재시도 대기(30분)까지
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 1800)
+
+# 단계 진입/종료 시 함께 실행할 훅 - stage 이름을 받아 context manager를 돌려주는 함수 (예: profile_util)
+STAGE_HOOKS = []
+
+_HELP = {
+    "stage_seconds": "단계별 소요시간",
+    "docs_total": "상세 문서 처리 결과",
+    "pages_total": "목록 페이지 처리 결과",
+    "extract_attempts_total": "safe_extract 시도 결과",
+    "retry_sleep_seconds_total": "재시도 대기 누적 시간",
+    "throttle_wait_seconds": "속도 제한 토큰 대기 시간",
+    "queue_depth": "상세 수집 대기 항목 수",
+    "active_drivers": "실행 중인 브라우저 드라이버 수",
+    "aimd_level": "AIMD 동시성 수준",
+    "chrome_rss_bytes": "Chrome/chromedriver 자식 프로세스 RSS 합계",
+}
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels, extra=()) -> str:
+    items = list(labels) + list(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 형식)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수"""
+        if not self.count:
+            return 0.0
+        target, seen = q * self.count, 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """프로세스 내 계측 레지스트리 (스레드 안전)"""
+
+    def __init__(self, const_labels: dict = None):
+        self.const_labels = dict(const_labels or {})
+        self._counters = {}
+        self._gauges = {}
+        self._gauge_fns = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0) + delta
+
+    def gauge_fn(self, name: str, fn, **labels):
+        """내보낼 때마다 fn()으로 값을 계산하는 게이지 (None이면 생략)"""
+        with self._lock:
+            self._gauge_fns[_key(name, labels)] = fn
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, stage: str, **labels):
+        """with 블록 소요시간을 stage_seconds{stage=...}에 기록 (등록된 단계 훅도 함께 실행)"""
+        with ExitStack() as hooks:
+            for hook in STAGE_HOOKS:
+                hooks.enter_context(hook(stage))
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.observe("stage_seconds", time.perf_counter() - started, stage=stage, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._gauge_fns.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    def _gauge_values(self) -> dict:
+        with self._lock:
+            gauges = dict(self._gauges)
+            fns = dict(self._gauge_fns)
+        for key, fn in fns.items():
+            try:
+                value = fn()
+            except Exception:
+                value = None
+            if value is not None:
+                gauges[key] = value
+        return gauges
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        const = tuple(sorted(self.const_labels.items()))
+        gauges = self._gauge_values()
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: (h.buckets, list(h.counts), h.count, h.sum) for k, h in self._histograms.items()}
+
+        lines = []
+        def header(name, kind):
+            lines.append(f"# HELP {METRIC_PREFIX}{name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {METRIC_PREFIX}{name} {kind}")
+
+        for kind, series in (("counter", counters), ("gauge", gauges)):
+            for name in sorted({k[0] for k in series}):
+                header(name, kind)
+                for (n, labels), value in sorted(series.items()):
+                    if n == name:
+                        lines.append(f"{METRIC_PREFIX}{name}{_fmt_labels(const + labels)} {value:g}")
+
+        for name in sorted({k[0] for k in histograms}):
+            header(name, "histogram")
+            for (n, labels), (buckets, counts, count, total) in sorted(histograms.items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, c in zip(buckets, counts):
+                    cumulative += c
+                    lines.append(f"{METRIC_PREFIX}{name}_bucket{_fmt_labels(const + labels, [('le', f'{bound:g}')])} {cumulative}")
+                lines.append(f"{METRIC_PREFIX}{name}_bucket{_fmt_labels(const + labels, [('le', '+Inf')])} {count}")
+                lines.append(f"{METRIC_PREFIX}{name}_sum{_fmt_labels(const + labels)} {total:.6f}")
+                lines.append(f"{METRIC_PREFIX}{name}_count{_fmt_labels(const + labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        """실행 요약 - 단계는 누적 시간 순(핫 패스 우선)"""
+        gauges = self._gauge_values()
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: h for k, h in self._histograms.items()}
+            stages = []
+            for (name, labels), h in histograms.items():
+                if name != "stage_seconds" or not h.count:
+                    continue
+                stages.append({"stage": ",".join(str(v) for _, v in labels), "count": h.count,
+                               "total_s": round(h.sum, 3), "mean_s": round(h.sum / h.count, 3),
+                               "p50_s": round(h.quantile(0.5), 3), "p95_s": round(h.quantile(0.95), 3),
+                               "max_s": round(h.max, 3)})
+            others = {f"{name}{_fmt_labels(labels)}": {"count": h.count, "sum": round(h.sum, 3), "max": round(h.max, 3)}
+                      for (name, labels), h in histograms.items() if name != "stage_seconds"}
+
+        # 실행 시간 대비 비율 (단계가 중첩되고 워커가 병렬이므로 합계는 1을 넘을 수 있음)
+        elapsed = max(time.time() - self.started, 1e-9)
+        for s in stages:
+            s["share"] = round(s["total_s"] / elapsed, 3)
+        return {
+            "labels": self.const_labels,
+            "started": datetime.fromtimestamp(self.started, tz=KST).isoformat(),
+            "elapsed_s": round(elapsed, 1),
+            "stages": sorted(stages, key=lambda s: s["total_s"], reverse=True),
+            "histograms": others,
+            "counters": {f"{n}{_fmt_labels(l)}": v for (n, l), v in sorted(counters.items())},
+            "gauges": {f"{n}{_fmt_labels(l)}": v for (n, l), v in sorted(gauges.items())},
+        }
+
+
+# 프로세스 전역 레지스트리 (파이프라인은 프로세스별로 분리되므로 프로세스당 하나)
+METRICS = Metrics()
+
+
+def timed(stage: str):
+    """메서드/함수 소요시간을 stage_seconds{stage=...}에 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with METRICS.timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def chrome_rss_bytes():
+    """현재 프로세스의 자식(chromedriver, Chrome) RSS 합계 - psutil 미설치 시 None"""
+    if psutil is None:
+        return None
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class MetricsExporter:
+    """주기적으로 textfile(.prom)을 갱신하고 종료 시 JSON 요약을 남기는 백그라운드 스레드"""
+
+    def __init__(self, name: str, metrics: Metrics = METRICS, metrics_dir: str = METRICS_DIR,
+                 interval: float = EXPORT_INTERVAL, logger=None):
+        self.name = name
+        self.metrics = metrics
+        self.interval = interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.textfile = Path(metrics_dir) / f"{name}.prom"
+        self.summary_path = Path(metrics_dir) / f"{name}_{datetime.now(KST).strftime('%Y%m%d%H%M')}.json"
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "MetricsExporter":
+        self.metrics.const_labels.setdefault("pipeline", self.name)
+        self.metrics.gauge_fn("chrome_rss_bytes", chrome_rss_bytes)
+        self._thread = threading.Thread(target=self._loop, name=f"metrics-{self.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        try:
+            _atomic_write(self.textfile, self.metrics.render())
+        except Exception as e:
+            self.logger.warning(f"[metrics] textfile 저장 실패: {self.textfile} | {e}")
+
+    def stop(self) -> dict:
+        """마지막 textfile 갱신 + JSON 요약 저장 → 요약 반환"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+        summary = self.metrics.summary()
+        try:
+            _atomic_write(self.summary_path, json.dumps(summary, ensure_ascii=False, indent=2))
+            hot = ", ".join(f"{s['stage']} {s['share']:.0%}" for s in summary["stages"][:3])
+            self.logger.info(f"[metrics] 요약 저장: {self.summary_path} (상위 단계: {hot or '-'})")
+        except Exception as e:
+            self.logger.warning(f"[metrics] 요약 저장 실패: {self.summary_path} | {e}")
+        return summary
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,123 @@
+### pipeline_runner.py ###
+# 중앙/지방/행정지시 파이프라인을 별도 프로세스로 실행 (파이프라인별 드라이버, 오류 격리)
+
+import multiprocessing as mp
+import time
+import traceback
+
+from log_util import setup_logger
+from metrics_util import MetricsExporter
+import profile_util
+
+# Chrome 드라이버를 포함한 상태가 자식에 복제되지 않도록 spawn 사용
+_MP = mp.get_context("spawn")
+
+
+# ----- 파이프라인 (자식 프로세스에서 실행되므로 모듈 최상위 함수) -----
+# defer_export=True: 파이프라인 종료 후 최종 병합(merge_law_tables)이 이어질 때 - merged_result는 병합 단계에서 1번만 저장
+def _deferred(scraper, defer_export):
+    scraper.defer_export = defer_export
+    return scraper
+
+
+def _fresh(scraper, fresh):
+    # 이전 수집의 frontier 기록(완료한 목록 페이지/URL)을 지우고 처음부터
+    if fresh:
+        scraper.frontier.reset()
+    return scraper
+
+
+def crawl_law(mode, defer_export=False, fresh=False, **kwargs):
+    """법령 전체 수집 (fresh=True면 frontier 초기화 후 처음부터)"""
+    from scraper import make_law_scraper
+    _fresh(_deferred(make_law_scraper(mode, **kwargs), defer_export), fresh).run()
+
+
+def crawl_directive(defer_export=False, fresh=False, **kwargs):
+    """행정지시문서 전체 수집 (fresh=True면 frontier 초기화 후 처음부터)"""
+    from scraper.directive_scraper import DirectiveScraper
+    _fresh(_deferred(DirectiveScraper(**kwargs), defer_export), fresh).run()
+
+
+def update_law(mode, update_pages=20, revalidate=None, defer_export=False, **kwargs):
+    """법령 업데이트 (update_pages=0이면 실패 URL 재시도만, revalidate: 재검증할 기존 문서 수)"""
+    from scraper import make_law_scraper
+    from update import make_law_updater, REVALIDATE_BUDGET
+    scraper = _deferred(make_law_scraper(mode, **kwargs), defer_export)
+    make_law_updater(mode, scraper, update_pages=update_pages,
+                     revalidate=REVALIDATE_BUDGET if revalidate is None else revalidate).run()
+
+
+def update_directive(update_pages=20, revalidate=None, defer_export=False, **kwargs):
+    """행정지시문서 업데이트 (update_pages=0이면 실패 URL 재시도만, revalidate: 재검증할 기존 문서 수)"""
+    from scraper.directive_scraper import DirectiveScraper
+    from update import REVALIDATE_BUDGET
+    from update.directive_updater import DirectiveUpdater
+    DirectiveUpdater(_deferred(DirectiveScraper(**kwargs), defer_export), update_pages=update_pages,
+                     revalidate=REVALIDATE_BUDGET if revalidate is None else revalidate).run()
+
+
+def defer_exports(jobs) -> list:
+    """최종 병합이 이어지는 실행용 - 모든 파이프라인의 merged_result 내보내기를 병합 단계로 미룸"""
+    return [(name, func, dict(kwargs, defer_export=True)) for name, func, kwargs in jobs]
+
+
+def _child(name, func, kwargs, deadline):
+    """자식 프로세스 진입점 - 예외는 로그로 남기고 종료 코드로 실패 전달
+
+    실행 중에는 output/log/metrics/{name}.prom을 주기적으로 갱신하고, 종료 시 실행별 JSON 요약을 남깁니다.
+    """
+    logger = setup_logger(f"pipeline.{name}", f"output/log/pipeline_{name}.log")
+    exporter = MetricsExporter(name, logger=logger).start()
+    try:
+        if deadline is not None:
+            from scraper.time_budget import TimeBudget
+            kwargs = dict(kwargs, budget=TimeBudget(max(0.0, deadline - time.time()), logger=logger,
+                                                    stats_path=f"output/log/throughput_{name}.json"))
+        func(**kwargs)
+        if deadline is not None:
+            kwargs["budget"].save()
+    except BaseException as e:
+        logger.error(f"[{name}] 파이프라인 실패: {e}\n{traceback.format_exc()}")
+        raise SystemExit(1)
+    finally:
+        exporter.stop()
+        profile_util.flush()  # spawn 자식은 atexit이 실행되지 않으므로 직접 저장
+
+
+def run_pipelines(jobs, parallel=True, deadline=None, logger=None) -> dict:
+    """(이름, 함수, kwargs) 목록을 프로세스별로 실행, 이름별 성공 여부 반환
+
+    parallel=False면 목록 순서대로 하나씩 실행합니다. 한 파이프라인이 실패(예외, 드라이버 크래시)해도
+    나머지는 계속 실행됩니다. deadline(epoch 초)을 주면 각 파이프라인이 그 시각까지의 TimeBudget을 사용합니다.
+    """
+    logger = logger or setup_logger("pipeline_runner", "output/log/pipeline_runner.log")
+    results = {}
+    started = time.monotonic()
+
+    def start(name, func, kwargs):
+        proc = _MP.Process(target=_child, args=(name, func, kwargs, deadline), name=f"pipeline-{name}")
+        proc.start()
+        logger.info(f"[pipeline] {name} 시작 (pid={proc.pid})")
+        return proc
+
+    def finish(name, proc, t0):
+        proc.join()
+        results[name] = proc.exitcode == 0
+        status = "완료" if results[name] else f"실패 (exitcode={proc.exitcode})"
+        logger.info(f"[pipeline] {name} {status}, {time.monotonic() - t0:.0f}s")
+
+    if parallel:
+        running = [(name, start(name, func, kwargs), time.monotonic()) for name, func, kwargs in jobs]
+        for name, proc, t0 in running:
+            finish(name, proc, t0)
+    else:
+        for name, func, kwargs in jobs:
+            if deadline is not None and time.time() >= deadline:
+                logger.warning(f"[budget] 시간 예산 소진, {name} 이후 수집은 다음 실행으로")
+                break
+            finish(name, start(name, func, kwargs), time.monotonic())
+
+    failed = [name for name, ok in results.items() if not ok]
+    logger.info(f"[pipeline] 전체 {time.monotonic() - started:.0f}s, 실패: {failed or '없음'}")
+    return results
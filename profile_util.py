@@ -0,0 +1,232 @@
+### profile_util.py ###
+# 단계별 프로파일링 훅 (선택 사용) - 코드 수정 없이 환경변수/CLI 옵션으로 켭니다.
+#   VIETSCRAP_PROFILE=sample|cprofile           프로파일러 종류 (미지정 시 비활성)
+#   VIETSCRAP_PROFILE_STAGES=extract_law_details,merge_info   대상 단계 (기본: 전체)
+#   VIETSCRAP_PROFILE_PAGES=5                    처음 N개 목록 페이지까지만 프로파일링 (기본: 제한 없음)
+#   python -m vietscrap crawl --profile sample --profile-pages 5
+#
+# 단계는 metrics_util의 @timed / METRICS.timer 구간과 같습니다.
+# 결과는 output/{...}/log/profile/ 에 저장됩니다.
+#   sample   → {stage}.collapsed  (flamegraph.pl, speedscope 입력 - 대기 중인 스택도 포함)
+#   cprofile → {stage}.prof (pstats/snakeviz), {stage}.txt (누적 시간 상위 함수)
+
+import atexit
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+import metrics_util
+
+ENV_MODE = "VIETSCRAP_PROFILE"
+ENV_STAGES = "VIETSCRAP_PROFILE_STAGES"
+ENV_PAGES = "VIETSCRAP_PROFILE_PAGES"
+ENV_INTERVAL = "VIETSCRAP_PROFILE_INTERVAL"
+MODES = ("sample", "cprofile")
+SAMPLE_INTERVAL = 0.01  # 샘플링 간격(초)
+PAGE_STAGE = "process_page"  # 페이지 수 집계 기준 단계
+TOP_FUNCTIONS = 60
+
+
+class StageProfiler:
+    """선택한 단계 구간만 프로파일링 (스레드별, 바깥 단계 기준)"""
+
+    def __init__(self, mode: str, profile_dir, stages=None, max_pages=None,
+                 interval=SAMPLE_INTERVAL, logger=None):
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 프로파일러: {mode} (선택: {', '.join(MODES)})")
+        self.mode = mode
+        self.profile_dir = Path(profile_dir)
+        self.stages = set(stages) if stages else None
+        self.max_pages = max_pages
+        self.interval = interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.active = True
+        self.pages = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads = {}       # 스레드 id → 현재 프로파일링 중인 단계 (sample)
+        self._samples = {}       # 단계 → Counter(collapsed stack)
+        self._profiles = {}      # 단계 → [cProfile.Profile] (스레드별)
+        self._sampler = None
+        self._stop = threading.Event()
+        if mode == "sample":
+            self._sampler = threading.Thread(target=self._sample_loop, name="stage-sampler", daemon=True)
+            self._sampler.start()
+
+    def selected(self, stage: str) -> bool:
+        return self.stages is None or stage in self.stages
+
+    @contextmanager
+    def stage(self, stage: str):
+        """단계 구간 훅 (metrics_util.STAGE_HOOKS에 등록)"""
+        depth = getattr(self._local, "depth", 0)
+        track = self.active and depth == 0 and self.selected(stage)
+        if not track:
+            # 중첩 단계는 바깥 단계 프로파일에 포함
+            self._local.depth = depth + (1 if depth and self.selected(stage) else 0)
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+                self._count_page(stage)
+            return
+
+        self._local.depth = 1
+        profile = self._begin(stage)
+        try:
+            yield
+        finally:
+            self._end(stage, profile)
+            self._local.depth = 0
+            self._count_page(stage)
+
+    def _begin(self, stage: str):
+        if self.mode == "sample":
+            with self._lock:
+                self._threads[threading.get_ident()] = stage
+            return None
+        profile = getattr(self._local, "profiles", {}).get(stage)
+        if profile is None:
+            profile = cProfile.Profile()
+            self._local.profiles = {**getattr(self._local, "profiles", {}), stage: profile}
+            with self._lock:
+                self._profiles.setdefault(stage, []).append(profile)
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 프로파일러가 이미 동작 중인 스레드 (Python 3.12+)
+            return None
+        return profile
+
+    def _end(self, stage: str, profile):
+        if self.mode == "sample":
+            with self._lock:
+                self._threads.pop(threading.get_ident(), None)
+        elif profile is not None:
+            profile.disable()
+
+    def _count_page(self, stage: str):
+        if stage != PAGE_STAGE or not self.max_pages:
+            return
+        with self._lock:
+            self.pages += 1
+            done = self.active and self.pages >= self.max_pages
+            if done:
+                self.active = False
+        if done:
+            self.logger.info(f"[profile] 처음 {self.max_pages}개 페이지 프로파일링 완료, 이후 비활성")
+            self.close()
+
+    # ----- 샘플링 -----
+    def _sample_loop(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                targets = dict(self._threads)
+            if not targets:
+                continue
+            frames = sys._current_frames()
+            for tid, stage in targets.items():
+                frame = frames.get(tid)
+                if frame is None or tid == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name})")
+                    frame = frame.f_back
+                key = ";".join([stage] + stack[::-1])
+                with self._lock:
+                    self._samples.setdefault(stage, Counter())[key] += 1
+
+    # ----- 저장 -----
+    def flush(self):
+        """현재까지의 단계별 프로파일 저장 (여러 번 호출 가능, 누적 결과로 덮어씀)"""
+        with self._lock:
+            samples = {stage: Counter(c) for stage, c in self._samples.items()}
+            profiles = {stage: list(p) for stage, p in self._profiles.items()}
+        if not samples and not profiles:
+            return
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+        for stage, counter in samples.items():
+            path = self.profile_dir / f"{stage}.collapsed"
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in counter.most_common():
+                    f.write(f"{stack} {count}\n")
+
+        for stage, items in profiles.items():
+            stats = None
+            for profile in items:
+                try:
+                    stats = pstats.Stats(profile) if stats is None else stats.add(profile)
+                except TypeError:
+                    continue  # 아직 한 번도 수집되지 않은 프로파일
+            if stats is None:
+                continue
+            stats.dump_stats(str(self.profile_dir / f"{stage}.prof"))
+            out = io.StringIO()
+            stats.stream = out
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            (self.profile_dir / f"{stage}.txt").write_text(out.getvalue(), encoding="utf-8")
+
+        self.logger.info(f"[profile] 저장: {self.profile_dir} ({', '.join(sorted(set(samples) | set(profiles)))})")
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+
+
+_PROFILER = None
+_INSTALL_LOCK = threading.Lock()
+
+
+def _env_list(name: str):
+    value = os.environ.get(name, "").strip()
+    if not value or value == "all":
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def configure(profile_dir, logger=None):
+    """환경변수로 프로파일링이 켜져 있으면 프로파일러를 설치 (프로세스당 1회, 이후 호출은 무시)"""
+    global _PROFILER
+    mode = os.environ.get(ENV_MODE, "").strip().lower()
+    if not mode or mode in ("0", "off", "none"):
+        return None
+    with _INSTALL_LOCK:
+        if _PROFILER is not None:
+            return _PROFILER
+        pages = os.environ.get(ENV_PAGES, "").strip()
+        interval = os.environ.get(ENV_INTERVAL, "").strip()
+        _PROFILER = StageProfiler(mode, profile_dir, stages=_env_list(ENV_STAGES),
+                                  max_pages=int(pages) if pages else None,
+                                  interval=float(interval) if interval else SAMPLE_INTERVAL, logger=logger)
+        metrics_util.STAGE_HOOKS.append(_PROFILER.stage)
+        atexit.register(flush)
+        _PROFILER.logger.info(f"[profile] {mode} 프로파일링 시작 → {profile_dir} "
+                              f"(단계: {os.environ.get(ENV_STAGES) or '전체'}, 페이지: {pages or '제한 없음'})")
+        return _PROFILER
+
+
+def flush():
+    """설치된 프로파일러 결과 저장 (없으면 무시)"""
+    if _PROFILER is not None:
+        _PROFILER.flush()
+
+
+def set_env(mode=None, stages=None, pages=None):
+    """CLI 옵션 → 환경변수 (spawn된 파이프라인 프로세스에도 전달됨)"""
+    if mode:
+        os.environ[ENV_MODE] = mode
+    if stages:
+        os.environ[ENV_STAGES] = ",".join(stages)
+    if pages:
+        os.environ[ENV_PAGES] = str(pages)
@@ -1,21 +1,77 @@
 ### scrap_manager.py ###
-# 모든 스크래퍼의 실행을 담당하는 파일 (팩토리 함수 사용)
-from scraper import make_law_scraper
-from scraper.directive_scraper import DirectiveScraper
-from merge_law_tables import main as merge_main
+# 모든 스크래퍼의 실행을 담당하는 파일 (파이프라인별 프로세스로 실행)
+import argparse
+import time
+from log_util import setup_logger
+from scraper.sharding import parse_shard, merge_shards
+from scraper.time_budget import parse_duration
+from pipeline_runner import run_pipelines, crawl_law, crawl_directive, defer_exports
+
+PIPELINES = ("central", "local", "directive")
+
+
+def parse_priority(text: str) -> list:
+    """'local,central' 형식 → 수집 순서 (지정하지 않은 파이프라인은 기본 순서로 뒤에 추가)"""
+    names = [n.strip() for n in text.split(",") if n.strip()]
+    unknown = [n for n in names if n not in PIPELINES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"알 수 없는 파이프라인: {unknown} (선택: {', '.join(PIPELINES)})")
+    return list(dict.fromkeys(names + list(PIPELINES)))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="법령/행정지시문서 전체 수집")
+    parser.add_argument("command", nargs="?", default="crawl", choices=["crawl", "merge-shards"],
+                        help="crawl: 수집 실행, merge-shards: 샤드 결과를 표준 폴더로 병합")
+    parser.add_argument("--shard", type=parse_shard, default=None,
+                        help="다중 노드 분할 실행 시 담당 샤드 (예: 1/4)")
+    parser.add_argument("--counts", default=None,
+                        help="샤드 분할 기준 문서 수 스냅샷(JSON) - 모든 노드에 같은 파일 사용")
+    parser.add_argument("--region-workers", type=int, default=1,
+                        help="지방 법령 수집 시 지역/페이지 범위 작업을 병렬 처리할 브라우저 수")
+    parser.add_argument("--time-budget", type=parse_duration, default=None,
+                        help="실행 시간 예산 (예: 8h, 90m) - 마감 전에 저장 후 중단, 다음 실행에서 이어서 수집")
+    parser.add_argument("--priority", type=parse_priority, default=list(PIPELINES),
+                        help="--sequential 실행 시 수집 순서 (예: local,central,directive)")
+    parser.add_argument("--sequential", action="store_true",
+                        help="파이프라인을 동시에 실행하지 않고 순서대로 실행")
+    parser.add_argument("--fresh", action="store_true",
+                        help="이전 수집 기록(output/*/log/frontier.sqlite)을 지우고 처음부터 수집 (기본: 이어서 수집)")
+    return parser.parse_args()
+
+
+def crawl_jobs(args) -> list:
+    """(이름, 함수, kwargs) 파이프라인 목록"""
+    law_kwargs = {"shard": args.shard, "counts_path": args.counts, "fresh": args.fresh}
+    jobs = {
+        "central": (crawl_law, dict(law_kwargs, mode="central")),
+        "local": (crawl_law, dict(law_kwargs, mode="local", region_workers=args.region_workers)),
+    }
+    # 행정지시문서 수집 (샤드 실행 시 1번 샤드만 담당)
+    if args.shard is None or args.shard[0] == 1:
+        jobs["directive"] = (crawl_directive, {"fresh": args.fresh})
+    return [(name, *jobs[name]) for name in args.priority if name in jobs]
+
 
 if __name__ == "__main__":
-    # 중앙정부 법령정보 수집
-    central_scraper = make_law_scraper("central")
-    central_scraper.run()
+    args = parse_args()
 
-    # 지방정부 법령정보 수집
-    local_scraper = make_law_scraper("local")
-    local_scraper.run()
+    if args.command == "merge-shards":
+        # 각 노드의 샤드 출력(output/{mode}_law/shards/*)을 모은 뒤 실행
+        merge_shards("central")
+        merge_shards("local")
+        from merge_law_tables import main as merge_main
+        merge_main()
+    else:
+        logger = setup_logger("scrap_manager", "output/log/scrap_manager.log")
+        deadline = time.time() + args.time_budget if args.time_budget else None
 
-    # 행정지시문서 수집
-    directive_scraper = DirectiveScraper()
-    directive_scraper.run()
+        # 중앙/지방(vbpl.vn)과 행정지시(chinhphu.vn)를 프로세스별로 동시에 수집
+        # 병합이 이어지면 merged_result도 병합 단계에서 law_combined와 함께 1번만 저장
+        jobs = crawl_jobs(args) if args.shard else defer_exports(crawl_jobs(args))
+        run_pipelines(jobs, parallel=not args.sequential, deadline=deadline, logger=logger)
 
-    # 스크래핑 후 전체 병합
-    merge_main()
\ No newline at end of file
+        # 모든 파이프라인 종료 후 전체 병합 (샤드 실행 시 merge-shards 단계에서 병합)
+        if args.shard is None:
+            from merge_law_tables import main as merge_main
+            merge_main()
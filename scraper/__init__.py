@@ -1,18 +1,31 @@
 # scraper/__init__.py
 from typing import Literal
 from log_util import setup_logger
+from scraper.concurrency import DEFAULT_MAX_WORKERS
+from scraper.sharding import parse_shard, shard_output_dir
 
 def make_law_scraper(mode: Literal["central", "local"], **kwargs) -> "LawScraper":
     """법령 스크래퍼 팩토리 함수"""
     from scraper.law_scraper import LawScraper
     
-    # 모드별 로거 설정
+    # 옵션 추출
+    use_undetected = kwargs.get('use_undetected', False)
+    max_workers = kwargs.get('max_workers', DEFAULT_MAX_WORKERS)
+    shard = kwargs.get('shard')  # (i, N) 또는 "i/N"
+    if isinstance(shard, str):
+        shard = parse_shard(shard)
+    
+    # 모드별 로거 설정 (샤드 실행 시 샤드 폴더에 기록)
+    output_dir = shard_output_dir(mode, shard) if shard else f"output/{mode}_law"
     logger = setup_logger(
         f"{mode}_law_scraper", 
-        f"output/{mode}_law/log/{mode}_law_scrapper.log"
+        f"{output_dir}/log/{mode}_law_scrapper.log"
     )
     
-    # 옵션 추출
-    use_undetected = kwargs.get('use_undetected', False)
+    # 수집 범위/성능 옵션 (지정하지 않으면 LawScraper 기본값)
+    options = {k: kwargs[k] for k in ('docs_per_page', 'chunk_size', 'regions', 'page_range', 'base_url')
+               if kwargs.get(k) is not None}
     
-    return LawScraper(mode=mode, logger=logger, use_undetected=use_undetected)
\ No newline at end of file
+    return LawScraper(mode=mode, logger=logger, use_undetected=use_undetected, max_workers=max_workers,
+                      rate_limiter=kwargs.get('rate_limiter'), shard=shard, counts_path=kwargs.get('counts_path'),
+                      region_workers=kwargs.get('region_workers', 1), budget=kwargs.get('budget'), **options)
\ No newline at end of file
@@ -1,50 +1,111 @@
 ### scraper/base_scraper_core.py ###
 # 드라이버 초기화, 페이지 이동, 병합 등의 공통기능을 다룹니다.
 
-import pandas as pd
+# selenium/undetected_chromedriver/pandas는 무거우므로 실제 사용 시점에 임포트합니다.
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from datetime import datetime, timedelta, timezone
-from urllib.parse import urlparse, parse_qs, urljoin
-import re
+import threading
 import time
 from pathlib import Path
-from math import ceil
 import logging
-import undetected_chromedriver as uc
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from scraper.rate_limiter import RateLimiter, host_of
+from scraper import concurrency
+from scraper.concurrency import AIMDController, AdaptivePool
+from scraper.wait_policy import WaitPolicy, page_ready
+from scraper.frontier import Frontier
+from storage import DocStore, STORE_NAME
+from metrics_util import METRICS
+import profile_util
 
-# 한국시간 정의(UTC+9)
-KST = timezone(timedelta(hours=9))
+# 차단/CAPTCHA 페이지 판별용 문구
+BLOCK_MARKERS = ("captcha", "access denied", "request rejected", "403 forbidden", "too many requests")
 
 class BaseScraper:
     """공통 스크래퍼 베이스 클래스 - 드라이버 초기화, 병합, 재시도 로직 등"""
+
+    # 상세 수집 시 자신의 드라이버도 워커로 사용할지 여부
+    details_on_primary = False
+    # 출력 하위 폴더 → 저장소 테이블
+    store_tables = {"info": "info", "relation": "relation", "download_link": "download_link"}
+    # True면 merge_excel은 저장소 반영만 - merged_result는 최종 병합(merge_law_tables)에서 law_combined와 함께 저장
+    defer_export = False
     
     def __init__(self, base_url, start_url, output_dir, wait_time, docs_per_page, 
-                 logger=None, use_undetected=False):
+                 logger=None, use_undetected=False, rate_limiter=None, max_workers=1, budget=None):
         self.base_url = base_url
         self.start_url = start_url
         self.docs_per_page = docs_per_page
         self.output_dir = output_dir
         self.wait_time = wait_time
         self.use_undetected = use_undetected
-        self.driver, self.wait = self._init_driver()
+        self.host = host_of(base_url)
+        self.rate_limiter = rate_limiter or RateLimiter.shared()
+        # 드라이버는 첫 사용 시 생성 (병합/재시도 대상 없음 등 브라우저가 필요 없는 실행은 Chrome을 띄우지 않음)
+        self._driver = None
+        self._wait = None
+        self._driver_lock = threading.Lock()
+        self._store = None
         self.logger = logger or logging.getLogger(__name__)
+        self.waits = WaitPolicy(default_timeout=wait_time, min_timeout=wait_time, logger=self.logger,
+                                stats_path=Path(output_dir) / "log" / "wait_stats.json")
+        self.frontier = Frontier(Path(output_dir) / "log" / "frontier.sqlite", logger=self.logger)
         self.failed_urls = []
+        self.budget = budget  # TimeBudget - 지정 시 마감 전에 수집 중단
+        self.max_workers = max_workers
+        self.concurrency = AIMDController(max_level=max_workers, logger=self.logger)
+        self.pool = AdaptivePool(self.concurrency, self._make_worker, self.logger,
+                                 primary=self if self.details_on_primary else None)
         os.makedirs(output_dir, exist_ok=True)
+        # VIETSCRAP_PROFILE 지정 시 단계별 프로파일링 (프로세스당 처음 생성된 스크래퍼의 출력 폴더 사용)
+        profile_util.configure(Path(output_dir) / "log" / "profile", self.logger)
+
+    @property
+    def driver(self):
+        """WebDriver (첫 접근 시 생성)"""
+        if self._driver is None:
+            with self._driver_lock:
+                if self._driver is None:
+                    with METRICS.timer("driver_start"):
+                        self._driver, self._wait = self._init_driver()
+                    METRICS.add_gauge("active_drivers", 1)
+        return self._driver
+
+    @property
+    def store(self) -> DocStore:
+        """출력 폴더의 문서 저장소 ({output_dir}/store.sqlite, 첫 접근 시 열림)"""
+        path = Path(self.output_dir) / STORE_NAME
+        if self._store is None or self._store.path != path:
+            self._store = DocStore(path, logger=self.logger)
+        return self._store
+
+    @property
+    def wait(self):
+        self.driver
+        return self._wait
+
+    @property
+    def has_driver(self) -> bool:
+        return self._driver is not None
+
+    def reset_session(self):
+        """이미 실행 중인 드라이버가 있으면 쿠키 삭제 (새 드라이버는 그대로 사용)"""
+        if self.has_driver:
+            self._driver.delete_all_cookies()
 
     def _init_driver(self):
         """드라이버 초기화 - 공통 옵션 적용"""
+        from selenium.webdriver.support.ui import WebDriverWait
+
         if self.use_undetected:
+            import undetected_chromedriver as uc
             options = uc.ChromeOptions()
             options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_argument("--disable-gpu")
             options.add_argument("--no-sandbox")
             driver = uc.Chrome(options=options)
         else:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
             options = Options()
             options.add_argument("--disable-gpu")
             options.add_argument("--no-sandbox")
@@ -53,98 +114,82 @@ class BaseScraper:
         wait = WebDriverWait(driver, self.wait_time)
         return driver, wait
 
-    def merge_excel(self, subfolder: str, subset_keys: list[str]):
-        """엑셀 파일 병합 - 법령용 정보량 점수 로직 포함"""
-        input_dir = Path(self.output_dir) / subfolder
-        files = [f for f in input_dir.glob("*.csv")
-                if f.name not in {"merged_result.csv", "updated_result.csv"}]
-        if not files:
-            self.logger.info(f"[merge_excel] 대상 파일 없음: {input_dir}")
-            return
-
-        dfs = []
-        for f in files:
-            try:
-                if f.stat().st_size > 0:
-                    dfs.append(pd.read_csv(f))
-            except Exception as e:
-                self.logger.warning(f"[merge_excel] 읽기 실패: {f} | {e}")
-        if not dfs:
-            self.logger.info(f"[merge_excel] 읽을 수 있는 엑셀 없음: {input_dir}")
-            return
+    def _make_worker(self):
+        """상세 수집용 워커 스크래퍼 생성 (하위 클래스에서 구현)"""
+        raise NotImplementedError
 
-        combined = pd.concat(dfs, ignore_index=True)
+    def _share_with_worker(self, worker):
+        """워커가 실패 URL 목록과 동시성 제어기를 공유하도록 연결"""
+        worker.failed_urls = self.failed_urls
+        worker.concurrency = self.concurrency
+        worker.waits = self.waits
+        worker.frontier = self.frontier
+        worker._store = self._store
+        worker.budget = self.budget
+        return worker
 
-        # 1단계: 전달된 키로 1차 중복 제거
-        if subset_keys:
-            combined = combined.drop_duplicates(subset=subset_keys, keep='last').reset_index(drop=True)
-        else:
-            combined = combined.reset_index(drop=True)
-
-        # 2단계: 법령(info) 전용 - 문서코드+법령명 그룹에서 '정보가 많은' 행을 선택
-        if subfolder == "info" and {"문서코드", "법령명"}.issubset(combined.columns):
-            def _norm(s):
-                return (s.astype(str)
-                        .str.strip()
-                        .str.replace(r"\s+", " ", regex=True)
-                        .str.lower()
-                        .replace({"-": pd.NA, "": pd.NA, "none": pd.NA}))
-
-            # 그룹 키(정규화)
-            combined["_code_norm"]  = _norm(combined["문서코드"])
-            combined["_title_norm"] = _norm(combined["법령명"])
-            mask = combined["_code_norm"].notna() & combined["_title_norm"].notna()
-
-            # '정보량 점수' 계산: 값이 채워진 컬럼 수 + 가중치
-            filled_cols = [
-                "문서코드","법령명","문서유형","발급기관","유효상태",
-                "발행일","발효일","서명자 직위","서명자","유효범위",
-                "itemID","regionID","url"
-            ]
-            def _is_filled(col: pd.Series) -> pd.Series:
-                s = col.astype(str).str.strip().str.lower()
-                return (~s.isin({"", "-", "none"})).astype(int)
-
-            # 기본 점수: 채워진 컬럼 수
-            filled_df = combined.reindex(columns=filled_cols, fill_value=pd.NA)
-            filled_mask = filled_df.apply(_is_filled, axis=0)
-            base_score = filled_mask.sum(axis=1)
-
-            # 중요 필드 가중치
-            bonus = (
-                _is_filled(combined.get("발행일", pd.Series(index=combined.index))) +
-                _is_filled(combined.get("발효일", pd.Series(index=combined.index))) +
-                _is_filled(combined.get("유효상태", pd.Series(index=combined.index))) +
-                _is_filled(combined.get("발급기관", pd.Series(index=combined.index)))
-            )
-
-            # 길이 힌트
-            len_hint = (
-                combined.get("법령명", "").astype(str).str.len().fillna(0) +
-                combined.get("발급기관", "").astype(str).str.len().fillna(0)
-            )
-
-            combined["_score"] = base_score + bonus
-            combined["_len_hint"] = len_hint
-
-            # 그룹 내에서 점수 기준 정렬 후 최고점 선택
-            kept = combined.loc[mask].assign(_idx=combined.index)
-            kept = kept.sort_values(
-                by=["_code_norm","_title_norm","_score","_len_hint","_idx"],
-                ascending=[True, True, False, False, False]
-            ).drop_duplicates(subset=["_code_norm","_title_norm"], keep="first")
-
-            rest = combined.loc[~mask]
-            combined = pd.concat([kept, rest], ignore_index=True)
-
-            # 임시 컬럼 제거
-            combined = combined.drop(columns=[c for c in ["_code_norm","_title_norm","_score","_len_hint","_idx"]
-                                            if c in combined.columns])
-
-        # 저장
-        out_path = input_dir / "merged_result.csv"
-        combined.to_csv(out_path, index=False, encoding='utf-8')
-        self.logger.info(f"[merge_excel] 저장 완료: {out_path} (rows={len(combined)})")
+    def out_of_time(self, docs: int = 0) -> bool:
+        """시간 예산 안에 docs건을 더 처리할 수 없으면 True (예산 미지정 시 항상 False)"""
+        return self.budget is not None and not self.budget.allows(docs)
+
+    def close(self):
+        """워커 풀과 드라이버 종료"""
+        try:
+            self.pool.close()
+            self.waits.save()
+            if self._store is not None:
+                self._store.close()
+        finally:
+            if self.has_driver:
+                self._driver.quit()
+                self._driver = None
+                METRICS.add_gauge("active_drivers", -1)
+
+    def wait_for(self, condition, key: str, timeout: float = None):
+        """학습된 타임아웃으로 condition 대기 (키는 사이트별로 구분)"""
+        return self.waits.until(self.driver, condition, f"{self.host}|{key}", timeout)
+
+    def wait_settled(self, key: str):
+        """페이지 안정(요청 유휴 + DOM 변경 없음) 대기 - 최선 노력, 기본 대기시간 안에 안정되지 않아도 계속 진행
+
+        필요한 요소는 호출 전에 이미 기다렸으므로 실패로 처리하지 않음 (AIMD 타임아웃 신호로 세지 않음)
+        """
+        try:
+            self.wait_for(page_ready(), key, timeout=self.waits.default_timeout)
+        except TimeoutException:
+            self.logger.info(f"[wait] {key}: 페이지 안정 대기 {self.waits.default_timeout}초 초과, 계속 진행")
+
+    def throttle(self):
+        """사이트 요청 전 호스트별 토큰 획득 (페이지 이동, 포스트백 클릭 등)"""
+        waited = self.rate_limiter.acquire(self.host)
+        METRICS.observe("throttle_wait_seconds", waited)
+        if waited > 5:
+            self.logger.debug(f"[throttle] {self.host} 토큰 대기 {waited:.1f}초")
+
+    def navigate(self, url):
+        """속도 제한을 거쳐 페이지 이동"""
+        self.throttle()
+        with METRICS.timer("page_load"):
+            self.driver.get(url)
+
+    def navigate_back(self):
+        """속도 제한을 거쳐 뒤로가기"""
+        self.throttle()
+        with METRICS.timer("page_back"):
+            self.driver.back()
+
+    def merge_excel(self, subfolder: str, subset_keys: list[str] = None):
+        """저장소 → {subfolder}/merged_result.csv 내보내기 (폴더의 새 CSV는 먼저 저장소에 반영, 법령용 정보량 점수 로직 포함)
+
+        중복 기준은 저장소 테이블 키(regionID+itemID, docid 등)이며 subset_keys는 하위호환용으로만 받습니다.
+        """
+        table, folder = self.store_tables.get(subfolder, subfolder), Path(self.output_dir) / subfolder
+        with METRICS.timer(f"merge_{subfolder}"):
+            if self.defer_export:
+                self.store.import_csv_dir(table, folder)
+                self.logger.info(f"[merge_excel] {folder} 내보내기는 최종 병합에서 실행")
+            else:
+                self.store.sync_dir(table, folder)
 
     def safe_go_to(self, func, *args, retries=4, delay=60):
         """공통 재시도 로직"""
@@ -159,10 +204,12 @@ class BaseScraper:
                 msg = f"[{attempt}/{retries}] 함수 실행 중 예외: {e}"
             
             self.logger.info(msg)
+            METRICS.inc("extract_attempts_total", func=func.__name__, outcome="retry")
             
             if retries >= 2 and attempt == retries - 1:
                 delay = 1800  # 마지막 전 시도는 30분 대기
             
+            METRICS.inc("retry_sleep_seconds_total", delay, func=func.__name__)
             time.sleep(delay)
         
         self.logger.critical(f"[safe_go_to] 최종 실행 실패")
@@ -171,20 +218,52 @@ class BaseScraper:
     def safe_extract(self, func, url, *args, retries=4, delay=60):
         """공통 추출 재시도 로직"""
         for attempt in range(1, retries + 1):
+            started = time.monotonic()
             try:
                 result = func(url, *args)
                 if result:
+                    # (info, relations, links) 형태는 info가 비어 있으면 실패 신호로 기록
+                    if isinstance(result, tuple) and not result[0]:
+                        outcome = concurrency.BLOCKED if self._is_blocked() else concurrency.EMPTY
+                    else:
+                        outcome = concurrency.OK
+                    self.concurrency.record(outcome, time.monotonic() - started)
+                    METRICS.inc("extract_attempts_total", func=func.__name__, outcome=outcome)
                     return result
                 else:
                     msg = f"[{attempt}/{retries}] 추출 실패 (빈 결과): {url}"
+                    outcome = concurrency.BLOCKED if self._is_blocked() else concurrency.EMPTY
             except Exception as e:
                 if retries >= 2 and attempt == retries - 1:
                     delay = 1800
                 msg = f"[{attempt}/{retries}] 추출 중 예외: {url} | {e}"
+                outcome = self._classify_error(e)
             
+            self.concurrency.record(outcome, time.monotonic() - started)
+            METRICS.inc("extract_attempts_total", func=func.__name__, outcome=outcome)
             self.logger.info(msg)
+            METRICS.inc("retry_sleep_seconds_total", delay, func=func.__name__)
             time.sleep(delay)
         
         self.logger.critical(f"[safe_extract] 최종 추출 실패: {url}")
         self.failed_urls.append(url)
-        return {} if func.__name__.endswith('_details') else []
\ No newline at end of file
+        return {} if func.__name__.endswith('_details') else []
+
+    def _classify_error(self, e: Exception) -> str:
+        """추출 예외를 동시성 제어 신호로 분류"""
+        if isinstance(e, TimeoutException):
+            return concurrency.BLOCKED if self._is_blocked() else concurrency.TIMEOUT
+        if isinstance(e, WebDriverException):
+            return concurrency.DRIVER_ERROR
+        return concurrency.ERROR
+
+    def _is_blocked(self) -> bool:
+        """현재 페이지가 차단/CAPTCHA 페이지인지 확인"""
+        if not self.has_driver:
+            return False
+        try:
+            text = (self.driver.title + " " + self.driver.page_source[:5000]).lower()
+        except Exception:
+            return False
+        return any(marker in text for marker in BLOCK_MARKERS)
+
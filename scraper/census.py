@@ -0,0 +1,159 @@
+# 지역별 법령 문서 수 센서스 - 캐시 파일 기반, 오래된 항목만 병렬 갱신
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 한국시간 정의(UTC+9)
+KST = timezone(timedelta(hours=9))
+
+CACHE_PATH = "output/census/region_counts.json"
+CENTRAL_KEY = "중앙"
+
+
+def _now() -> str:
+    return datetime.now(KST).isoformat(timespec="seconds")
+
+
+def _is_stale(stamp, max_age: timedelta) -> bool:
+    if not stamp:
+        return True
+    try:
+        return datetime.now(KST) - datetime.fromisoformat(stamp) > max_age
+    except ValueError:
+        return True
+
+
+class RegionCensus:
+    """지역 링크와 지역별 총 문서 수를 캐시 파일에 보관
+
+    캐시 구조:
+        {"regions_updated_at": ..., "central": {"total", "updated_at"},
+         "regions": {코드: {"url", "total", "updated_at"}}}
+    """
+
+    def __init__(self, cache_path=CACHE_PATH, max_age_hours=24, workers=4, logger=None):
+        self.cache_path = Path(cache_path)
+        self.max_age = timedelta(hours=max_age_hours)
+        self.workers = workers
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    # ----- 캐시 -----
+    def _load(self) -> dict:
+        if self.cache_path.exists():
+            try:
+                return json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                self.logger.warning(f"[census] 캐시 읽기 실패, 새로 생성: {e}")
+        return {"regions_updated_at": None, "central": {}, "regions": {}}
+
+    def save(self):
+        with self._lock:
+            os.makedirs(self.cache_path.parent, exist_ok=True)
+            tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+
+    # ----- 조회 -----
+    def cached_region_links(self) -> list:
+        """캐시된 지역 링크 (없거나 오래되었으면 빈 목록)"""
+        if _is_stale(self.data.get("regions_updated_at"), self.max_age):
+            return []
+        return [(code, entry["url"]) for code, entry in self.data["regions"].items() if entry.get("url")]
+
+    def set_region_links(self, links):
+        """실시간 수집한 지역 링크로 캐시 갱신 (기존 문서 수는 유지)"""
+        with self._lock:
+            regions = self.data["regions"]
+            for code, url in links:
+                regions.setdefault(code, {})["url"] = url
+            self.data["regions_updated_at"] = _now()
+        self.save()
+
+    def counts(self, mode: str = "local") -> dict:
+        """캐시된 문서 수 (central: {"중앙": N}, local: {지역코드: N})"""
+        if mode == "central":
+            total = self.data.get("central", {}).get("total")
+            return {CENTRAL_KEY: total} if total is not None else {}
+        return {code: e["total"] for code, e in self.data["regions"].items() if e.get("total") is not None}
+
+    def total(self, mode: str = None) -> int:
+        """전체 문서 수 (mode 미지정 시 중앙+지방)"""
+        modes = [mode] if mode else ["central", "local"]
+        return sum(sum(self.counts(m).values()) for m in modes)
+
+    def stale_regions(self) -> list:
+        return [code for code, e in self.data["regions"].items()
+                if e.get("url") and (e.get("total") is None or _is_stale(e.get("updated_at"), self.max_age))]
+
+    # ----- 갱신 -----
+    def refresh(self, force=False, include_central=True, scraper_factory=None) -> dict:
+        """지역 링크가 없으면 수집하고, 오래된 지역의 문서 수만 병렬로 다시 읽음"""
+        scraper_factory = scraper_factory or self._default_factory
+
+        if force or not self.cached_region_links():
+            scraper = scraper_factory()
+            try:
+                scraper.region_links = []
+                if scraper._collect_region_links(use_census=False):
+                    self.set_region_links(scraper.region_links)
+            finally:
+                scraper.close()
+
+        targets = list(self.data["regions"]) if force else self.stale_regions()
+        jobs = [(code, self.data["regions"][code]["url"]) for code in targets]
+        if include_central and (force or _is_stale(self.data.get("central", {}).get("updated_at"), self.max_age)):
+            jobs.insert(0, (CENTRAL_KEY, None))
+
+        if not jobs:
+            self.logger.info("[census] 모든 지역 문서 수가 최신 상태")
+            return self.counts("local")
+
+        self.logger.info(f"[census] 문서 수 갱신 대상 {len(jobs)}개 (워커 {self.workers}개)")
+        queue = list(reversed(jobs))
+
+        def work():
+            scraper = scraper_factory()
+            try:
+                while True:
+                    with self._lock:
+                        if not queue:
+                            return
+                        code, url = queue.pop()
+                    self._count_one(scraper, code, url)
+            finally:
+                scraper.close()
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as ex:
+            futures = [ex.submit(work) for _ in range(min(self.workers, len(jobs)))]
+            for f in futures:
+                try:
+                    f.result()
+                except Exception as e:
+                    self.logger.error(f"[census] 워커 오류: {e}")
+
+        self.save()
+        return self.counts("local")
+
+    def _count_one(self, scraper, code, url):
+        scraper.start_url = url or f"{scraper.base_url}/TW/Pages/home.aspx"
+        if not scraper.safe_go_to(scraper.go_to_law_list, retries=2, delay=10):
+            self.logger.error(f"[census] [{code}] 문서목록으로 이동 실패")
+            return
+        total = scraper._read_total_docs(code)
+        if total is None:
+            return
+        with self._lock:
+            entry = self.data["central"] if code == CENTRAL_KEY else self.data["regions"][code]
+            entry["total"] = total
+            entry["updated_at"] = _now()
+
+    def _default_factory(self):
+        from scraper.law_scraper import LawScraper
+        return LawScraper("local", logger=self.logger, max_workers=1)
@@ -0,0 +1,190 @@
+# AIMD 방식 동시성 제어기 및 적응형 워커 풀
+
+import math
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import logging
+
+from metrics_util import METRICS
+
+DEFAULT_MAX_WORKERS = 4
+
+# safe_extract가 보고하는 결과 분류
+OK = "ok"
+EMPTY = "empty"
+ERROR = "error"
+TIMEOUT = "timeout"
+BLOCKED = "blocked"
+DRIVER_ERROR = "driver_error"
+
+# 즉시 감속(곱셈 감소) 대상 신호
+SEVERE_OUTCOMES = {TIMEOUT, BLOCKED, DRIVER_ERROR}
+
+
+class AIMDController:
+    """가산 증가/곱셈 감소(AIMD) 동시성 제어기
+
+    - window 건마다 오류율과 지연시간 중앙값이 양호하면 동시성 +increase
+    - 타임아웃/차단/드라이버 오류 발생 시 동시성 × decrease_factor (cooldown 내 1회)
+    """
+
+    def __init__(self, min_level=1, max_level=DEFAULT_MAX_WORKERS, initial=1, increase=1,
+                 decrease_factor=0.5, window=10, latency_target=20.0, error_threshold=0.2,
+                 cooldown=30.0, logger=None):
+        self.min_level = max(1, min_level)
+        self.max_level = max(self.min_level, max_level)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.window = window
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._level = min(max(initial, self.min_level), self.max_level)
+        self._samples = []
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self.counts = {}
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    def record(self, outcome: str, latency: float = 0.0):
+        """추출 1건의 결과(outcome)와 소요시간(초)을 반영"""
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+            if outcome in SEVERE_OUTCOMES:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self._set_level(math.floor(self._level * self.decrease_factor), outcome)
+                self._samples = []
+                return
+
+            self._samples.append((outcome, latency))
+            if len(self._samples) < self.window:
+                return
+
+            errors = sum(1 for o, _ in self._samples if o != OK)
+            latencies = [lat for o, lat in self._samples if o == OK]
+            self._samples = []
+
+            error_rate = errors / self.window
+            median_latency = statistics.median(latencies) if latencies else float("inf")
+            if error_rate <= self.error_threshold and median_latency <= self.latency_target:
+                self._set_level(self._level + self.increase, f"정상 (p50={median_latency:.1f}s)")
+
+    def _set_level(self, level: int, reason: str):
+        level = min(max(level, self.min_level), self.max_level)
+        if level != self._level:
+            self.logger.info(f"[AIMD] 동시성 {self._level} → {level} ({reason})")
+            self._level = level
+
+    def snapshot(self) -> dict:
+        """현재 상태 요약"""
+        with self._lock:
+            return {"level": self._level, "min": self.min_level,
+                    "max": self.max_level, "counts": dict(self.counts)}
+
+
+class AdaptivePool:
+    """AIMD 제어기의 현재 동시성만큼 워커(드라이버)를 운용하는 풀
+
+    워커는 필요할 때 worker_factory로 생성하고, 동시성이 줄어들면 남는 워커를 종료합니다.
+    primary가 주어지면 첫 번째 워커로 재사용하며 종료하지 않습니다.
+    """
+
+    def __init__(self, controller: AIMDController, worker_factory, logger=None, primary=None):
+        self.controller = controller
+        self.worker_factory = worker_factory
+        self.logger = logger or logging.getLogger(__name__)
+        self.primary = primary
+        self._idle = [primary] if primary is not None else []
+        self._workers = list(self._idle)
+        self._executor = None
+
+    @property
+    def active_workers(self) -> int:
+        return len(self._workers)
+
+    def map(self, func, items):
+        """func(worker, item)을 병렬 실행하여 입력 순서대로 결과 반환 (예외 시 None)"""
+        items = list(items)
+        results = [None] * len(items)
+        pending = deque(enumerate(items))
+        in_flight = {}
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.controller.max_level,
+                                                thread_name_prefix="scrape-worker")
+
+        while pending or in_flight:
+            while pending and len(in_flight) < self.controller.level:
+                worker = self._checkout()
+                if worker is None:
+                    break
+                idx, item = pending.popleft()
+                fut = self._executor.submit(func, worker, item)
+                in_flight[fut] = (idx, worker)
+
+            if not in_flight:
+                # 워커를 하나도 만들 수 없는 경우
+                raise RuntimeError("사용 가능한 워커가 없습니다")
+
+            METRICS.set_gauge("queue_depth", len(pending))
+            METRICS.set_gauge("aimd_level", self.controller.level)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                idx, worker = in_flight.pop(fut)
+                try:
+                    results[idx] = fut.result()
+                except Exception as e:
+                    self.logger.error(f"[AdaptivePool] 작업 예외: {items[idx]} | {e}")
+                self._checkin(worker, busy=len(in_flight))
+
+        METRICS.set_gauge("queue_depth", 0)
+        return results
+
+    def _checkout(self):
+        if self._idle:
+            return self._idle.pop()
+        try:
+            worker = self.worker_factory()
+        except Exception as e:
+            self.logger.error(f"[AdaptivePool] 워커 생성 실패: {e}")
+            self.controller.record(DRIVER_ERROR)
+            return None
+        self._workers.append(worker)
+        self.logger.info(f"[AdaptivePool] 워커 추가 (총 {len(self._workers)}개)")
+        return worker
+
+    def _checkin(self, worker, busy: int):
+        # 동시성이 줄었으면 남는 워커 종료
+        if worker is not self.primary and busy + len(self._idle) >= self.controller.level:
+            self._retire(worker)
+        else:
+            self._idle.append(worker)
+
+    def _retire(self, worker):
+        self._workers.remove(worker)
+        try:
+            worker.close()
+        except Exception as e:
+            self.logger.warning(f"[AdaptivePool] 워커 종료 실패: {e}")
+        self.logger.info(f"[AdaptivePool] 워커 종료 (총 {len(self._workers)}개)")
+
+    def close(self):
+        """primary를 제외한 모든 워커 종료"""
+        for worker in [w for w in self._workers if w is not self.primary]:
+            self._retire(worker)
+        self._idle = [self.primary] if self.primary is not None else []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -1,15 +1,17 @@
 ### scraper/directive_scraper.py ###
 # 행정지시문서 수집 코드 (공통 베이스 사용)
+import logging
 from scraper.base_scraper_core import BaseScraper
 from log_util import setup_logger
+from metrics_util import METRICS, timed
+from scraper.concurrency import DEFAULT_MAX_WORKERS
+from scraper.frontier import listing_key, DONE, PENDING
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 import re
 import time
-import pandas as pd
-import os
 from pathlib import Path
 from math import ceil
 
@@ -21,108 +23,180 @@ WAIT_TIME = 10
 DOCS_PER_PAGE = 50
 PAGE_CHUNK_SIZE = 10
 
-LOGGER = setup_logger(__name__, f"{OUTPUT_DIR}/log/directive_scrapper.log")
+# 로그 파일 핸들러는 스크래퍼 생성 시 설정 (임포트 시 output 폴더를 만들지 않음)
+LOGGER = logging.getLogger(__name__)
 
 class DirectiveScraper(BaseScraper):
     """행정지시문서 스크래퍼 - 공통 베이스 사용"""
+
+    store_tables = {"info": "directive"}
     
-    def __init__(self):
-        super().__init__(BASE_URL, START_URL, OUTPUT_DIR, WAIT_TIME, DOCS_PER_PAGE, LOGGER)
+    def __init__(self, rate_limiter=None, max_workers=DEFAULT_MAX_WORKERS, budget=None, use_undetected=False,
+                 docs_per_page=DOCS_PER_PAGE, chunk_size=PAGE_CHUNK_SIZE, page_range=None, base_url=BASE_URL):
+        if not LOGGER.handlers:
+            setup_logger(__name__, f"{OUTPUT_DIR}/log/directive_scrapper.log")
+        start_url = START_URL.replace(BASE_URL, base_url, 1)
+        super().__init__(base_url, start_url, OUTPUT_DIR, WAIT_TIME, docs_per_page, LOGGER,
+                         use_undetected=use_undetected, rate_limiter=rate_limiter, max_workers=max_workers,
+                         budget=budget)
+        self.chunk_size = chunk_size    # 중간 저장 단위 (페이지 수)
+        self.page_range = page_range    # (시작, 끝) 페이지, 끝이 None이면 마지막까지
         self.info_results = []
         self.temp_info_results = []
 
     def run(self):
         """실행 메인 로직"""
         try:
-            self.driver.delete_all_cookies()
+            self.reset_session()
+            self.frontier.recover()
             
             # 총 문서 수와 페이지 수 계산
             total_docs, total_page_number = self.extract_total_pages()
+            if self.budget:
+                done = self.frontier.counts(kind="detail", scope="directive")[DONE]
+                self.budget.report("행정지시문서", max(0, total_docs - done))
             
-            start_page = 1
-            output_dir = Path(self.output_dir) / "info"
-            os.makedirs(output_dir, exist_ok=True)
-
+            start_page, last_page = 1, total_page_number
+            if self.page_range:
+                start_page = max(1, self.page_range[0])
+                last_page = min(total_page_number, self.page_range[1] or total_page_number)
             # 전체 페이지 수만큼 반복
-            for current_page_number in range(start_page, total_page_number + 1):
-                try:
-                    if not self.safe_go_to(self.go_to_page, current_page_number, total_page_number):
-                        self.logger.error(f"페이지 {current_page_number} 이동 실패")
-                        continue
-                except:
-                    self.logger.error(f"페이지 {current_page_number} safe_go_to_page 실패")
-                    continue
-
-                directive_urls = self.extract_links_from_current_page(current_page_number)
-
-                for idx, directive_url in enumerate(directive_urls):
-                    try:
-                        info = self.safe_extract(self.extract_details, directive_url, 
-                                               current_page_number, idx + 1, len(directive_urls))
-                        if info:
-                            self.temp_info_results.append(info)
-                            self.logger.info(f"[{idx+1}/{len(directive_urls)}] 세부정보 처리 완료: {directive_url}")
-                        else:
-                            self.logger.error(f"[{idx+1}/{len(directive_urls)}] 세부정보 없음: {directive_url}")
-
-                        self.driver.back()
-                        time.sleep(1)
-                    except Exception as e:
-                        self.logger.error(f"[{idx+1}/{len(directive_urls)}] 개별문서 예외: {directive_url} ({e})")
+            chunk_start_page = start_page
+            chunk_keys = []  # 청크 저장 시 완료 처리할 목록 페이지/상세 URL
+            for current_page_number in range(start_page, last_page + 1):
+                # 마감 전에 한 페이지를 끝낼 수 없으면 지금까지의 결과만 저장하고 중단
+                stop = self.out_of_time(self.docs_per_page)
+                if stop:
+                    self.logger.warning(f"[budget] 마감 임박, 페이지 {current_page_number}부터 다음 실행에서 재개")
+                elif self.frontier.state_of(listing_key("directive", current_page_number)) == DONE:
+                    self.logger.info(f"페이지 {current_page_number} 이전 실행에서 완료됨, 스킵")
+                else:
+                    chunk_keys.extend(self._process_page(current_page_number, total_page_number))
 
                 # chunk size마다 중간저장
-                if current_page_number % PAGE_CHUNK_SIZE == 0 or current_page_number == total_page_number:
-                    end_page = current_page_number
-                    file_name = f"directive_info_output_{start_page:03d}_{end_page:03d}.csv"
-                    file_path = os.path.join(output_dir, file_name)
-
-                    # 누적
-                    self.info_results.extend(self.temp_info_results)
-                    
-                    # 엑셀로 저장
-                    if self.info_results:
-                        df1 = pd.DataFrame(self.info_results)
-                        df1.to_csv(file_path, index=False, encoding='utf-8')
-                        self.logger.info(f"저장됨: {file_path}")
-                    else:
-                        self.logger.error(f"저장할 데이터 없음: {file_path}")
+                if stop or current_page_number % self.chunk_size == 0 or current_page_number == last_page:
+                    end_page = current_page_number - 1 if stop else current_page_number
+
+                    # 저장소에 반영 (1 트랜잭션)
+                    with METRICS.timer("save_chunk"):
+                        saved = self.store.upsert_checked("directive", self.temp_info_results)
+                        if saved["directive"] or saved["unchanged"]:
+                            self.logger.info(f"저장됨: 페이지 {chunk_start_page:03d}~{end_page:03d} → "
+                                             f"{self.store.path} ({saved['directive']}건, 변경 없음 {saved['unchanged']}건)")
+                        else:
+                            self.logger.error(f"저장할 데이터 없음: 페이지 {chunk_start_page:03d}~{end_page:03d}")
 
                     self.temp_info_results = []
+                    chunk_start_page = current_page_number + 1
+                    self.frontier.complete(chunk_keys)
+                    chunk_keys = []
+                    self.logger.info(f"진행 상황: {self.frontier.progress(scope='directive')}")
+
+                if stop:
+                    break
 
             self.logger.info("directive info 병합 시작")
-            self.merge_excel("info", ['docid'])
+            self.merge_excel("info")
             
             # 수집 실패한 url csv 저장
             if self.failed_urls:
                 failed_path = Path(self.output_dir) / "log" / "failed_urls.csv"
+                import pandas as pd
+
                 pd.DataFrame({"url": self.failed_urls}).to_csv(failed_path, index=False, encoding="utf-8")
                 self.logger.warning(f"수집 실패한 URL {len(self.failed_urls)}건 저장됨: {failed_path}")
 
         finally:
-            self.driver.quit()
+            self.close()
+
+    @timed("process_page")
+    def _process_page(self, page: int, total_page_number: int) -> list:
+        """목록 페이지 1개 처리 - 상세 URL을 frontier에 등록 후 리스하여 수집, 처리된 키 목록 반환"""
+        page_key = listing_key("directive", page)
+        self.frontier.add([page_key], kind="listing", scope="directive", page=page)
+
+        try:
+            if not self.safe_go_to(self.go_to_page, page, total_page_number):
+                self.logger.error(f"페이지 {page} 이동 실패")
+                self.frontier.fail(page_key, "페이지 이동 실패")
+                METRICS.inc("pages_total", result="failed")
+                return []
+        except:
+            self.logger.error(f"페이지 {page} safe_go_to_page 실패")
+            self.frontier.fail(page_key, "페이지 이동 실패")
+            METRICS.inc("pages_total", result="failed")
+            return []
+
+        directive_urls = self.extract_links_from_current_page(page)
+        self.frontier.add(directive_urls, kind="detail", scope="directive", page=page)
+        leased = self.frontier.lease(limit=len(directive_urls), kind="detail", scope="directive", page=page)
+        done_keys = []
+        retry = 0  # 실패했지만 재시도 횟수가 남아 pending으로 돌아간 상세 URL 수
+
+        # 상세정보는 워커 드라이버에서 수집 → 목록 페이지는 그대로 유지되어 뒤로가기 불필요
+        def extract(worker, item):
+            idx, url = item
+            return worker.safe_extract(worker.extract_details, url, page, idx + 1, len(leased))
+
+        results = self.pool.map(extract, list(enumerate(leased)))
+
+        for idx, (directive_url, info) in enumerate(zip(leased, results)):
+            try:
+                if info:
+                    self.temp_info_results.append(info)
+                    done_keys.append(directive_url)
+                    METRICS.inc("docs_total", result="ok")
+                    self.logger.info(f"[{idx+1}/{len(leased)}] 세부정보 처리 완료: {directive_url}")
+                else:
+                    if self.frontier.fail(directive_url, "세부정보 없음") == PENDING:
+                        retry += 1
+                    METRICS.inc("docs_total", result="failed")
+                    self.logger.error(f"[{idx+1}/{len(leased)}] 세부정보 없음: {directive_url}")
+            except Exception as e:
+                if self.frontier.fail(directive_url, e) == PENDING:
+                    retry += 1
+                self.logger.error(f"[{idx+1}/{len(leased)}] 개별문서 예외: {directive_url} ({e})")
+
+        METRICS.inc("pages_total", result="ok")
+        if self.budget:
+            self.budget.record(len(done_keys))
+        # 재시도 대기 상세 URL이 남으면 목록 페이지를 완료 처리하지 않음 → 재개 시 다시 처리하며 남은 URL만 리스
+        if retry:
+            self.logger.warning(f"페이지 {page}: 재시도 대기 {retry}건, 다음 실행에서 다시 처리")
+        else:
+            done_keys.append(page_key)
+        return done_keys
+
+    def _make_worker(self):
+        """상세 수집용 워커 (별도 드라이버, 속도 제한기 공유)"""
+        worker = DirectiveScraper(rate_limiter=self.rate_limiter, max_workers=1, use_undetected=self.use_undetected,
+                                  docs_per_page=self.docs_per_page, base_url=self.base_url)
+        return self._share_with_worker(worker)
 
     # ===== 행정지시문서 전용 메서드들 =====
     
+    @timed("extract_total_pages")
     def extract_total_pages(self):
         """총 문서 수를 바탕으로 페이지 수 계산"""
         try:
-            self.driver.get(self.start_url)
-            total_text = self.wait.until(EC.presence_of_element_located(
+            self.navigate(self.start_url)
+            total_text = self.wait_for(EC.presence_of_element_located(
                 (By.CSS_SELECTOR, "tr.grid-pager th.th-detail span")
-            )).text  # 예: "1 - 50 | 46955"
+            ), "total_count").text  # 예: "1 - 50 | 46955"
             total_docs = int(total_text.split('|')[-1].strip())
             return total_docs, ceil(total_docs / self.docs_per_page)
         except Exception as e:
             self.logger.error(f"총 문서 수 추출 실패: {e}")
             return 0, 0
 
+    @timed("extract_page_links")
     def extract_links_from_current_page(self, page):
         """현재 페이지에서 상세 링크 수집"""
         urls = []
         try:
-            table = self.wait.until(EC.presence_of_element_located((
+            table = self.wait_for(EC.presence_of_element_located((
                 By.CSS_SELECTOR, "div.document-content table.table.search-result"
-            )))
+            )), "result_table")
             rows = table.find_elements(By.TAG_NAME, "tr")[1:-2]  # 헤더, 페이지네이션 제외
 
             for idx, row in enumerate(rows, start=1):
@@ -141,11 +215,12 @@ class DirectiveScraper(BaseScraper):
         self.logger.info(f"{page}페이지에서 {len(urls)}개 링크 수집 완료")
         return urls
 
+    @timed("extract_details")
     def extract_details(self, directive_url, page, idx, total_url):
         """상세정보 수집"""
         try:
-            self.driver.get(directive_url)
-            self.wait.until(EC.presence_of_element_located((By.ID, "ctrl_190596_91_Content")))
+            self.navigate(directive_url)
+            self.wait_for(EC.presence_of_element_located((By.ID, "ctrl_190596_91_Content")), "detail_content")
 
             # docid 추출
             parsed = urlparse(directive_url)
@@ -217,6 +292,7 @@ class DirectiveScraper(BaseScraper):
             self.logger.error(f"페이지 {page} [{idx}/{total_url}] 문서 상세 수집 실패: {directive_url} | {e}")
             return {}
 
+    @timed("go_to_page")
     def go_to_page(self, target_page: int, total_page_number: int):
         """페이지 이동 함수"""
         def parse_page_buttons():
@@ -244,13 +320,20 @@ class DirectiveScraper(BaseScraper):
 
             return buttons
 
+        def click_postback(element):
+            """페이지 버튼 클릭 후 포스트백으로 페이저가 교체되고 페이지가 안정될 때까지 대기"""
+            self.throttle()
+            self.driver.execute_script("arguments[0].click();", element)
+            self.wait_for(EC.staleness_of(element), "pager_postback")
+            self.wait_settled("pager_ready")
+
         max_tries = total_page_number + 1
         tries = 0
 
         while tries < max_tries:
             try:
-                self.wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "table.table.search-result tr.grid-pager")))
+                self.wait_for(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "table.table.search-result tr.grid-pager")), "pager")
             except:
                 self.logger.critical("페이지네이션 로드 실패")
                 return False
@@ -267,22 +350,20 @@ class DirectiveScraper(BaseScraper):
             if target_page in page_nums:
                 for b in buttons:
                     if b["page"] == target_page:
-                        self.driver.execute_script("arguments[0].click();", b["element"])
-                        time.sleep(2)
+                        click_postback(b["element"])
                         return True
             else:
                 forward = [b for b in buttons if b["page"] > target_page]
                 backward = [b for b in buttons if b["page"] < target_page]
 
                 if backward:
-                    self.driver.execute_script("arguments[0].click();", backward[-1]["element"])
+                    click_postback(backward[-1]["element"])
                 elif forward:
-                    self.driver.execute_script("arguments[0].click();", forward[0]["element"])
+                    click_postback(forward[0]["element"])
                 else:
                     self.logger.critical(f"{target_page}페이지 버튼을 찾을 수 없습니다.")
                     return False
 
-            time.sleep(2)
             tries += 1
 
         self.logger.critical(f"{target_page} 페이지 이동 실패 - 최대 시도 횟수 초과")
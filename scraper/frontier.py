@@ -0,0 +1,249 @@
+# SQLite(WAL) 기반 URL 작업 큐 - 크롤링 재개 및 다중 워커/프로세스 공유용
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url           TEXT PRIMARY KEY,
+    kind          TEXT NOT NULL DEFAULT 'detail',
+    scope         TEXT NOT NULL DEFAULT '',
+    page          INTEGER,
+    state         TEXT NOT NULL DEFAULT 'pending',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    created_at    REAL NOT NULL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_state ON frontier (state, kind, scope, page);
+"""
+
+
+def default_owner() -> str:
+    """리스 소유자 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def listing_key(scope: str, page: int) -> str:
+    """목록 페이지 작업 키"""
+    return f"list://{scope}/{page}"
+
+
+class Frontier:
+    """URL 상태(pending/in_flight/done/failed), 시도 횟수, 타임스탬프를 보관하는 영속 작업 큐
+
+    lease()는 BEGIN IMMEDIATE 트랜잭션으로 원자적으로 작업을 가져오므로
+    여러 스레드/프로세스가 같은 파일을 공유해도 같은 URL을 중복으로 받지 않습니다.
+    """
+
+    def __init__(self, path, lease_seconds=1800, max_attempts=3, logger=None):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.logger = logger or logging.getLogger(__name__)
+        self.owner = default_owner()
+        self._local = threading.local()
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=60000")
+            self._local.conn = conn
+        return conn
+
+    def _write(self, sql: str, rows) -> int:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return cur.rowcount
+
+    def add(self, urls, kind="detail", scope="", page=None) -> int:
+        """새 URL을 pending으로 등록 (이미 있으면 무시), 등록 건수 반환"""
+        now = time.time()
+        rows = [(u, kind, scope, page, now, now) for u in dict.fromkeys(urls) if u]
+        if not rows:
+            return 0
+        return self._write(
+            "INSERT OR IGNORE INTO frontier (url, kind, scope, page, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def requeue(self, urls, kind=None) -> int:
+        """상태와 무관하게 URL을 다시 pending으로 (없으면 등록)"""
+        urls = [u for u in dict.fromkeys(urls) if u]
+        self.add(urls, kind=kind or "detail")
+        now = time.time()
+        return self._write(
+            "UPDATE frontier SET state='pending', attempts=0, lease_owner=NULL, lease_expires=NULL, "
+            "kind=COALESCE(?, kind), updated_at=? WHERE url=?",
+            [(kind, now, u) for u in urls])
+
+    def lease(self, limit=1, kind=None, scope=None, page=None, owner=None) -> list:
+        """pending(또는 리스 만료된 in_flight) URL을 최대 limit개(None이면 전부) 가져와 in_flight로 표시"""
+        owner = owner or self.owner
+        now = time.time()
+        where = ["(state='pending' OR (state='in_flight' AND lease_expires < ?))"]
+        params = [now]
+        for col, val in (("kind", kind), ("scope", scope), ("page", page)):
+            if val is not None:
+                where.append(f"{col}=?")
+                params.append(val)
+
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            urls = [r[0] for r in conn.execute(
+                f"SELECT url FROM frontier WHERE {' AND '.join(where)} "
+                f"ORDER BY page IS NULL, page, rowid LIMIT ?", params + [-1 if limit is None else limit])]
+            conn.executemany(
+                "UPDATE frontier SET state='in_flight', attempts=attempts+1, lease_owner=?, "
+                "lease_expires=?, updated_at=? WHERE url=?",
+                [(owner, now + self.lease_seconds, now, u) for u in urls])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return urls
+
+    def complete(self, urls) -> int:
+        """완료 처리"""
+        now = time.time()
+        return self._write(
+            "UPDATE frontier SET state='done', lease_owner=NULL, lease_expires=NULL, "
+            "last_error=NULL, updated_at=? WHERE url=?",
+            [(now, u) for u in dict.fromkeys(urls) if u])
+
+    def fail(self, url, error="") -> str:
+        """실패 처리 - 시도 횟수가 max_attempts 미만이면 pending, 이상이면 failed"""
+        now = time.time()
+        self._write(
+            "UPDATE frontier SET state=CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner=NULL, lease_expires=NULL, last_error=?, updated_at=? WHERE url=?",
+            [(self.max_attempts, str(error)[:500], now, url)])
+        return self.state_of(url)
+
+    def release(self, urls) -> int:
+        """리스 반환 (시도 횟수 차감 후 pending)"""
+        now = time.time()
+        return self._write(
+            "UPDATE frontier SET state='pending', attempts=MAX(attempts-1, 0), lease_owner=NULL, "
+            "lease_expires=NULL, updated_at=? WHERE url=? AND state='in_flight'",
+            [(now, u) for u in urls])
+
+    def recover(self) -> int:
+        """이 호스트에서 종료된 프로세스가 잡고 있던 리스를 pending으로 되돌림 (크래시 후 재개용)"""
+        host = socket.gethostname()
+        owners = [r[0] for r in self._conn().execute(
+            "SELECT DISTINCT lease_owner FROM frontier WHERE state='in_flight' AND lease_owner LIKE ?",
+            (f"{host}:%",))]
+        dead = [o for o in owners if not _pid_alive(o.rsplit(":", 1)[-1])]
+        if not dead:
+            return 0
+        now = time.time()
+        n = self._write(
+            "UPDATE frontier SET state='pending', lease_owner=NULL, lease_expires=NULL, updated_at=? "
+            "WHERE state='in_flight' AND lease_owner=?", [(now, o) for o in dead])
+        self.logger.info(f"[frontier] 중단된 작업 {n}건 재개 대기열로 복구")
+        return n
+
+    def reset(self) -> int:
+        """새로 수집할 때 - 완료/실패 기록을 포함한 모든 작업 삭제 (다른 프로세스가 리스 중인 작업은 유지), 삭제 건수 반환"""
+        n = self._write("DELETE FROM frontier WHERE NOT (state='in_flight' AND lease_expires >= ?)",
+                        [(time.time(),)])
+        self.logger.info(f"[frontier] 초기화: 작업 {n}건 삭제")
+        return n
+
+    def state_of(self, url):
+        row = self._conn().execute("SELECT state FROM frontier WHERE url=?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def urls(self, state, kind=None, scope=None) -> list:
+        sql = "SELECT url FROM frontier WHERE state=?"
+        params = [state]
+        if kind is not None:
+            sql += " AND kind=?"
+            params.append(kind)
+        if scope is not None:
+            sql += " AND scope=?"
+            params.append(scope)
+        return [r[0] for r in self._conn().execute(sql + " ORDER BY rowid", params)]
+
+    def counts(self, kind=None, scope=None) -> dict:
+        """상태별 건수"""
+        sql = "SELECT state, COUNT(*) FROM frontier WHERE 1=1"
+        params = []
+        if kind is not None:
+            sql += " AND kind=?"
+            params.append(kind)
+        if scope is not None:
+            sql += " AND scope=?"
+            params.append(scope)
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(dict(self._conn().execute(sql + " GROUP BY state", params).fetchall()))
+        return counts
+
+    def progress(self, kind=None, scope=None) -> str:
+        """진행 상황 문자열"""
+        c = self.counts(kind, scope)
+        total = sum(c.values())
+        return (f"done {c[DONE]}/{total} | pending {c[PENDING]} | "
+                f"in_flight {c[IN_FLIGHT]} | failed {c[FAILED]}")
+
+
+def _pid_alive(pid: str) -> bool:
+    try:
+        pid = int(pid)
+    except ValueError:
+        return True
+    if pid == os.getpid():
+        return False
+    if os.name == "nt":
+        return _win_pid_alive(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _win_pid_alive(pid: int) -> bool:
+    """Windows - os.kill(pid, 0)은 프로세스를 종료시키므로 OpenProcess + 종료 코드로 확인"""
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+    if not handle:
+        # 접근 거부(5)는 다른 사용자의 살아 있는 프로세스, 그 밖(87: 없는 PID)은 종료된 것으로 봄
+        return ctypes.get_last_error() == 5
+    try:
+        code = ctypes.c_ulong()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+            return True
+        return code.value == 259  # STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
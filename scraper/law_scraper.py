@@ -2,32 +2,52 @@
 # 중앙정부/지방정부 법령 통합 스크래퍼
 
 from scraper.base_scraper_core import BaseScraper
+from scraper import sharding
+from scraper.scheduler import split_units, run_work_units, MIN_UNIT_PAGES
+from scraper.census import RegionCensus
+from scraper.concurrency import DEFAULT_MAX_WORKERS
+from scraper.frontier import listing_key, DONE, PENDING
+from metrics_util import METRICS, timed
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
 from datetime import datetime
 import re
 from urllib.parse import urljoin, urlparse, parse_qs
 import time
 from pathlib import Path
-import pandas as pd
-import os
 from math import ceil
-from typing import Literal, List, Dict, Any, Tuple
+from typing import Literal, List, Dict, Any, Tuple, Optional
+
+BASE_URL = "https://vbpl.vn"
+DOCS_PER_PAGE = 30
+PAGE_CHUNK_SIZE = 10
 
 class LawScraper(BaseScraper):
     """중앙/지방 법령정보 통합 스크래퍼"""
+
+    # 매 페이지마다 목록으로 다시 이동하므로 자신의 드라이버도 상세 수집에 사용
+    details_on_primary = True
     
-    def __init__(self, mode: Literal["central", "local"], logger=None, use_undetected=False):
+    def __init__(self, mode: Literal["central", "local"], logger=None, use_undetected=False,
+                 rate_limiter=None, max_workers=DEFAULT_MAX_WORKERS, shard=None, counts_path=None, region_workers=1,
+                 budget=None, docs_per_page=DOCS_PER_PAGE, chunk_size=PAGE_CHUNK_SIZE, regions=None,
+                 page_range=None, base_url=BASE_URL):
         self.mode = mode
+        self.shard = shard              # (i, N) - 다중 노드 분할 실행 시 담당 샤드
+        self.counts_path = counts_path  # 샤드 분할 기준 문서 수 스냅샷(JSON)
+        self.region_workers = region_workers  # 지방 수집 시 (지역, 페이지 범위) 작업을 병렬 처리할 워커 수
+        self.chunk_size = chunk_size          # 중간 저장 단위 (페이지 수)
+        self.regions = regions                # 수집할 지역 코드 목록 (None이면 전체)
+        self.page_range = page_range          # (시작, 끝) 페이지 - 지역마다 적용, 끝이 None이면 마지막까지
         
         # 모드별 설정
-        base_url = "https://vbpl.vn"
         start_url = f"{base_url}/TW/Pages/home.aspx"
-        output_dir = f"output/{mode}_law"
+        output_dir = sharding.shard_output_dir(mode, shard) if shard else f"output/{mode}_law"
         wait_time = 10
-        docs_per_page = 30
         
-        super().__init__(base_url, start_url, output_dir, wait_time, docs_per_page, logger, use_undetected)
+        super().__init__(base_url, start_url, output_dir, wait_time, docs_per_page, logger, use_undetected,
+                         rate_limiter, max_workers, budget)
         
         # 결과 저장용
         self.info_results = []
@@ -36,6 +56,7 @@ class LawScraper(BaseScraper):
         self.temp_info_results = []
         self.temp_relation_results = []
         self.temp_download_link_results = []
+        self.temp_incomplete_results = []  # 관계정보/다운로드링크 추출에 실패한 문서의 기본정보
         
         # 지방정부용 지역 링크
         self.region_links = []
@@ -43,7 +64,8 @@ class LawScraper(BaseScraper):
     def run(self):
         """실행 메인 로직"""
         try:
-            self.driver.delete_all_cookies()
+            self.reset_session()
+            self.frontier.recover()
             
             if self.mode == "central":
                 self._run_central()
@@ -51,7 +73,15 @@ class LawScraper(BaseScraper):
                 self._run_local()
                 
         finally:
-            self.driver.quit()
+            self.close()
+
+    def _make_worker(self):
+        """상세 수집용 워커 (별도 드라이버, 속도 제한기 공유)"""
+        worker = LawScraper(self.mode, logger=self.logger, use_undetected=self.use_undetected,
+                            rate_limiter=self.rate_limiter, max_workers=1, shard=self.shard,
+                            docs_per_page=self.docs_per_page,
+                            base_url=self.base_url)
+        return self._share_with_worker(worker)
 
     def _run_central(self):
         """중앙정부 법령 수집"""
@@ -59,26 +89,140 @@ class LawScraper(BaseScraper):
             self.logger.critical("중앙정부 문서목록으로 이동 실패")
             return
 
-        try:
-            total_docs_text = self.driver.find_element(By.CSS_SELECTOR, 
-                "div#grid_vanban div.box-container div#tabVB_lv1 div.header ul li a.selected b").text
-            total_docs = int(total_docs_text.replace(".", "").replace(",", "").strip())
-            total_pages = ceil(total_docs / self.docs_per_page)
-            self.logger.info(f"총 문서 수: {total_docs}, 총 페이지 수: {total_pages}")
-        except Exception as e:
-            self.logger.critical(f"문서 수 불러오기 중 오류: {e}")
+        total_docs = self._read_total_docs("중앙")
+        if total_docs is None:
             return
+        total_pages = ceil(total_docs / self.docs_per_page)
+        self._report_budget(total_docs)
 
-        self._process_pages(total_pages, "중앙")
+        if self.shard:
+            counts = self._shard_counts(lambda: {"중앙": total_docs})
+            for unit in sharding.units_for_shard(counts, self.docs_per_page, self.shard):
+                if self.out_of_time():
+                    break
+                self.logger.info(f"[{sharding.shard_name(self.shard)}] 중앙 페이지 {unit.start_page}~{unit.end_page}")
+                self._process_pages(total_pages, "중앙", unit.start_page, unit.end_page)
+        else:
+            self._process_pages(total_pages, "중앙")
         self._finalize_results()
 
     def _run_local(self):
         """지방정부 법령 수집"""
         # 지역 링크 수집
-        self.driver.get(self.start_url)
-        time.sleep(2)
+        if not self._collect_region_links():
+            return
+
+        if self.shard or self.region_workers > 1 or self.budget:
+            self._run_local_units()
+            self._finalize_results()
+            return
+
+        # 각 지역별 처리
+        for region_code, region_url in self.region_links:
+            self.start_url = region_url
+            self.logger.info(f"\n=== {region_code} 지역 처리 시작 ===")
+            
+            if not self.safe_go_to(self.go_to_law_list):
+                self.logger.error(f"[{region_code}] 문서목록으로 이동 실패")
+                continue
+
+            total_docs = self._read_total_docs(region_code)
+            if total_docs is None:
+                continue
+
+            finished = self._process_pages(ceil(total_docs / self.docs_per_page), region_code)
+            self._reset_region_results()
+            if not finished:
+                break
+
+        self._finalize_results()
+
+    def _run_local_units(self):
+        """(지역, 페이지 범위) 작업 단위로 수집 - 샤드 배정분 또는 지역 규모 기반 분할, 워커가 여럿이면 병렬
+
+        시간 예산이 있으면 작은 단위로 나눠 모든 지역의 앞 페이지(최신 문서)부터 처리합니다.
+        """
+        region_urls = dict(self.region_links)
+        if self.shard:
+            counts = self._shard_counts(self._census_counts)
+            units = sharding.units_for_shard(counts, self.docs_per_page, self.shard)
+            self.logger.info(f"[{sharding.shard_name(self.shard)}] 배정 작업 {len(units)}개, "
+                             f"문서 {sum(u.docs for u in units)}건")
+        else:
+            counts = {r: c for r, c in self._census_counts().items() if r in region_urls}
+            if self.budget:
+                units = sharding.plan_units(counts, self.docs_per_page, MIN_UNIT_PAGES)
+            else:
+                units = split_units(counts, self.docs_per_page, self.region_workers)
+
+        # 지역 필터/페이지 범위 밖의 작업 제외
+        units = [u for u in units if self._in_page_range(u.start_page, u.end_page)
+                 and (not self.regions or u.region in self.regions)]
+        missing = sorted({u.region for u in units if u.region not in region_urls})
+        if missing:
+            self.logger.error(f"지역 링크 없음, 스킵: {missing}")
+        units = [u for u in units if u.region in region_urls]
+        priority = None
+        if self.budget:
+            priority = lambda u: (u.start_page, u.region)
+            units.sort(key=priority)
+            self._report_budget(sum(counts[r] for r in {u.region for u in units}))
+
+        def process_unit(scraper, unit):
+            scraper._run_unit(unit, region_urls[unit.region], counts[unit.region])
+
+        if self.region_workers > 1 and len(units) > 1:
+            run_work_units(units, self.region_workers, self._make_region_worker, process_unit, self.logger,
+                           priority=priority)
+        else:
+            for unit in units:
+                if self.out_of_time():
+                    break
+                process_unit(self, unit)
+
+    def _run_unit(self, unit, region_url: str, total_docs: int):
+        """작업 단위 1개 (지역의 start_page~end_page) 수집"""
+        if self.out_of_time():
+            return
+        self.start_url = region_url
+        self.logger.info(f"\n=== {unit.region} 페이지 {unit.start_page}~{unit.end_page} 처리 시작 ===")
+
+        if not self.safe_go_to(self.go_to_law_list):
+            self.logger.error(f"[{unit.region}] 문서목록으로 이동 실패")
+            return
+
+        self._process_pages(ceil(total_docs / self.docs_per_page), unit.region, unit.start_page, unit.end_page)
+        self._reset_region_results()
+
+    def _make_region_worker(self):
+        """지역 작업 단위 워커 (별도 드라이버, 상세 수집은 자신의 드라이버로 순차 처리)"""
+        worker = LawScraper(self.mode, logger=self.logger, use_undetected=self.use_undetected,
+                            rate_limiter=self.rate_limiter, max_workers=1, shard=self.shard,
+                            docs_per_page=self.docs_per_page, chunk_size=self.chunk_size,
+                            page_range=self.page_range, base_url=self.base_url)
+        return self._share_with_worker(worker)
+
+    def _report_budget(self, total_docs: int):
+        """시간 예산 실행 시 남은 문서 수 기준 ETA 로그"""
+        if self.budget:
+            done = self.frontier.counts(kind="detail")[DONE]
+            self.budget.report(f"{self.mode} 법령", max(0, total_docs - done))
+
+    def _collect_region_links(self, use_census: bool = True) -> bool:
+        """지역 코드/링크 수집 - 센서스 캐시가 최신이면 사용, 아니면 홈 화면의 (숨겨진) 지방 목록에서 수집"""
+        census = RegionCensus(logger=self.logger) if use_census else None
+        if census and census.cached_region_links():
+            self.region_links = census.cached_region_links()
+            self.logger.info(f"센서스 캐시에서 지역 링크 {len(self.region_links)}개 로드")
+            self._select_regions()
+            return True
+
+        self.navigate(self.start_url)
         
         try:
+            # 지역 목록은 숨겨진 상태로 DOM에 존재 → presence만 확인
+            self.wait_for(EC.presence_of_all_elements_located(
+                (By.CSS_SELECTOR, "div.list-diaphuong div.container tr:nth-child(2) li")), "region_list")
             li_tags = self.driver.find_elements(By.CSS_SELECTOR, 
                 "div.list-diaphuong div.container tr:nth-child(2) li")
             for li in li_tags:
@@ -99,87 +243,173 @@ class LawScraper(BaseScraper):
                     continue
         except Exception as e:
             self.logger.critical(f"지역 링크 수집 실패: {e}")
-            return
+            return False
 
-        # 각 지역별 처리
-        for region_code, region_url in self.region_links:
-            self.start_url = region_url
-            self.logger.info(f"\n=== {region_code} 지역 처리 시작 ===")
-            
-            if not self.safe_go_to(self.go_to_law_list):
-                self.logger.error(f"[{region_code}] 문서목록으로 이동 실패")
-                continue
+        if census and self.region_links:
+            census.set_region_links(self.region_links)
+        self._select_regions()
+        return True
 
-            try:
-                total_docs_text = self.driver.find_element(By.CSS_SELECTOR, 
-                    "div#grid_vanban div.box-container div#tabVB_lv1 div.header ul li a.selected b").text
-                total_docs = int(total_docs_text.replace(".", "").replace(",", "").strip())
-                total_pages = ceil(total_docs / self.docs_per_page)
-                self.logger.info(f"[{region_code}] 총 문서 수: {total_docs}, 총 페이지 수: {total_pages}")
-            except Exception as e:
-                self.logger.error(f"[{region_code}] 문서 수 불러오기 중 오류: {e}")
-                continue
+    def _select_regions(self):
+        """지역 필터 적용 (지정한 코드 중 없는 지역은 경고)"""
+        if not self.regions:
+            return
+        wanted = set(self.regions)
+        unknown = sorted(wanted - {code for code, _ in self.region_links})
+        if unknown:
+            self.logger.warning(f"알 수 없는 지역 코드: {unknown}")
+        self.region_links = [(code, url) for code, url in self.region_links if code in wanted]
+        self.logger.info(f"지역 필터 적용: {len(self.region_links)}개 지역")
+
+    def _in_page_range(self, start_page: int, end_page: int) -> bool:
+        """start_page~end_page가 지정한 페이지 범위와 겹치는지"""
+        if not self.page_range:
+            return True
+        lo, hi = self.page_range
+        return end_page >= lo and (hi is None or start_page <= hi)
 
-            self._process_pages(total_pages, region_code)
-            
-            # 지역별 결과 초기화
-            self.info_results = []
-            self.relations_results = []
-            self.download_link_results = []
+    def _read_total_docs(self, region_name: str):
+        """현재 목록 화면의 총 문서 수 배지 읽기 (실패 시 None)"""
+        try:
+            total_docs_text = self.driver.find_element(By.CSS_SELECTOR, 
+                "div#grid_vanban div.box-container div#tabVB_lv1 div.header ul li a.selected b").text
+            total_docs = int(total_docs_text.replace(".", "").replace(",", "").strip())
+            self.logger.info(f"[{region_name}] 총 문서 수: {total_docs}, "
+                             f"총 페이지 수: {ceil(total_docs / self.docs_per_page)}")
+            return total_docs
+        except Exception as e:
+            self.logger.error(f"[{region_name}] 문서 수 불러오기 중 오류: {e}")
+            return None
+
+    def _census_counts(self) -> Dict[str, int]:
+        """센서스 캐시의 지역별 문서 수 (오래된 지역만 병렬 갱신)"""
+        census = RegionCensus(logger=self.logger, workers=max(1, self.max_workers))
+        census.refresh(include_central=False)
+        return census.counts("local")
+
+    def _shard_counts(self, collect) -> Dict[str, int]:
+        """샤드 분할 기준 문서 수 - 스냅샷 파일이 있으면 사용, 없으면 수집 후 저장
+
+        모든 노드가 같은 스냅샷을 써야 분할이 일치하므로, 첫 노드가 저장한 파일을
+        다른 노드에 --counts로 전달하는 것을 권장합니다.
+        """
+        path = self.counts_path or sharding.COUNTS_PATH
+        counts = sharding.load_counts(path, self.mode)
+        if counts:
+            self.logger.info(f"샤드 분할 기준 문서 수 로드: {path}")
+            return counts
+        counts = collect()
+        sharding.save_counts(path, self.mode, counts)
+        self.logger.info(f"샤드 분할 기준 문서 수 저장: {path}")
+        return counts
+
+    def _reset_region_results(self):
+        """지역(작업 단위)별 누적 결과 초기화"""
+        self.info_results = []
+        self.relations_results = []
+        self.download_link_results = []
 
-        self._finalize_results()
+    def _process_pages(self, total_pages: int, region_name: str, start_page: int = 1, end_page: int = None) -> bool:
+        """페이지별 처리 공통 로직 (start_page~end_page 범위, 기본은 전체), 시간 예산으로 중단되면 False"""
 
-    def _process_pages(self, total_pages: int, region_name: str):
-        """페이지별 처리 공통 로직"""
-        PAGE_CHUNK_SIZE = 10
-        
-        # 출력 디렉토리 생성
-        output_dirs = {
-            "info": Path(self.output_dir) / "info",
-            "relation": Path(self.output_dir) / "relation", 
-            "download_link": Path(self.output_dir) / "download_link"
-        }
-        for dir_path in output_dirs.values():
-            os.makedirs(dir_path, exist_ok=True)
-
-        start_page = 1
+        end_page = min(end_page or total_pages, total_pages)
+        if self.page_range:
+            start_page = max(start_page, self.page_range[0])
+            end_page = min(end_page, self.page_range[1] or end_page)
         chunk_start_page = start_page
+        scope = f"{self.mode}:{region_name}"
+        chunk_keys = []  # 청크 저장 시 완료 처리할 목록 페이지/상세 URL
+
+        for page in range(start_page, end_page + 1):
+            page_key = listing_key(scope, page)
+            # 마감 전에 한 페이지를 끝낼 수 없으면 지금까지의 결과만 저장하고 중단
+            stop = self.out_of_time(self.docs_per_page)
+
+            if stop:
+                self.logger.warning(f"[budget] 마감 임박, {region_name} 페이지 {page}부터 다음 실행에서 재개")
+            elif self.frontier.state_of(page_key) == DONE:
+                self.logger.info(f"{region_name} 페이지 {page} 이전 실행에서 완료됨, 스킵")
+            else:
+                self.logger.info(f"\n=== {region_name} 페이지 {page}/{total_pages} ===")
+                chunk_keys.extend(self._process_page(page, scope))
+
+            # 청크 단위로 저장 → 저장된 항목만 frontier에서 완료 처리
+            if stop or page % self.chunk_size == 0 or page == end_page:
+                if chunk_keys:
+                    self._save_chunk_results(chunk_start_page, page - 1 if stop else page, region_name)
+                    self.frontier.complete(chunk_keys)
+                    chunk_keys = []
+                    self.logger.info(f"[{region_name}] 진행 상황: {self.frontier.progress(scope=scope)}")
+                chunk_start_page = page + 1
 
-        for page in range(chunk_start_page, total_pages + 1):
-            self.logger.info(f"\n=== {region_name} 페이지 {page}/{total_pages} ===")
-            
-            # 페이지별 링크 수집
-            detail_urls = self._extract_page_links(page)
-            if not detail_urls:
-                self.logger.error(f"페이지 {page} 링크 추출 실패, 스킵")
-                continue
+            if stop:
+                return False
+        return True
+
+    @timed("process_page")
+    def _process_page(self, page: int, scope: str) -> List[str]:
+        """목록 페이지 1개 처리 - 상세 URL을 frontier에 등록 후 리스하여 수집, 처리된 키 목록 반환"""
+        page_key = listing_key(scope, page)
+        self.frontier.add([page_key], kind="listing", scope=scope, page=page)
+
+        # 페이지별 링크 수집
+        detail_urls = self._extract_page_links(page)
+        if not detail_urls:
+            self.logger.error(f"페이지 {page} 링크 추출 실패, 스킵")
+            self.frontier.fail(page_key, "링크 추출 실패")
+            METRICS.inc("pages_total", result="failed")
+            return []
 
-            # 상세정보 수집
-            for i, detail_url in enumerate(detail_urls):
-                try:
-                    info, relations, download_link = self.safe_extract(
-                        self.extract_law_details, detail_url)
-                    
-                    if info:
-                        self.temp_info_results.append(info)
-                        self.logger.info(f"[{i+1}/{len(detail_urls)}] 법률정보 처리 완료")
-                    
-                    if relations:
-                        self.temp_relation_results.extend(relations)
-                        self.logger.info(f"[{i+1}/{len(detail_urls)}] 관계정보 처리 완료")
-                    
-                    if download_link:
-                        self.temp_download_link_results.extend(download_link)
-                        self.logger.info(f"[{i+1}/{len(detail_urls)}] 다운로드링크 처리 완료")
-                        
-                except Exception as e:
-                    self.logger.error(f"[페이지 {page}, 항목 {i+1}] 예외 발생: {e}")
+        # 재개 시 이미 완료된 URL은 리스되지 않음
+        self.frontier.add(detail_urls, kind="detail", scope=scope, page=page)
+        leased = self.frontier.lease(limit=len(detail_urls), kind="detail", scope=scope, page=page)
+        done_keys = []
+        retry = 0  # 실패했지만 재시도 횟수가 남아 pending으로 돌아간 상세 URL 수
 
-            # 청크 단위로 저장
-            if page % PAGE_CHUNK_SIZE == 0 or page == total_pages:
-                self._save_chunk_results(start_page, page, region_name, output_dirs)
-                chunk_start_page = page + 1
+        # 상세정보 수집 (AIMD 제어기가 정한 동시성만큼 워커 병렬 실행)
+        results = self.pool.map(
+            lambda worker, url: worker.safe_extract(worker.extract_law_details, url), leased)
+
+        for i, (detail_url, result) in enumerate(zip(leased, results)):
+            try:
+                info, relations, download_link = result or ({}, [], [])
+                
+                if info:
+                    self.temp_info_results.append(info)
+                    if relations is None or download_link is None:
+                        self.temp_incomplete_results.append(info)
+                    done_keys.append(detail_url)
+                    METRICS.inc("docs_total", result="ok")
+                    self.logger.info(f"[{i+1}/{len(leased)}] 법률정보 처리 완료")
+                else:
+                    if self.frontier.fail(detail_url, "상세정보 추출 실패") == PENDING:
+                        retry += 1
+                    METRICS.inc("docs_total", result="failed")
+                
+                if relations:
+                    self.temp_relation_results.extend(relations)
+                    self.logger.info(f"[{i+1}/{len(leased)}] 관계정보 처리 완료")
+                
+                if download_link:
+                    self.temp_download_link_results.extend(download_link)
+                    self.logger.info(f"[{i+1}/{len(leased)}] 다운로드링크 처리 완료")
+                    
+            except Exception as e:
+                self.logger.error(f"[페이지 {page}, 항목 {i+1}] 예외 발생: {e}")
+                if self.frontier.fail(detail_url, e) == PENDING:
+                    retry += 1
+
+        METRICS.inc("pages_total", result="ok")
+        if self.budget:
+            self.budget.record(len(done_keys))
+        # 재시도 대기 상세 URL이 남으면 목록 페이지를 완료 처리하지 않음 → 재개 시 다시 처리하며 남은 URL만 리스
+        if retry:
+            self.logger.warning(f"페이지 {page}: 재시도 대기 {retry}건, 다음 실행에서 다시 처리")
+        else:
+            done_keys.append(page_key)
+        return done_keys
 
+    @timed("extract_page_links")
     def _extract_page_links(self, page: int) -> List[str]:
         """페이지에서 상세 링크 추출"""
         max_retry = 3
@@ -190,14 +420,7 @@ class LawScraper(BaseScraper):
                 if not self.safe_go_to(self.go_to_law_list):
                     continue
                     
-                if page > 1:
-                    self.wait.until(lambda d: d.execute_script(
-                        "return typeof LoadPage === 'function';") == True)
-                    self.driver.execute_script("LoadPage(arguments[0]);", page)
-                
-                self.wait.until(EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "ul.listLaw > li")))
-                time.sleep(1.5)
+                self._load_list_page(page)
 
                 items = self.driver.find_elements(By.CSS_SELECTOR, "ul.listLaw > li")
                 if not items:
@@ -217,86 +440,45 @@ class LawScraper(BaseScraper):
         
         return detail_urls
 
-    def _save_chunk_results(self, start_page: int, end_page: int, region_name: str, output_dirs: Dict):
-        """청크 결과 저장"""
-        # 누적
-        self.info_results.extend(self.temp_info_results)
-        self.relations_results.extend(self.temp_relation_results)
-        self.download_link_results.extend(self.temp_download_link_results)
-
-        # 파일명 생성
-        if self.mode == "local":
-            prefix = f"{region_name}_"
+    @timed("save_chunk")
+    def _save_chunk_results(self, start_page: int, end_page: int, region_name: str):
+        """청크 결과를 저장소에 반영 (1 트랜잭션)"""
+        saved = self.store.upsert_docs(self.temp_info_results, self.temp_relation_results,
+                                       self.temp_download_link_results, incomplete=self.temp_incomplete_results)
+        if saved["info"] or saved["unchanged"] or saved["skipped"]:
+            self.logger.info(f"저장됨: [{region_name}] 페이지 {start_page:03d}~{end_page:03d} → {self.store.path} "
+                             f"(기본정보 {saved['info']}, 관계정보 {saved['relation']}, "
+                             f"다운로드링크 {saved['download_link']}, 변경 없음 {saved['unchanged']}, "
+                             f"일부 추출 실패로 유지 {saved['skipped']})")
         else:
-            prefix = ""
-            
-        filenames = {
-            "info": f"{prefix}info_output_{start_page:03d}_{end_page:03d}.csv",
-            "relation": f"{prefix}relations_output_{start_page:03d}_{end_page:03d}.csv",
-            "download_link": f"{prefix}download_link_output_{start_page:03d}_{end_page:03d}.csv"
-        }
-
-        # 저장
-        data_sets = {
-            "info": self.info_results,
-            "relation": self.relations_results, 
-            "download_link": self.download_link_results
-        }
-        
-        for key, data in data_sets.items():
-            if data:
-                df = pd.DataFrame(data)
-                file_path = output_dirs[key] / filenames[key]
-                df.to_csv(file_path, index=False, encoding='utf-8')
-                self.logger.info(f"저장됨: {file_path}")
-            else:
-                self.logger.error(f"저장할 데이터 없음: {filenames[key]}")
+            self.logger.error(f"저장할 데이터 없음: [{region_name}] 페이지 {start_page:03d}~{end_page:03d}")
 
         # 임시 결과 초기화
         self.temp_info_results = []
         self.temp_relation_results = []
         self.temp_download_link_results = []
+        self.temp_incomplete_results = []
 
     def _finalize_results(self):
         """최종 결과 처리"""
-        # 엑셀 병합
+        # 저장소 → merged_result.csv 내보내기 (관계정보, 다운로드 링크는 일련번호 포함)
         self.logger.info("info 병합 시작")
-        self.merge_excel("info", ['itemID'])
+        self.merge_excel("info")
         
         self.logger.info("relations 병합 시작")
-        self.merge_excel("relation", ['regionID', 'itemID', 'relation_itemID', '관계유형'])
+        self.merge_excel("relation")
         
         self.logger.info("download_links 병합 시작")
-        self.merge_excel("download_link", ['itemID', '다운로드 링크'])
-
-        # ID 추가
-        self._add_primary_keys()
+        self.merge_excel("download_link")
         
         # 실패 URL 저장
         self._save_failed_urls()
 
-    def _add_primary_keys(self):
-        """관계정보, 다운로드 링크에 일련번호 추가"""
-        def add_pk(file_path, pk_name="id"):
-            if not file_path.exists():
-                return
-                
-            df = pd.read_csv(file_path)
-            if pk_name in df.columns:
-                df = df.drop(columns=[pk_name])
-            df.insert(0, pk_name, range(1, len(df) + 1))
-            df.to_csv(file_path, index=False, encoding='utf-8')
-
-        merged_relation_path = Path(self.output_dir) / "relation" / "merged_result.csv"
-        merged_download_path = Path(self.output_dir) / "download_link" / "merged_result.csv"
-
-        add_pk(merged_relation_path)
-        add_pk(merged_download_path)
-
     def _save_failed_urls(self):
         """실패한 URL 저장"""
         if not self.failed_urls:
             return
+        import pandas as pd
             
         failed_path = Path(self.output_dir) / "log" / "failed_urls.csv"
         failed_path.parent.mkdir(parents=True, exist_ok=True)
@@ -318,16 +500,37 @@ class LawScraper(BaseScraper):
         self.logger.warning(f"수집 실패한 URL {len(combined)}건 저장됨: {failed_path}")
         self.failed_urls.clear()
 
+    @timed("load_list_page")
+    def _load_list_page(self, page: int):
+        """목록 페이지를 LoadPage로 전환하고 새 목록이 그려질 때까지 대기"""
+        self.wait_for(EC.presence_of_all_elements_located(
+            (By.CSS_SELECTOR, "ul.listLaw > li")), "law_list")
+        if page <= 1:
+            return
+
+        self.wait_for(lambda d: d.execute_script(
+            "return typeof LoadPage === 'function';") == True, "load_page_fn")
+        old_first = self.driver.find_element(By.CSS_SELECTOR, "ul.listLaw > li")
+        self.throttle()
+        self.driver.execute_script("LoadPage(arguments[0]);", page)
+
+        # 고정 대기 대신 기존 목록 교체 → 새 목록 렌더링 → 요청/DOM 안정 순으로 대기
+        self.wait_for(EC.staleness_of(old_first), "law_list_replaced")
+        self.wait_for(EC.presence_of_all_elements_located(
+            (By.CSS_SELECTOR, "ul.listLaw > li")), "law_list")
+        self.wait_settled("law_list_ready")
+
     # ===== 기존 메서드들 =====
     
+    @timed("go_to_law_list")
     def go_to_law_list(self):
         """법률 목록까지 이동"""
         try:
-            self.driver.get(self.start_url)
+            self.navigate(self.start_url)
 
             # "Văn bản quy phạm pháp luật" 클릭
-            law_button = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH, '//a[contains(text(), "Văn bản quy phạm pháp luật")]')))
+            law_button = self.wait_for(EC.element_to_be_clickable(
+                (By.XPATH, '//a[contains(text(), "Văn bản quy phạm pháp luật")]')), "law_button")
             law_button.click()
 
             # 기존 항목 수 파악
@@ -335,12 +538,14 @@ class LawScraper(BaseScraper):
             initial_count = len(initial_items)
 
             # "Tìm kiếm" 클릭
-            search_button = self.wait.until(EC.element_to_be_clickable((By.ID, "searchSubmit")))
+            search_button = self.wait_for(EC.element_to_be_clickable((By.ID, "searchSubmit")), "search_button")
+            self.throttle()
             search_button.click()
 
             # 결과 로딩 대기
-            self.wait.until(lambda d: len(d.find_elements(By.CSS_SELECTOR, "ul.listLaw > li")) != initial_count)
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.listLaw > li")))
+            self.wait_for(lambda d: len(d.find_elements(By.CSS_SELECTOR, "ul.listLaw > li")) != initial_count,
+                          "search_result")
+            self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.listLaw > li")), "law_list")
 
             return True
 
@@ -348,9 +553,10 @@ class LawScraper(BaseScraper):
             self.logger.critical(f"법률 목록 이동 실패: {e}")
             return False
 
+    @timed("extract_law_details")
     def extract_law_details(self, law_url):
-        """법령 상세정보 추출"""
-        self.driver.get(law_url)
+        """법령 상세정보 추출 - (기본정보, 관계정보, 다운로드링크), 관계정보/다운로드링크 추출 실패는 None"""
+        self.navigate(law_url)
 
         try:
             parsed_url = urlparse(law_url)
@@ -376,15 +582,17 @@ class LawScraper(BaseScraper):
 
             # "Thuộc tính" 탭 클릭
             try:
-                tab_list = self.wait.until(EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "div.header ul li a")))
-                for tab in tab_list:
-                    if "Thuộc tính" in tab.text or "properties" in tab.get_attribute("innerHTML"):
-                        tab.click()
-                        break
-                else:
-                    self.logger.critical(f"Thuộc tính 탭을 찾을 수 없습니다: {law_url}")
-                    return {}, [], []
+                with METRICS.timer("open_properties_tab"):
+                    tab_list = self.wait_for(EC.presence_of_all_elements_located(
+                        (By.CSS_SELECTOR, "div.header ul li a")), "detail_tabs")
+                    for tab in tab_list:
+                        if "Thuộc tính" in tab.text or "properties" in tab.get_attribute("innerHTML"):
+                            self.throttle()
+                            tab.click()
+                            break
+                    else:
+                        self.logger.critical(f"Thuộc tính 탭을 찾을 수 없습니다: {law_url}")
+                        return {}, [], []
             except Exception as e:
                 self.logger.critical(f"tab_list를 불러오는데 실패: {law_url} | {e}")
                 return {}, [], []
@@ -404,10 +612,12 @@ class LawScraper(BaseScraper):
             self.logger.critical(f"알 수 없는 오류 발생: {law_url} | {e}")
             return {}, [], []
 
+    @timed("extract_properties")
     def _extract_properties(self, info: Dict, law_url: str):
         """속성 정보 추출"""
         try:
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.vbProperties table")))
+            self.wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, "div.vbProperties table")),
+                          "properties_table")
             table = self.driver.find_element(By.CSS_SELECTOR, "div.vbProperties table")
             rows = table.find_elements(By.TAG_NAME, "tr")
             
@@ -469,7 +679,7 @@ class LawScraper(BaseScraper):
             self.logger.info(f"속성 테이블 처리 실패, 최소정보만 수집: {law_url} | {e}")
             # Toàn văn에서 최소정보 수집
             try:
-                self.driver.back()
+                self.navigate_back()
                 div = self.driver.find_element(By.XPATH, "//div[contains(text(), 'Số:')]")
                 info["문서코드"] = div.text.strip().replace("Số: ", "", 1)
 
@@ -495,11 +705,18 @@ class LawScraper(BaseScraper):
             except Exception as fallback_e:
                 self.logger.error(f"최소정보 수집도 실패: {law_url} | {fallback_e}")
 
-    def _extract_download_links(self, info: Dict, law_url: str) -> List[Dict]:
-        """다운로드 링크 추출"""
+    @timed("extract_download_links")
+    def _extract_download_links(self, info: Dict, law_url: str) -> Optional[List[Dict]]:
+        """다운로드 링크 추출 (다운로드 영역이 없으면 [], 추출 실패 시 None - '링크 없음'과 구분)"""
         download_link = []
         try:
             download_div = self.driver.find_element(By.ID, "divShowDialogDownload")
+        except NoSuchElementException:
+            return download_link
+        except Exception as e:
+            self.logger.error(f"다운로드 링크 영역 불러오기 실패: {law_url} | {e}")
+            return None
+        try:
             file_links = download_div.find_elements(By.CSS_SELECTOR, "ul.fileAttack a.show_hide")
 
             download_priority = {"doc": 1, "docx": 1, "pdf": 2, "zip": 3, "rar": 4}
@@ -515,7 +732,7 @@ class LawScraper(BaseScraper):
                         priority = download_priority[ext]
                         if priority not in file_groups:
                             file_groups[priority] = []
-                        full_url = urljoin("https://vbpl.vn", file_url)
+                        full_url = urljoin(self.base_url, file_url)
                         file_groups[priority].append(full_url)
 
             # 가장 우선순위가 높은 그룹 선택
@@ -530,42 +747,45 @@ class LawScraper(BaseScraper):
                 break
 
         except Exception as e:
-            self.logger.info(f"다운로드 링크 추출 중 오류: {law_url} | {e}")
+            self.logger.error(f"다운로드 링크 추출 중 오류: {law_url} | {e}")
+            return None
         
         return download_link
 
-    def _extract_relations(self, info: Dict, law_url: str) -> List[Dict]:
-        """관계정보 추출"""
+    @timed("extract_relations")
+    def _extract_relations(self, info: Dict, law_url: str) -> Optional[List[Dict]]:
+        """관계정보 추출 (탭/테이블을 불러오지 못하면 None - 관계정보가 없는 문서의 []와 구분)"""
         relations = []
         
         # "VB liên quan" 탭 클릭
         try:
-            tab_list = self.wait.until(EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, "div.header ul li a")))
+            tab_list = self.wait_for(EC.presence_of_all_elements_located(
+                (By.CSS_SELECTOR, "div.header ul li a")), "detail_tabs")
             related_tab = next((tab for tab in tab_list if "VB liên quan" in tab.text), None)
 
             if not related_tab:
                 self.logger.error(f"VB liên quan 탭을 찾을 수 없음: {law_url}")
-                return []
+                return None
 
+            self.throttle()
             related_tab.click()
 
         except Exception as e:
             self.logger.error(f"VB liên quan 탭 클릭 실패: {law_url} | {e}")
-            return []
+            return None
 
         # 관계 테이블 로드 대기
         for i in range(1, 4):
             try:
-                self.wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div.vbLienQuan div.content table")))
+                self.wait_for(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "div.vbLienQuan div.content table")), "relation_table")
                 break
             except Exception as ex:
                 self.logger.info(f"관계정보 테이블 로딩 재시도({i}/3): {ex}")
                 time.sleep(2)
         else:
             self.logger.error(f"관계정보 테이블 로딩 실패: {law_url}")
-            return []
+            return None
 
         # 신규문서코드
         law_new_doc_code = info.get("문서코드", "-")
@@ -578,7 +798,7 @@ class LawScraper(BaseScraper):
             rows = tbody.find_elements(By.TAG_NAME, "tr")
         except Exception as e:
             self.logger.error(f"관계유형 테이블 요소 불러오기 실패: {law_url} | {e}")
-            return []
+            return None
 
         for row in rows:
             try:
@@ -602,7 +822,7 @@ class LawScraper(BaseScraper):
                         relation_itemID = "-"
 
                         if href:
-                            abs_url = urljoin("https://vbpl.vn", href)
+                            abs_url = urljoin(self.base_url, href)
                             p = urlparse(abs_url)
                             q = {k.lower(): v for k, v in parse_qs(p.query).items()}
                             item_id = (q.get("itemid", [None])[0] or "").strip()
@@ -645,13 +865,7 @@ class LawScraper(BaseScraper):
             for retry in range(max_retry):
                 try:
                     self.go_to_law_list()
-                    if page > 1:
-                        self.wait.until(lambda d: d.execute_script(
-                            "return typeof LoadPage === 'function';") == True)
-                        self.driver.execute_script("LoadPage(arguments[0]);", page)
-                    self.wait.until(EC.presence_of_all_elements_located(
-                        (By.CSS_SELECTOR, "ul.listLaw > li")))
-                    time.sleep(1.5)
+                    self._load_list_page(page)
 
                     items = self.driver.find_elements(By.CSS_SELECTOR, "ul.listLaw > li")
                     if not items:
@@ -0,0 +1,132 @@
+# 호스트별 토큰버킷 기반 요청 속도 제한기 (스레드/프로세스 공유)
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# 호스트별 기본 속도 (초당 토큰 수, 최대 버스트)
+DEFAULT_RATES = {
+    "vbpl.vn": (1.0, 3),
+    "chinhphu.vn": (1.0, 3),
+}
+DEFAULT_RATE = (1.0, 2)
+STATE_DIR = "output/.ratelimit"
+
+
+def host_of(url: str) -> str:
+    """URL에서 호스트명 추출 (www. 제거)"""
+    host = urlparse(url).hostname or url
+    return host[4:] if host.startswith("www.") else host
+
+
+class RateLimiter:
+    """호스트별 토큰버킷 - 상태를 파일에 두고 파일 잠금으로 프로세스 간 공유"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, state_dir: str = STATE_DIR, rates: dict = None, default_rate=DEFAULT_RATE):
+        self.state_dir = Path(state_dir)
+        self.rates = dict(DEFAULT_RATES)
+        self.rates.update(rates or {})
+        self.default_rate = default_rate
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    @classmethod
+    def shared(cls, state_dir: str = STATE_DIR) -> "RateLimiter":
+        """같은 상태 디렉토리를 쓰는 프로세스 내 공용 인스턴스"""
+        with cls._shared_lock:
+            if state_dir not in cls._shared:
+                cls._shared[state_dir] = cls(state_dir)
+            return cls._shared[state_dir]
+
+    def set_rate(self, host: str, rate: float, burst: int):
+        """호스트 속도 변경 (초당 요청 수, 최대 버스트)"""
+        self.rates[host] = (rate, burst)
+
+    def acquire(self, url_or_host: str, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기 후 대기한 시간(초) 반환"""
+        host = host_of(url_or_host) if "/" in url_or_host else url_or_host
+        rate, burst = self.rates.get(host, self.default_rate)
+        waited = 0.0
+
+        while True:
+            with self._locked_state(host) as state:
+                now = time.time()
+                elapsed = max(0.0, now - state.get("updated", now))
+                available = min(float(burst), state.get("tokens", float(burst)) + elapsed * rate)
+
+                if available >= tokens:
+                    state["tokens"] = available - tokens
+                    state["updated"] = now
+                    return waited
+
+                # 다른 프로세스가 기다리는 동안 쌓인 토큰을 잃지 않도록 갱신만 기록
+                state["tokens"] = available
+                state["updated"] = now
+                need = (tokens - available) / rate
+
+            time.sleep(need)
+            waited += need
+
+    def _thread_lock(self, host: str) -> threading.Lock:
+        with self._locks_guard:
+            if host not in self._locks:
+                self._locks[host] = threading.Lock()
+            return self._locks[host]
+
+    @contextmanager
+    def _locked_state(self, host: str):
+        """호스트 상태 파일을 잠근 상태로 읽고, 블록 종료 시 기록"""
+        path = self.state_dir / f"{host}.json"
+        with self._thread_lock(host):
+            with open(path, "a+", encoding="utf-8") as f:
+                _lock_file(f)
+                try:
+                    f.seek(0)
+                    raw = f.read()
+                    try:
+                        state = json.loads(raw) if raw else {}
+                    except ValueError:
+                        state = {}
+
+                    yield state
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    _unlock_file(f)
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
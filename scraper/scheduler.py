@@ -0,0 +1,105 @@
+# 지역 규모 기반 작업 분할, 큰 작업 우선(LPT) 배정 및 작업 훔치기(work stealing) 스케줄러
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+
+from scraper.sharding import plan_units, assign_units
+
+# 워커당 작업 단위 수 목표 - 클수록 균형이 좋아지지만 목록 재진입 비용이 늘어남
+UNITS_PER_WORKER = 4
+MIN_UNIT_PAGES = 10
+
+
+def split_units(region_counts: dict, docs_per_page: int, workers: int,
+                min_unit_pages: int = MIN_UNIT_PAGES) -> list:
+    """전체 작업량/워커 수 기준으로 큰 지역을 페이지 범위 단위로 분할"""
+    total_pages = sum(ceil(int(c or 0) / docs_per_page) for c in region_counts.values())
+    unit_pages = max(min_unit_pages, ceil(total_pages / max(1, workers * UNITS_PER_WORKER)))
+    return plan_units(region_counts, docs_per_page, unit_pages)
+
+
+def assign_largest_first(units: list, workers: int, priority=None) -> list:
+    """큰 작업부터 현재 부하가 가장 적은 워커에 배정 (워커별로 priority 순, 기본은 큰 작업 순 정렬)"""
+    key = priority or (lambda u: -u.docs)
+    return [sorted(bucket, key=key) for bucket in assign_units(units, workers)]
+
+
+class WorkStealingScheduler:
+    """워커별 작업 큐 - 자기 큐가 비면 남은 작업량이 가장 많은 워커의 큐 끝에서 훔쳐옴"""
+
+    def __init__(self, assignments: list):
+        self.queues = [deque(bucket) for bucket in assignments]
+        self._lock = threading.Lock()
+        self.steals = 0
+
+    def next(self, worker: int):
+        with self._lock:
+            own = self.queues[worker]
+            if own:
+                return own.popleft()
+
+            victim = max(range(len(self.queues)),
+                         key=lambda k: sum(u.docs for u in self.queues[k]))
+            if not self.queues[victim]:
+                return None
+            self.steals += 1
+            return self.queues[victim].pop()
+
+    def remaining_docs(self) -> int:
+        with self._lock:
+            return sum(u.docs for q in self.queues for u in q)
+
+
+def run_work_units(units: list, workers: int, worker_factory, process_unit, logger=None, priority=None) -> dict:
+    """작업 단위를 워커 수만큼 병렬 처리 (LPT 배정 + work stealing), 실행 통계 반환
+
+    worker_factory(): 워커별 스크래퍼 생성 (close() 필요)
+    process_unit(scraper, unit): 작업 단위 1개 처리
+    priority: 워커별 처리 순서 키 (기본은 큰 작업 먼저)
+    """
+    logger = logger or logging.getLogger(__name__)
+    workers = max(1, min(workers, len(units)))
+    assignments = assign_largest_first(units, workers, priority)
+    scheduler = WorkStealingScheduler(assignments)
+    busy = [0.0] * workers
+    done_docs = [0] * workers
+
+    total_docs = sum(u.docs for u in units)
+    logger.info(f"[scheduler] 작업 {len(units)}개, 문서 {total_docs}건, 워커 {workers}개 "
+                f"(이상적 makespan ≈ 워커당 {total_docs / workers:.0f}건)")
+
+    def work(idx):
+        scraper = worker_factory()
+        try:
+            while True:
+                unit = scheduler.next(idx)
+                if unit is None:
+                    return
+                started = time.monotonic()
+                try:
+                    process_unit(scraper, unit)
+                except Exception as e:
+                    logger.error(f"[scheduler] 워커 {idx} 작업 실패: {unit} | {e}")
+                busy[idx] += time.monotonic() - started
+                done_docs[idx] += unit.docs
+        finally:
+            scraper.close()
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="region-worker") as ex:
+        for f in [ex.submit(work, i) for i in range(workers)]:
+            try:
+                f.result()
+            except Exception as e:
+                logger.error(f"[scheduler] 워커 오류: {e}")
+    makespan = time.monotonic() - started
+
+    stats = {"workers": workers, "units": len(units), "docs": total_docs, "steals": scheduler.steals,
+             "makespan": makespan, "busy": busy, "docs_per_worker": done_docs}
+    logger.info(f"[scheduler] 완료 makespan={makespan:.0f}s, 훔친 작업 {scheduler.steals}개, "
+                f"워커별 문서 {done_docs}")
+    return stats
@@ -0,0 +1,138 @@
+# 여러 머신에 크롤링을 나누기 위한 결정적 샤딩 및 샤드 결과 병합
+
+import json
+import os
+import re
+import shutil
+from collections import namedtuple
+from math import ceil
+from pathlib import Path
+
+import logging
+
+# 지역/페이지 범위 작업 단위
+WorkUnit = namedtuple("WorkUnit", ["region", "start_page", "end_page", "docs"])
+
+UNIT_PAGES = 50
+COUNTS_PATH = "output/shards/counts.json"
+SUBFOLDERS = ("info", "relation", "download_link")
+
+
+def parse_shard(text: str) -> tuple:
+    """'i/N' 형식(1부터 시작) 파싱 → (i, N)"""
+    m = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", text or "")
+    if not m:
+        raise ValueError(f"샤드 형식 오류 (예: 1/4): {text}")
+    index, count = int(m.group(1)), int(m.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드 번호 범위 오류: {text}")
+    return index, count
+
+
+def shard_name(shard: tuple) -> str:
+    return f"shard_{shard[0]:02d}_of_{shard[1]:02d}"
+
+
+def shard_output_dir(mode: str, shard: tuple) -> str:
+    """샤드 전용 출력 디렉토리"""
+    return f"output/{mode}_law/shards/{shard_name(shard)}"
+
+
+def plan_units(region_counts: dict, docs_per_page: int, unit_pages: int = UNIT_PAGES) -> list:
+    """지역별 문서 수를 unit_pages 페이지 단위 작업으로 분할"""
+    units = []
+    for region in sorted(region_counts):
+        total_docs = int(region_counts[region] or 0)
+        total_pages = ceil(total_docs / docs_per_page)
+        for start in range(1, total_pages + 1, unit_pages):
+            end = min(start + unit_pages - 1, total_pages)
+            docs = min(total_docs - (start - 1) * docs_per_page, (end - start + 1) * docs_per_page)
+            units.append(WorkUnit(region, start, end, docs))
+    return units
+
+
+def assign_units(units: list, count: int) -> list:
+    """문서 수 기준 큰 작업부터 가장 가벼운 샤드에 배정 (결정적), 샤드별 작업 목록 반환"""
+    loads = [0] * count
+    assigned = [[] for _ in range(count)]
+    for unit in sorted(units, key=lambda u: (-u.docs, u.region, u.start_page)):
+        target = min(range(count), key=lambda k: (loads[k], k))
+        assigned[target].append(unit)
+        loads[target] += unit.docs
+    for bucket in assigned:
+        bucket.sort(key=lambda u: (u.region, u.start_page))
+    return assigned
+
+
+def units_for_shard(region_counts: dict, docs_per_page: int, shard: tuple,
+                    unit_pages: int = UNIT_PAGES) -> list:
+    """해당 샤드가 맡을 작업 목록"""
+    index, count = shard
+    return assign_units(plan_units(region_counts, docs_per_page, unit_pages), count)[index - 1]
+
+
+def load_counts(path, mode: str) -> dict:
+    """문서 수 스냅샷에서 모드별 지역 문서 수 로드 (없으면 빈 dict)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return {k: int(v) for k, v in json.load(f).get(mode, {}).items()}
+
+
+def save_counts(path, mode: str, region_counts: dict):
+    """모든 노드가 같은 분할을 쓰도록 모드별 문서 수 스냅샷 저장"""
+    path = Path(path)
+    data = {}
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    data[mode] = region_counts
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def merge_shards(mode: str, logger=None) -> bool:
+    """output/{mode}_law/shards/*/ 결과를 표준 output/{mode}_law/*/merged_result.csv 구조로 병합
+
+    샤드 결과 CSV를 output/{mode}_law/store.sqlite에 가져온 뒤 저장소에서 내보냅니다 (이미 가져온 파일은 생략).
+    """
+    from storage import DocStore, STORE_NAME, read_table, table_exists
+
+    logger = logger or logging.getLogger(__name__)
+    base = Path(f"output/{mode}_law")
+    shard_dirs = sorted(p for p in (base / "shards").glob("shard_*") if p.is_dir())
+    if not shard_dirs:
+        logger.info(f"[merge_shards] 샤드 결과 없음: {base / 'shards'}")
+        return False
+
+    store = DocStore(base / STORE_NAME, logger=logger)
+    for sub in SUBFOLDERS:
+        target = base / sub
+        os.makedirs(target, exist_ok=True)
+        for shard_dir in shard_dirs:
+            src = shard_dir / sub / "merged_result.csv"
+            if src.exists():
+                shutil.copy2(src, target / f"{shard_dir.name}.csv")
+            elif table_exists(src):
+                store.import_frame(sub, read_table(src, table=sub))  # Parquet으로만 저장한 샤드
+            else:
+                logger.warning(f"[merge_shards] {shard_dir.name}에 {sub} 결과 없음")
+        store.sync_dir(sub, target)
+
+    # 실패 URL도 합쳐서 다음 업데이트/재시도에 반영
+    failed = []
+    for shard_dir in shard_dirs:
+        path = shard_dir / "log" / "failed_urls.csv"
+        if path.exists():
+            failed.extend(line.strip() for line in path.read_text(encoding="utf-8").splitlines()[1:])
+    if failed:
+        failed_path = base / "log" / "failed_urls.csv"
+        failed_path.parent.mkdir(parents=True, exist_ok=True)
+        if failed_path.exists():
+            failed = failed_path.read_text(encoding="utf-8").splitlines()[1:] + failed
+        failed_path.write_text("url\n" + "\n".join(sorted(set(u for u in failed if u))) + "\n", encoding="utf-8")
+
+    logger.info(f"[merge_shards] {mode}: 샤드 {len(shard_dirs)}개 병합 완료")
+    return True
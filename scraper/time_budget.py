@@ -0,0 +1,108 @@
+# 실행 시간 예산 - 마감 시각, 측정 처리량(docs/sec), 남은 작업 ETA
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+STATS_PATH = "output/log/throughput.json"
+# 마감 전 병합/저장을 위해 남겨두는 시간 (초, 예산의 10%를 넘지 않음)
+DEFAULT_RESERVE = 600
+# 측정값이 없을 때 사용할 처리량 (docs/sec)
+DEFAULT_RATE = 0.2
+
+
+def parse_duration(text) -> float:
+    """'8h', '90m', '1h30m', '3600' 형식 → 초"""
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text).strip().lower()
+    if re.fullmatch(r"\d+(\.\d+)?", text):
+        return float(text)
+    parts = re.findall(r"(\d+(?:\.\d+)?)\s*([hms])", text)
+    if not parts or "".join(n + u for n, u in parts) != re.sub(r"\s+", "", text):
+        raise ValueError(f"시간 형식 오류 (예: 8h, 90m, 1h30m): {text}")
+    unit = {"h": 3600, "m": 60, "s": 1}
+    return sum(float(n) * unit[u] for n, u in parts)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = max(0, int(seconds))
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+class TimeBudget:
+    """마감 시각까지 남은 시간과 측정 처리량으로 작업 가능 여부를 판단
+
+    처리량은 이번 실행에서 측정한 값을 쓰고, 측정 전에는 이전 실행에서 저장한 값을 사용합니다.
+    여러 스크래퍼/워커 스레드가 하나의 인스턴스를 공유합니다.
+    """
+
+    def __init__(self, seconds: float, reserve: float = DEFAULT_RESERVE, stats_path=STATS_PATH, logger=None):
+        self.seconds = float(seconds)
+        self.reserve = min(reserve, self.seconds * 0.1)
+        self.started = time.monotonic()
+        self.deadline = self.started + self.seconds - self.reserve
+        self.stats_path = Path(stats_path)
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.docs = 0
+        self._prior_rate = self._load_rate()
+
+    def _load_rate(self):
+        try:
+            return float(json.loads(self.stats_path.read_text(encoding="utf-8"))["docs_per_sec"])
+        except Exception:
+            return None
+
+    def save(self):
+        """측정 처리량 저장 (다음 실행의 초기 ETA 계산용)"""
+        if not self.docs:
+            return
+        os.makedirs(self.stats_path.parent, exist_ok=True)
+        self.stats_path.write_text(json.dumps({"docs_per_sec": self.rate(), "docs": self.docs,
+                                               "elapsed": self.elapsed()}, indent=2), encoding="utf-8")
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        """작업에 쓸 수 있는 남은 시간 (초)"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def record(self, docs: int):
+        """처리 완료 문서 수 기록"""
+        with self._lock:
+            self.docs += docs
+
+    def rate(self) -> float:
+        """처리량 (docs/sec) - 이번 실행 측정값 우선"""
+        elapsed = self.elapsed()
+        if self.docs and elapsed > 0:
+            return self.docs / elapsed
+        return self._prior_rate or DEFAULT_RATE
+
+    def eta(self, docs: int) -> float:
+        """docs건 처리 예상 소요 시간 (초)"""
+        return docs / self.rate()
+
+    def allows(self, docs: int) -> bool:
+        """남은 시간 안에 docs건을 끝낼 수 있는지"""
+        remaining = self.remaining()
+        return remaining > 0 and self.eta(docs) <= remaining
+
+    def report(self, name: str, remaining_docs: int):
+        """남은 작업 ETA와 남은 예산 비교 로그"""
+        eta = self.eta(remaining_docs)
+        msg = (f"[budget] {name}: 남은 문서 {remaining_docs}건, 처리량 {self.rate():.2f} docs/s, "
+               f"ETA {format_duration(eta)} / 남은 예산 {format_duration(self.remaining())}")
+        if eta > self.remaining():
+            self.logger.warning(msg + " → 마감 시 중단 후 다음 실행에서 이어서 수집")
+        else:
+            self.logger.info(msg)
@@ -0,0 +1,155 @@
+# 선택자/사이트별 대기시간 학습 및 명시적 준비상태(readiness) 조건
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+
+# DOM 변경 감시용 MutationObserver 설치 + 마지막 변경 이후 경과시간(ms) 반환
+# 노드 추가/삭제만 감시 (속성 변경은 캐러셀, 스피너 등이 계속 일으켜 안정되지 않음)
+_DOM_QUIET_JS = """
+if (!window.__vsObserver) {
+    window.__vsLastMutation = performance.now();
+    window.__vsObserver = new MutationObserver(function () {
+        window.__vsLastMutation = performance.now();
+    });
+    window.__vsObserver.observe(document.documentElement, {childList: true, subtree: true});
+    return 0;
+}
+return performance.now() - window.__vsLastMutation;
+"""
+
+# 문서 로딩, jQuery ajax, ASP.NET 비동기 포스트백이 모두 끝났는지 확인
+_NETWORK_IDLE_JS = """
+if (document.readyState !== 'complete') return false;
+if (window.jQuery && window.jQuery.active > 0) return false;
+try {
+    if (window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack()) return false;
+} catch (e) {}
+return true;
+"""
+
+
+def network_idle(driver):
+    """readiness 조건 - 진행 중인 요청이 없음"""
+    return driver.execute_script(_NETWORK_IDLE_JS) is True
+
+
+def dom_quiet(quiet_ms: int = 300):
+    """readiness 조건 - quiet_ms 동안 DOM 변경이 없음"""
+    def _condition(driver):
+        return (driver.execute_script(_DOM_QUIET_JS) or 0) >= quiet_ms
+    return _condition
+
+
+def page_ready(quiet_ms: int = 300):
+    """readiness 조건 - 네트워크 유휴 + DOM 안정"""
+    quiet = dom_quiet(quiet_ms)
+    def _condition(driver):
+        return network_idle(driver) and quiet(driver)
+    return _condition
+
+
+class WaitPolicy:
+    """키(사이트|선택자)별 관측 지연시간을 기록하고 백분위수로 타임아웃을 산출
+
+    표본이 min_samples 미만이면 default_timeout을 쓰고, 이후에는
+    percentile 지연시간 × margin 을 [min_timeout, max_timeout] 범위로 제한해 사용합니다.
+    min_timeout은 기존 고정 대기(10초) - 빠른 응답이 이어져도 타임아웃을 그보다 줄이지 않음
+    (타임아웃은 AIMD 제어기에서 동시성을 절반으로 줄이는 신호)
+    """
+
+    def __init__(self, default_timeout=10, min_timeout=10.0, max_timeout=60.0, percentile=0.95,
+                 margin=1.5, min_samples=20, window=200, stats_path=None, poll_frequency=0.1,
+                 logger=None):
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.window = window
+        self.poll_frequency = poll_frequency
+        self.stats_path = Path(stats_path) if stats_path else None
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._samples = {}
+        self._timeouts = {}
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self._load()
+
+    def timeout_for(self, key: str) -> float:
+        """키에 대한 현재 타임아웃(초)"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return self.default_timeout
+        idx = min(len(samples) - 1, int(len(samples) * self.percentile))
+        return min(self.max_timeout, max(self.min_timeout, samples[idx] * self.margin))
+
+    def until(self, driver, condition, key: str, timeout: float = None):
+        """condition이 참이 될 때까지 대기하고 소요시간을 기록"""
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        limit = timeout if timeout is not None else self.timeout_for(key)
+        started = time.monotonic()
+        try:
+            result = WebDriverWait(driver, limit, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            # 타임아웃은 관측값의 하한이므로 그대로 기록 → 다음 타임아웃이 늘어남
+            self.record(key, time.monotonic() - started, timed_out=True)
+            raise
+        self.record(key, time.monotonic() - started)
+        return result
+
+    def record(self, key: str, elapsed: float, timed_out: bool = False):
+        with self._lock:
+            samples = self._samples.setdefault(key, deque(maxlen=self.window))
+            samples.append(elapsed)
+            if timed_out:
+                self._timeouts[key] = self._timeouts.get(key, 0) + 1
+            self._dirty += 1
+            flush = self._dirty >= 50
+        if flush:
+            self.save()
+
+    def stats(self) -> dict:
+        """키별 표본 수, 타임아웃 횟수, 현재 타임아웃"""
+        with self._lock:
+            keys = list(self._samples)
+        return {k: {"samples": len(self._samples[k]),
+                    "timeouts": self._timeouts.get(k, 0),
+                    "timeout": round(self.timeout_for(k), 2)} for k in keys}
+
+    def save(self):
+        """관측값을 파일로 저장 (다음 실행에서 재사용)"""
+        if not self.stats_path:
+            return
+        with self._lock:
+            data = {"samples": {k: list(v) for k, v in self._samples.items()},
+                    "timeouts": dict(self._timeouts)}
+            self._dirty = 0
+        try:
+            os.makedirs(self.stats_path.parent, exist_ok=True)
+            tmp = self.stats_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.stats_path)
+        except Exception as e:
+            self.logger.warning(f"[WaitPolicy] 대기시간 통계 저장 실패: {e}")
+
+    def _load(self):
+        if not self.stats_path or not self.stats_path.exists():
+            return
+        try:
+            data = json.loads(self.stats_path.read_text(encoding="utf-8"))
+            for key, values in data.get("samples", {}).items():
+                self._samples[key] = deque(values, maxlen=self.window)
+            self._timeouts = dict(data.get("timeouts", {}))
+        except Exception as e:
+            self.logger.warning(f"[WaitPolicy] 대기시간 통계 로드 실패: {e}")
@@ -0,0 +1,5 @@
+# search/__init__.py
+from search.corpus import Corpus, TableIndex, QueryError
+from search.fulltext import FullTextIndex, fold, tokenize
+from search.graph import RelationGraph
+from search.server import SearchService, make_server, serve
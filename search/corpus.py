@@ -0,0 +1,310 @@
+### search/corpus.py ###
+# law_combined 출력의 메모리 인덱스 - 조회할 때마다 CSV를 읽지 않도록 한 번 읽어 인덱스로 보관
+#
+#   해시 인덱스  : 값 → 행 번호 (itemID/docid, 문서코드)
+#   정렬 인덱스  : 날짜(일 단위 정수) 정렬 + searchsorted 범위 조회 (발행일, 발효일)
+#   포스팅 목록  : 값 → 정렬된 행 번호 배열, 여러 조건은 교집합 (발급기관, 문서유형, ...)
+#   제목 검색    : q=검색어 - search.fulltext 인덱스(BM25)의 문서 키 → 행 번호, 점수 순 (_score)
+#                  다른 조건은 점수 계산 전에 적용 (상위 N건만 거르지 않음, total은 전체 일치 수)
+#
+#   corpus = Corpus.load()
+#   corpus.query("info", {"발급기관": "Chính phủ", "발행일_from": "2020-01-01", "sort": "-발행일", "limit": 20})
+#   corpus.query("info", {"q": "nghi dinh thue", "유효상태": "Còn hiệu lực"})
+
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from storage import read_table, table_exists
+from storage.schema import ID, dtype_of
+
+# 테이블 → 인덱스 종류별 컬럼 (출력에 없는 컬럼은 건너뜀)
+INDEXES = {
+    "info": {
+        "hash": ["itemID", "문서코드"],
+        "sorted": ["발행일", "발효일"],
+        "postings": ["regionID", "발급기관", "문서유형", "유효상태"],
+    },
+    "directive": {
+        "hash": ["docid", "문서코드"],
+        "sorted": ["발행일", "발효일"],
+        "postings": ["발급기관", "문서유형"],
+    },
+}
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 1000
+_NO_DATE = np.iinfo(np.int64).max  # 날짜 없음 (정렬 시 맨 뒤)
+_EMPTY = np.array([], dtype=np.int64)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class QueryError(ValueError):
+    """잘못된 조회 조건 (HTTP 400)"""
+
+
+def norm_text(value) -> str:
+    """문자열 조건 정규화 (앞뒤 공백, 대소문자 무시)"""
+    return str(value).strip().casefold()
+
+
+def _norm_value(col: str, table: str, value):
+    if dtype_of(col, table) == ID:
+        try:
+            return int(str(value).strip())
+        except ValueError:
+            raise QueryError(f"{col}은 정수여야 합니다: {value}")
+    return norm_text(value)
+
+
+def _groups(s: pd.Series, table: str) -> dict:
+    """값 → 정렬된 행 번호 배열 (빈 값 제외)"""
+    if dtype_of(s.name, table) != ID:
+        s = s.astype("string").str.strip().str.casefold()
+    s = s.reset_index(drop=True)
+    s = s[s.notna()]
+    return {k: v.astype(np.int64) for k, v in s.groupby(s, sort=False).indices.items()} if len(s) else {}
+
+
+def to_days(values) -> np.ndarray:
+    """'YYYY-MM-DD' → 1970-01-01 기준 일수 (형식이 다르거나 빈 값은 _NO_DATE)"""
+    dates = pd.to_datetime(pd.Series(values, dtype="string"), format="%Y-%m-%d", errors="coerce")
+    days = dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+    days[dates.isna().to_numpy()] = _NO_DATE
+    return days
+
+
+class SortedIndex:
+    """날짜 컬럼 정렬 인덱스 - 범위 조회는 이진 탐색, 행별 값은 후보 필터/정렬에 사용"""
+
+    def __init__(self, values):
+        self.by_row = to_days(values)
+        valid = np.flatnonzero(self.by_row != _NO_DATE)
+        order = np.argsort(self.by_row[valid], kind="stable")
+        self.rows = valid[order]
+        self.keys = self.by_row[self.rows]
+
+    def range(self, lo: int = None, hi: int = None) -> np.ndarray:
+        """lo <= 값 <= hi 인 행 번호 (날짜 순)"""
+        start = 0 if lo is None else np.searchsorted(self.keys, lo, "left")
+        end = len(self.keys) if hi is None else np.searchsorted(self.keys, hi, "right")
+        return self.rows[start:end]
+
+    def mask(self, rows: np.ndarray, lo: int = None, hi: int = None) -> np.ndarray:
+        values = self.by_row[rows]
+        keep = values != _NO_DATE
+        if lo is not None:
+            keep &= values >= lo
+        if hi is not None:
+            keep &= values <= hi
+        return rows[keep]
+
+
+def _day(col: str, value) -> int:
+    """조회 조건 날짜 → 일수 (pandas를 거치지 않아 빠름)"""
+    value = str(value).strip()
+    try:
+        if len(value) != 10:
+            raise ValueError(value)
+        return int(np.datetime64(value, "D").astype(np.int64))
+    except ValueError:
+        raise QueryError(f"{col} 날짜 형식 오류 (YYYY-MM-DD): {value}")
+
+
+class TableIndex:
+    """테이블 1개의 행 값(파이썬 리스트)과 인덱스"""
+
+    def __init__(self, table: str, df: pd.DataFrame, version=None, fulltext=None):
+        spec = INDEXES.get(table, {})
+        self.table = table
+        self.version = version
+        self.fulltext = fulltext
+        self.rows = len(df)
+        self.columns = list(df.columns)
+        # 응답용 값: 컬럼별 파이썬 리스트 (빈 값은 None) - 행 dict는 조회 결과에 대해서만 생성
+        self.values = {c: df[c].astype(object).where(df[c].notna(), None).tolist() for c in self.columns}
+        self.hash = {c: _groups(df[c], table) for c in spec.get("hash", []) if c in df.columns}
+        self.postings = {c: _groups(df[c], table) for c in spec.get("postings", []) if c in df.columns}
+        self.sorted = {c: SortedIndex(df[c]) for c in spec.get("sorted", []) if c in df.columns}
+        # 전문 검색 세그먼트별 문서 번호 → 행 번호 (키 해시로 연결, 출력에 없는 문서는 -1)
+        self.segment_rows = []
+        if fulltext is not None:
+            from search.fulltext import key_hash
+
+            hashes = key_hash(df[fulltext.manifest["key"]])
+            order = np.argsort(hashes, kind="stable")
+            hashes = np.append(hashes[order], 0)  # 빈 출력에서도 searchsorted 위치가 유효하도록
+            order = np.append(order, -1)
+            for seg in fulltext.segments:
+                pos = np.searchsorted(hashes[:-1], seg.khash)
+                self.segment_rows.append(np.where(hashes[pos] == seg.khash, order[pos], -1).astype(np.int64))
+
+    def record(self, row: int) -> dict:
+        return {c: self.values[c][row] for c in self.columns}
+
+    def lookup(self, col: str, value) -> list:
+        """해시/포스팅 인덱스 조회 → 행 dict 목록"""
+        index = self.hash.get(col) or self.postings.get(col)
+        if index is None:
+            raise QueryError(f"인덱스가 없는 컬럼: {col}")
+        return [self.record(r) for r in index.get(_norm_value(col, self.table, value), _EMPTY)]
+
+    def select(self, equals: dict = None, ranges: dict = None, sort: str = None) -> np.ndarray:
+        """조건에 맞는 행 번호 - equals: {컬럼: 값}, ranges: {날짜 컬럼: (시작, 끝)}, sort: 컬럼 또는 -컬럼(내림차순)"""
+        cands = None
+        # 작은 목록부터 교집합
+        lists = []
+        for col, value in (equals or {}).items():
+            index = self.hash.get(col) or self.postings.get(col)
+            if index is None:
+                raise QueryError(f"인덱스가 없는 컬럼: {col}")
+            lists.append(index.get(_norm_value(col, self.table, value), _EMPTY))
+        for rows in sorted(lists, key=len):
+            cands = rows if cands is None else np.intersect1d(cands, rows, assume_unique=True)
+
+        for col, (lo, hi) in (ranges or {}).items():
+            if col not in self.sorted:
+                raise QueryError(f"범위 조회를 지원하지 않는 컬럼: {col}")
+            index = self.sorted[col]
+            cands = index.range(lo, hi) if cands is None else index.mask(cands, lo, hi)
+
+        if cands is None:
+            cands = np.arange(self.rows, dtype=np.int64)
+        if sort:
+            col = sort.lstrip("-")
+            if col not in self.sorted:
+                raise QueryError(f"정렬을 지원하지 않는 컬럼: {col}")
+            keys = self.sorted[col].by_row[cands]
+            if sort.startswith("-"):
+                keys = np.where(keys == _NO_DATE, _NO_DATE, -keys)  # 날짜 없음은 내림차순에서도 맨 뒤
+            cands = cands[np.argsort(keys, kind="stable")]
+        return cands
+
+    def search(self, text: str, allowed: np.ndarray = None) -> tuple:
+        """제목 검색 → (점수 순 행 번호, 점수) - 일치하는 모든 행
+
+        allowed: 검색 대상 행 번호 (조회 조건 결과 - 점수 계산 단계에서 걸러 상위 N건 선택과 무관)
+        """
+        if self.fulltext is None:
+            raise QueryError(f"제목 검색 인덱스가 없는 테이블: {self.table}")
+        # 마지막 칸(행 번호 -1) = 출력에 없는 문서 (인덱스가 출력보다 새로울 때)
+        keep = np.zeros(self.rows + 1, dtype=bool)
+        keep[:-1] = allowed is None
+        if allowed is not None:
+            keep[allowed] = True
+        matches = self.fulltext.match(text, [keep[rows] for rows in self.segment_rows])
+        if not matches:
+            return _EMPTY, np.array([], dtype=np.float32)
+        rows = np.concatenate([self.segment_rows[i][docs] for i, docs, _ in matches])
+        scores = np.concatenate([scores for _, _, scores in matches])
+        order = np.argsort(-scores, kind="stable")
+        return rows[order], scores[order]
+
+    def query(self, params: dict) -> dict:
+        """HTTP 조회 파라미터 → {"total", "rows"}
+
+        params: 인덱스 컬럼=값, {날짜 컬럼}_from / {날짜 컬럼}_to (YYYY-MM-DD), sort, limit, offset,
+                q (제목 검색 - 점수 순, 행에 _score 포함, 다른 조건은 필터로 적용)
+        """
+        equals, ranges = {}, {}
+        limit, offset, sort, text = DEFAULT_LIMIT, 0, None, None
+        for key, value in params.items():
+            if key == "q":
+                text = value
+            elif key == "limit":
+                limit = min(max(int(value), 0), MAX_LIMIT)
+            elif key == "offset":
+                offset = max(int(value), 0)
+            elif key == "sort":
+                sort = value
+            elif key.endswith(("_from", "_to")):
+                col, side = key.rsplit("_", 1)
+                lo, hi = ranges.get(col, (None, None))
+                ranges[col] = (_day(col, value), hi) if side == "from" else (lo, _day(col, value))
+            else:
+                equals[key] = value
+        if text is None:
+            rows = self.select(equals, ranges, sort)
+            return {"total": int(len(rows)), "rows": [self.record(r) for r in rows[offset:offset + limit]]}
+
+        allowed = self.select(equals, ranges, sort) if equals or ranges or sort else None
+        hits, scores = self.search(text, allowed if equals or ranges else None)
+        if sort:
+            # 정렬 조건 순서 (없으면 점수 순)
+            by_row = np.zeros(self.rows, dtype=np.float32)
+            by_row[hits] = scores
+            hits = allowed[np.isin(allowed, hits)]
+            page = zip(hits[offset:offset + limit].tolist(), by_row[hits[offset:offset + limit]].tolist())
+        else:
+            page = zip(hits[offset:offset + limit].tolist(), scores[offset:offset + limit].tolist())
+        return {"total": int(len(hits)),
+                "rows": [dict(self.record(r), _score=round(s, 4)) for r, s in page]}
+
+
+class Corpus:
+    """조회 대상 테이블 인덱스 묶음 (불변 - 다시 읽을 때는 새 Corpus로 교체)"""
+
+    def __init__(self, tables: dict, loaded_at: float = None, graph=None):
+        self.tables = tables
+        self.loaded_at = loaded_at or time.time()
+        self.graph = graph  # search.graph.RelationGraph (관계 그래프, 없으면 None)
+
+    @classmethod
+    def load(cls, paths: dict = None, logger=None) -> "Corpus":
+        """law_combined 출력 읽기 (paths: 테이블 → 출력 경로, 기본 merge_law_tables.OUTPUTS의 info/directive)"""
+        from merge_law_tables import OUTPUTS
+        from search.fulltext import FullTextIndex, MANIFEST_NAME as FULLTEXT_MANIFEST, index_dir
+        from search.graph import RelationGraph, MANIFEST_NAME as GRAPH_MANIFEST, graph_dir
+        from storage.delta import delta_dir, load_manifest
+
+        logger = logger or LOGGER
+        paths = paths or {t: OUTPUTS[t] for t in INDEXES}
+        tables = {}
+        for table, path in paths.items():
+            path = Path(path)
+            if not table_exists(path):
+                logger.warning(f"[search] 출력 없음, 건너뜀: {path}")
+                continue
+            started = time.perf_counter()
+            version = load_manifest(delta_dir(path, table), table)["version"] or None
+            fulltext = None
+            if (index_dir(path, table) / FULLTEXT_MANIFEST).exists():
+                fulltext = FullTextIndex.open(index_dir(path, table))
+                if fulltext.version != version:
+                    logger.warning(f"[search] {table} 제목 검색 인덱스 버전 {fulltext.version} ≠ 출력 버전 {version}")
+            tables[table] = TableIndex(table, read_table(path, table=table), version, fulltext)
+            logger.info(f"[search] {table} 인덱스 {tables[table].rows}행 (버전 {version}, "
+                        f"제목 검색 {'있음' if fulltext else '없음'}) {time.perf_counter() - started:.2f}s")
+        graph = None
+        folder = graph_dir(paths.get("info", OUTPUTS["info"]))
+        if (folder / GRAPH_MANIFEST).exists():
+            graph = RelationGraph.open(folder)
+            logger.info(f"[search] 관계 그래프 노드 {graph.size}, 간선 {graph.manifest['edges']}")
+        return cls(tables, graph=graph)
+
+    @property
+    def names(self) -> list:
+        """조회할 수 있는 이름 (테이블 + 관계 그래프)"""
+        return list(self.tables) + (["graph"] if self.graph is not None else [])
+
+    def table(self, name: str) -> TableIndex:
+        if name not in self.tables:
+            raise KeyError(name)
+        return self.tables[name]
+
+    def query(self, table: str, params: dict) -> dict:
+        if table == "graph":
+            if self.graph is None:
+                raise KeyError(table)
+            return self.graph.query(params)
+        return self.table(table).query(params)
+
+    def summary(self) -> dict:
+        summary = {name: {"rows": t.rows, "version": t.version, "fulltext": t.fulltext is not None}
+                   for name, t in self.tables.items()}
+        if self.graph is not None:
+            summary["graph"] = {k: self.graph.manifest.get(k) for k in ("nodes", "edges", "dangling", "relation_version")}
+        return summary
@@ -0,0 +1,377 @@
+### search/fulltext.py ###
+# 제목 전문 검색 인덱스 - 법령명(info), 문서명(directive), 베트남어 성조/발음 부호 무시 + BM25 순위
+#
+#   "Nghị định" / "nghi dinh" / "NGHI ĐINH" → 토큰 nghi, dinh (NFD 분해 후 결합 문자 제거, đ → d, 소문자)
+#
+#   output/law_combined/fulltext/{table}/
+#     manifest.json      {"version": delta 버전, "field", "key", "segments": [...]}
+#     s000003/           세그먼트 (numpy .npy - 읽을 때 memory-map)
+#       terms.json       정렬된 용어 목록 (용어 id = 위치)
+#       offsets.npy      용어별 포스팅 시작 위치 (int64, 용어 수 + 1)
+#       docs.npy         포스팅 문서 번호 (int32, 세그먼트 내 번호)
+#       tfs.npy          포스팅 용어 빈도 (uint8 - 제목 안 반복은 255회로 자름)
+#       lens.npy         문서 길이(토큰 수, uint16)
+#       khash.npy        문서 키 해시 (uint64) - delta 적용 시 삭제 표시 대상 찾기
+#       key_{i}.npy      문서 키 컬럼 (ID는 int64, 그 밖은 key_{i}.json 사전의 코드 int32)
+#       deleted.npy      삭제 표시 (bool) - 바뀌거나 삭제된 문서
+#
+# 병합(merge_law_tables)이 출력과 delta를 저장한 뒤 갱신합니다. 직전 버전의 delta가 있으면
+# 바뀐 문서만 새 세그먼트로 추가하고 기존 문서는 삭제 표시, 세그먼트가 많아지거나 삭제 비율이 높으면 전체 재구성.
+#
+#   index = FullTextIndex.open("output/law_combined/fulltext/info")
+#   index.search("nghi dinh thue", limit=10)   → [{"regionID": "TW", "itemID": 123, "score": 7.1}, ...]
+
+import json
+import logging
+import os
+import re
+import shutil
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from storage import read_table, table_exists
+from storage.delta import KEYS, delta_dir, load_manifest
+from storage.schema import HAS_PYARROW, ID, dtype_of
+
+FULLTEXT_DIR = "fulltext"
+MANIFEST_NAME = "manifest.json"
+FIELDS = {"info": "법령명", "directive": "문서명"}  # 테이블 → 검색 필드
+MAX_SEGMENTS = 8       # 이보다 많아지면 전체 재구성
+MAX_DELETED = 0.2      # 삭제 표시 비율이 이보다 높아지면 전체 재구성
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+_MARKS = re.compile("[\u0300-\u036f]")  # NFD 분해 후 지울 결합 부호 (성조, 모자, 갈고리 ...)
+_SEP = "\x00"  # 여러 제목을 한 문자열로 토큰화할 때 제목 구분 (토큰 정규식에 함께 잡힘)
+_TOKEN_OR_SEP = re.compile(r"[0-9a-z]+|\x00")
+TOKEN_BATCH = 4096  # 한 번에 토큰화할 고유 제목 수 (토큰 문자열 객체 수 제한)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def fold(text: str) -> str:
+    """성조/부호 제거 + 소문자 ("Nghị định" → "nghi dinh", 분해되지 않는 đ → d)"""
+    return _MARKS.sub("", unicodedata.normalize("NFD", str(text))).replace("đ", "d").replace("Đ", "D").lower()
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN.findall(fold(text))
+
+
+def _release_arrow_pool():
+    """string[pyarrow] 인코딩으로 늘어난 Arrow 메모리 풀을 OS에 반환 (뒤따르는 numpy 배열과 겹치지 않도록)"""
+    if HAS_PYARROW:
+        import pyarrow as pa
+
+        pa.default_memory_pool().release_unused()
+
+
+def _batch(uniques, start: int) -> str:
+    """고유 제목 TOKEN_BATCH개를 구분 문자로 이은 문자열 (결측 제목은 빈 문자열)"""
+    part = uniques[start:start + TOKEN_BATCH]
+    return _SEP.join(u.replace(_SEP, "") if isinstance(u, str) else "" for u in part)
+
+
+def _postings(titles: pd.Series):
+    """제목 → (정렬된 용어 목록, 용어별 포스팅 시작 위치, 포스팅 문서 번호, 용어 빈도, 문서별 토큰 수)
+
+    같은 제목은 한 번만, 고유 제목을 TOKEN_BATCH개씩 구분 문자로 이어 fold/토큰화 (NFD는 구분 문자를 넘지 않음)
+    → 배치의 고유 단어만 용어 사전에서 정수 id로 바꿔 토큰 문자열 객체는 배치 크기만큼만 보관
+    → 토큰을 문서별로 펼친 뒤 용어 id × 문서 수 + 문서 번호를 제자리 정렬해 빈도 계산 (np.unique의 정렬용 사본 없이)
+    """
+    codes, uniques = pd.factorize(titles, use_na_sentinel=False)
+    _release_arrow_pool()
+    term_of, ids, title = {}, [], []
+    for start in range(0, len(uniques), TOKEN_BATCH):
+        local, words = pd.factorize(np.array(_TOKEN_OR_SEP.findall(fold(_batch(uniques, start))), dtype=object))
+        # 배치 단어 → 전역 용어 id (구분 문자는 -1)
+        lut = np.array([-1 if w == _SEP else term_of.setdefault(w, len(term_of)) for w in words], dtype=np.int32)
+        token = lut[local]
+        sep = token < 0
+        title.append((np.cumsum(sep, dtype=np.int32) + np.int32(start))[~sep])
+        ids.append(token[~sep])
+    ids = np.concatenate(ids) if ids else np.zeros(0, dtype=np.int32)
+    title = np.concatenate(title) if title else np.zeros(0, dtype=np.int32)
+    # 용어 id를 정렬된 용어 순서로
+    vocab = sorted(term_of)
+    rank = np.zeros(len(vocab), dtype=np.int32)
+    rank[[term_of[w] for w in vocab]] = np.arange(len(vocab), dtype=np.int32)
+    ids = rank[ids]
+
+    # 고유 제목의 토큰 구간 → 문서별로 펼침 (토큰 수 크기 배열은 int32, 다 쓰면 바로 해제)
+    title_lens = np.bincount(title, minlength=len(uniques))
+    del title
+    title_starts = np.cumsum(title_lens) - title_lens
+    lens = title_lens[codes]
+    doc_starts = np.cumsum(lens) - lens
+    pos = np.repeat((title_starts[codes] - doc_starts).astype(np.int32), lens)
+    pos += np.arange(len(pos), dtype=np.int32)
+    n = max(len(codes), 1)
+    key = ids[pos].astype(np.int64)
+    del ids, pos
+    key *= n
+    key += np.repeat(np.arange(len(codes), dtype=np.int32), lens)
+    key.sort()
+
+    # 같은 (용어, 문서) 구간의 시작 위치 → 빈도
+    first = np.ones(len(key), dtype=bool)
+    np.not_equal(key[1:], key[:-1], out=first[1:])
+    starts = np.flatnonzero(first)
+    del first
+    counts = np.empty_like(starts)
+    np.subtract(starts[1:], starts[:-1], out=counts[:-1])
+    counts[-1:] = len(key) - starts[-1:]
+    tfs = np.minimum(counts, np.iinfo(np.uint8).max, out=counts).astype(np.uint8)
+    del counts
+    pairs = key[starts]
+    del key, starts
+    # 용어 순 정렬이므로 용어 경계는 searchsorted로 (용어 id 배열을 따로 만들지 않음)
+    offsets = np.searchsorted(pairs, np.arange(len(vocab) + 1, dtype=np.int64) * n).astype(np.int64)
+    pairs %= n
+    return vocab, offsets, pairs.astype(np.int32), tfs, lens
+
+
+def key_hash(keys: pd.DataFrame) -> np.ndarray:
+    """문서 키 해시 - 타입과 무관하게 같은 문자열이면 같은 값 (출력 프레임의 Int64와 delta CSV의 문자열 모두)"""
+    text = None
+    for col in keys.columns:
+        part = keys[col].astype("string").fillna("")
+        text = part if text is None else text + "\x1f" + part
+    return pd.util.hash_array(text.to_numpy(dtype=object))
+
+
+def _write_json(path: Path, obj):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _save_npy(path: Path, array):
+    tmp = path.with_name(path.name + ".tmp.npy")
+    np.save(tmp, array)
+    os.replace(tmp, path)
+
+
+# ----- 세그먼트 -----
+def build_segment(folder: Path, titles: pd.Series, keys: pd.DataFrame, table: str):
+    """제목 + 키로 세그먼트 1개 생성 (임시 폴더에 쓴 뒤 이름 변경)"""
+    vocab, offsets, docs, tfs, lens = _postings(titles.reset_index(drop=True))
+
+    tmp = folder.with_name(folder.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    (tmp / "terms.json").write_text(json.dumps(vocab, ensure_ascii=False), encoding="utf-8")
+    np.save(tmp / "offsets.npy", offsets)
+    np.save(tmp / "docs.npy", docs)
+    np.save(tmp / "tfs.npy", tfs)
+    np.save(tmp / "lens.npy", np.minimum(lens, np.iinfo(np.uint16).max).astype(np.uint16))
+    keys = keys.reset_index(drop=True)
+    np.save(tmp / "khash.npy", key_hash(keys))
+    for i, col in enumerate(keys.columns):
+        if dtype_of(col, table) == ID:
+            values = pd.to_numeric(keys[col], errors="coerce").astype("Int64")
+            np.save(tmp / f"key_{i}.npy", values.fillna(-1).to_numpy(dtype=np.int64))
+        else:
+            codes, uniques = pd.factorize(keys[col].astype("string").fillna(""))
+            np.save(tmp / f"key_{i}.npy", codes.astype(np.int32))
+            (tmp / f"key_{i}.json").write_text(json.dumps(list(uniques), ensure_ascii=False), encoding="utf-8")
+    np.save(tmp / "deleted.npy", np.zeros(len(keys), dtype=bool))
+    shutil.rmtree(folder, ignore_errors=True)
+    tmp.rename(folder)
+
+
+class Segment:
+    """세그먼트 읽기 (포스팅/길이/키 배열은 memory-map)"""
+
+    def __init__(self, folder: Path, key_cols):
+        self.folder = Path(folder)
+        load = lambda name: np.load(self.folder / name, mmap_mode="r")
+        terms = json.loads((self.folder / "terms.json").read_text(encoding="utf-8"))
+        self.term_ids = {t: i for i, t in enumerate(terms)}
+        self.offsets, self.docs, self.tfs = load("offsets.npy"), load("docs.npy"), load("tfs.npy")
+        self.lens, self.khash = load("lens.npy"), load("khash.npy")
+        self.deleted = np.load(self.folder / "deleted.npy")
+        self.key_cols = list(key_cols)
+        self.keys = []
+        for i in range(len(self.key_cols)):
+            values = load(f"key_{i}.npy")
+            path = self.folder / f"key_{i}.json"
+            self.keys.append((values, json.loads(path.read_text(encoding="utf-8")) if path.exists() else None))
+
+    @property
+    def size(self) -> int:
+        return len(self.lens)
+
+    def postings(self, term: str):
+        i = self.term_ids.get(term)
+        if i is None:
+            return None
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.docs[start:end], self.tfs[start:end]
+
+    def key(self, doc: int) -> dict:
+        out = {}
+        for col, (values, dictionary) in zip(self.key_cols, self.keys):
+            v = int(values[doc])
+            out[col] = (None if v < 0 else v) if dictionary is None else dictionary[v]
+        return out
+
+    def mark_deleted(self, hashes: np.ndarray) -> int:
+        """키 해시가 hashes에 있는 문서 삭제 표시 - 반환: 새로 표시한 수"""
+        hit = np.isin(self.khash, hashes) & ~self.deleted
+        if hit.any():
+            self.deleted = self.deleted | hit
+            _save_npy(self.folder / "deleted.npy", self.deleted)
+        return int(hit.sum())
+
+
+class FullTextIndex:
+    """세그먼트 묶음 + BM25 검색"""
+
+    def __init__(self, folder, manifest: dict, segments: list):
+        self.folder = Path(folder)
+        self.manifest = manifest
+        self.version = manifest.get("version")
+        self.field = manifest.get("field")
+        self.segments = segments
+        self.total = sum(s.size for s in segments)  # 삭제 표시 포함 - 문서 빈도와 같은 기준 (idf)
+        self.docs = self.total - sum(int(s.deleted.sum()) for s in segments)
+        total_len = sum(float(np.asarray(s.lens, dtype=np.float64)[~s.deleted].sum()) for s in segments)
+        self.avg_len = total_len / self.docs if self.docs else 0.0
+        # 세그먼트별 BM25 길이 보정 (문서 수 × float32, 검색마다 계산하지 않도록)
+        self.norms = [BM25_K1 * (1 - BM25_B + BM25_B * np.asarray(s.lens, dtype=np.float32) / (self.avg_len or 1))
+                      for s in segments]
+
+    @classmethod
+    def open(cls, folder) -> "FullTextIndex":
+        folder = Path(folder)
+        manifest = json.loads((folder / MANIFEST_NAME).read_text(encoding="utf-8"))
+        return cls(folder, manifest, [Segment(folder / name, manifest["key"]) for name in manifest["segments"]])
+
+    def match(self, query: str, masks: list = None) -> list:
+        """BM25 (용어 중 하나라도 포함한 문서) → [(세그먼트 번호, 문서 번호 배열, 점수 배열)] - 삭제 표시 제외
+
+        masks: 세그먼트별 bool 배열 (True인 문서만 - 조회 조건을 상위 N건 선택 전에 적용)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.docs:
+            return []
+        # 문서 빈도는 세그먼트 합 (삭제 표시 문서 포함 - 재구성 전까지의 근사, Lucene과 같은 방식)
+        postings = [[s.postings(t) for t in terms] for s in self.segments]
+        df = np.array([sum(len(p[i][0]) for p in postings if p[i] is not None) for i in range(len(terms))])
+        idf = np.log(1 + (self.total - df + 0.5) / (df + 0.5))
+
+        matches = []
+        for i, (seg, norm, seg_postings) in enumerate(zip(self.segments, self.norms, postings)):
+            if all(p is None for p in seg_postings):
+                continue
+            scores = np.zeros(seg.size, dtype=np.float32)
+            for weight, p in zip(idf, seg_postings):
+                if p is None:
+                    continue
+                docs, tfs = np.asarray(p[0]), np.asarray(p[1], dtype=np.float32)
+                scores[docs] += weight * tfs * (BM25_K1 + 1) / (tfs + norm[docs])
+            scores[seg.deleted] = 0
+            if masks is not None:
+                scores[~masks[i]] = 0
+            matched = np.flatnonzero(scores)
+            matches.append((i, matched, scores[matched]))
+        return matches
+
+    def search(self, query: str, limit: int = 20, masks: list = None) -> list:
+        """점수 내림차순 상위 limit건 → [{키 컬럼..., "score"}] (masks: match와 같음)"""
+        hits = []
+        for i, docs, scores in self.match(query, masks):
+            if len(docs) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                docs, scores = docs[top], scores[top]
+            hits.extend((float(score), self.segments[i], int(d)) for d, score in zip(docs, scores))
+        hits.sort(key=lambda h: -h[0])
+        return [dict(seg.key(d), score=round(score, 4)) for score, seg, d in hits[:limit]]
+
+
+# ----- 병합 시 갱신 -----
+def index_dir(out_path, table: str) -> Path:
+    """output/law_combined/{sub}/{이름}.csv → output/law_combined/fulltext/{table}"""
+    return Path(out_path).parent.parent / FULLTEXT_DIR / table
+
+
+def _next_segment(manifest: dict) -> str:
+    used = [int(name[1:]) for name in manifest.get("segments", [])]
+    return f"s{max(used + [manifest.get('last_segment', 0)]) + 1:06d}"
+
+
+def index_current(out_path, table: str) -> bool:
+    """인덱스가 출력의 delta 버전과 같으면 True (검색 대상이 아닌 테이블도 True)"""
+    if table not in FIELDS:
+        return True
+    path = index_dir(out_path, table) / MANIFEST_NAME
+    if not path.exists():
+        return False
+    version = load_manifest(delta_dir(out_path, table), table)["version"] or None
+    return json.loads(path.read_text(encoding="utf-8")).get("version") == version
+
+
+def ensure_index(out_path, table: str, logger=None) -> bool:
+    """병합을 생략한 출력(입력 변경 없음)의 인덱스가 없거나 오래됐으면 출력을 읽어 구성"""
+    if index_current(out_path, table) or not table_exists(out_path):
+        return False
+    keys = KEYS.get(table, [])
+    return update_index(read_table(out_path, columns=keys + [FIELDS[table]], table=table), out_path, table, logger)
+
+
+def update_index(df: pd.DataFrame, out_path, table: str, logger=None) -> bool:
+    """병합 출력(df)의 delta 버전에 맞춰 인덱스 갱신 - 반환: 갱신 여부
+
+    직전 버전 인덱스 + 이번 delta 파일이 있으면 증분(바뀐 문서만 새 세그먼트), 아니면 전체 재구성
+    """
+    logger = logger or LOGGER
+    field = FIELDS.get(table)
+    keys = [c for c in KEYS.get(table, []) if c in df.columns]
+    if field is None or field not in df.columns or not keys:
+        return False
+    folder = index_dir(out_path, table)
+    delta_folder = delta_dir(out_path, table)
+    version = load_manifest(delta_folder, table)["version"]
+    manifest_path = folder / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    if manifest and manifest.get("version") == version and version:
+        return False
+
+    entry = next((d for d in load_manifest(delta_folder, table)["deltas"] if d["version"] == version), None)
+    incremental = (manifest and version and manifest.get("version") == version - 1 and entry and entry.get("file")
+                   and manifest.get("field") == field and len(manifest["segments"]) < MAX_SEGMENTS)
+    folder.mkdir(parents=True, exist_ok=True)
+    name = _next_segment(manifest)
+
+    if incremental:
+        delta = pd.read_csv(delta_folder / entry["file"], dtype=str, keep_default_na=False)
+        segments = [Segment(folder / s, keys) for s in manifest["segments"]]
+        marked = sum(s.mark_deleted(key_hash(delta[keys])) for s in segments)
+        rows = delta[delta["_op"] != "remove"]
+        new = [name] if len(rows) else []
+        if new:
+            build_segment(folder / name, rows[field], rows[keys], table)
+        total = sum(s.size for s in segments) + len(rows)
+        deleted = sum(int(s.deleted.sum()) for s in segments)
+        if deleted <= MAX_DELETED * max(total, 1):
+            manifest.update(version=version, segments=manifest["segments"] + new,
+                            last_segment=int(name[1:]))
+            _write_json(manifest_path, manifest)
+            logger.info(f"[fulltext] {table} 버전 {version}: 증분 {len(rows)}건 추가, {marked}건 삭제 표시")
+            return True
+        logger.info(f"[fulltext] {table} 삭제 비율 {deleted / total:.0%} → 전체 재구성")
+        name = _next_segment(dict(manifest, last_segment=int(name[1:])))
+
+    build_segment(folder / name, df[field], df[keys], table)
+    _write_json(manifest_path, {"version": version or None, "field": field, "key": keys,
+                                "segments": [name], "last_segment": int(name[1:])})
+    for path in folder.iterdir():  # 이전 세그먼트 + 재구성 전에 만든 증분/중단된 임시 세그먼트
+        if path.is_dir() and path.name != name:
+            shutil.rmtree(path, ignore_errors=True)
+    logger.info(f"[fulltext] {table} 버전 {version}: 전체 구성 {len(df)}건")
+    return True
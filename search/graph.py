@@ -0,0 +1,259 @@
+### search/graph.py ###
+# 법령 관계 그래프 인덱스 - 관계정보(itemID → relation_itemID, 관계유형)를 양방향 CSR 배열로 저장
+#
+#   "이 법령을 개정/대체한 문서 전체(전이적으로)" 같은 질의를 관계정보 전체 필터 반복 없이
+#   노드별 인접 목록 슬라이스(offsets[i]:offsets[i+1])로 처리
+#
+#   output/law_combined/graph/
+#     manifest.json       {"relation_version", "info_version", "nodes", "edges", "dangling", "types"}
+#     nodes.npy           노드 itemID (정렬, int64) - 노드 번호 = 위치 (searchsorted로 찾음)
+#     in_info.npy         노드가 기본정보(info)에 있는지 (bool)
+#     out_offsets.npy     정방향 CSR: 노드별 시작 위치 (int64, 노드 수 + 1)
+#     out_targets.npy     정방향 CSR: 대상 노드 번호 (int32)
+#     out_types.npy       정방향 CSR: 관계유형 코드 (uint8, manifest types의 위치)
+#     in_offsets.npy / in_sources.npy / in_types.npy   역방향 CSR (relation_itemID → itemID)
+#     dangling.csv        대상(relation_itemID)이 기본정보에 없는 관계 목록
+#
+# 관계정보의 relation_itemID에는 regionID가 없으므로 노드는 itemID 단위입니다.
+# 최종 병합이 끝난 뒤 relation/info의 delta 버전이 바뀌었으면 다시 구성합니다.
+#
+#   graph = RelationGraph.open("output/law_combined/graph")
+#   graph.neighbors(123, "in")                               → [{"itemID", "관계유형"}, ...]
+#   graph.bfs(123, "out", types=["Văn bản sửa đổi"], max_depth=3)   → {itemID: 깊이, ...}
+#   graph.closure(123, "both")                               → {itemID, ...}
+
+import json
+import logging
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from storage import read_table, table_exists
+from storage.delta import delta_dir, load_manifest
+
+GRAPH_DIR = "graph"
+MANIFEST_NAME = "manifest.json"
+DANGLING_NAME = "dangling.csv"
+DIRECTIONS = ("out", "in", "both")
+TYPE_SEPARATOR = "|"  # 조회 파라미터 type=유형1|유형2 (관계유형에 쉼표가 들어 있음)
+_EMPTY = np.array([], dtype=np.int32)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def graph_dir(out_path) -> Path:
+    """output/law_combined/{sub}/{이름}.csv → output/law_combined/graph"""
+    return Path(out_path).parent.parent / GRAPH_DIR
+
+
+def _csr(src: np.ndarray, dst: np.ndarray, types: np.ndarray, n: int):
+    """(출발, 도착, 유형) 간선 → (offsets, 도착 노드, 유형) - 노드별 도착 노드 순"""
+    order = np.lexsort((dst, src))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+    return offsets, dst[order].astype(np.int32), types[order]
+
+
+def build_graph(relation: pd.DataFrame, info_ids, folder, versions: dict = None, logger=None) -> dict:
+    """관계정보 + 기본정보 itemID로 그래프 배열 저장 (임시 폴더에 쓴 뒤 교체) - 반환: manifest"""
+    logger = logger or LOGGER
+    folder = Path(folder)
+    edges = pd.DataFrame({
+        "src": pd.to_numeric(relation["itemID"], errors="coerce").astype("Int64"),
+        "dst": pd.to_numeric(relation["relation_itemID"], errors="coerce").astype("Int64"),
+        "type": relation["관계유형"].astype("string").str.strip().fillna(""),
+    })
+    missing = int((edges["src"].isna() | edges["dst"].isna()).sum())
+    edges = edges.dropna(subset=["src", "dst"]).drop_duplicates()
+    src, dst = edges["src"].to_numpy(dtype=np.int64), edges["dst"].to_numpy(dtype=np.int64)
+
+    nodes = np.union1d(src, dst)
+    type_codes, type_names = pd.factorize(edges["type"], sort=True)
+    type_codes = type_codes.astype(np.uint8 if len(type_names) <= np.iinfo(np.uint8).max else np.uint16)
+    s, d = np.searchsorted(nodes, src), np.searchsorted(nodes, dst)
+    info_ids = pd.to_numeric(pd.Series(info_ids), errors="coerce").dropna().to_numpy(dtype=np.int64)
+    in_info = np.isin(nodes, info_ids)
+
+    tmp = folder.with_name(folder.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    np.save(tmp / "nodes.npy", nodes)
+    np.save(tmp / "in_info.npy", in_info)
+    for prefix, name, (a, b) in (("out", "targets", (s, d)), ("in", "sources", (d, s))):
+        offsets, other, types = _csr(a, b, type_codes, len(nodes))
+        np.save(tmp / f"{prefix}_offsets.npy", offsets)
+        np.save(tmp / f"{prefix}_{name}.npy", other)
+        np.save(tmp / f"{prefix}_types.npy", types)
+
+    dangling = ~in_info[d]
+    report = pd.DataFrame({"itemID": src[dangling], "relation_itemID": dst[dangling],
+                           "관계유형": np.asarray(type_names, dtype=object)[type_codes[dangling]]})
+    report.sort_values(["relation_itemID", "itemID"]).to_csv(tmp / DANGLING_NAME, index=False, encoding="utf-8")
+    manifest = dict(versions or {}, nodes=len(nodes), edges=len(src), dangling=int(dangling.sum()),
+                    types=list(type_names))
+    (tmp / MANIFEST_NAME).write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    old = folder.with_name(folder.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if folder.exists():
+        folder.rename(old)
+    tmp.rename(folder)
+    shutil.rmtree(old, ignore_errors=True)
+
+    logger.info(f"[graph] 노드 {len(nodes)}, 간선 {len(src)}, 관계유형 {len(type_names)} "
+                f"(대상 없는 행 {missing} 제외) → {folder}")
+    if manifest["dangling"]:
+        top = report["관계유형"].value_counts().head(3).to_dict()
+        logger.warning(f"[graph] 대상이 기본정보에 없는 관계 {manifest['dangling']}건 "
+                       f"(대상 {report['relation_itemID'].nunique()}개, {top}) → {folder / DANGLING_NAME}")
+    return manifest
+
+
+def update_graph(relation_path, info_path, logger=None) -> bool:
+    """relation/info 출력의 delta 버전이 바뀌었으면 그래프 재구성 - 반환: 재구성 여부"""
+    logger = logger or LOGGER
+    if not (table_exists(relation_path) and table_exists(info_path)):
+        return False
+    folder = graph_dir(relation_path)
+    versions = {"relation_version": load_manifest(delta_dir(relation_path, "relation"), "relation")["version"],
+                "info_version": load_manifest(delta_dir(info_path, "info"), "info")["version"]}
+    path = folder / MANIFEST_NAME
+    if path.exists() and all(versions.values()):
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if all(manifest.get(k) == v for k, v in versions.items()):
+            logger.info(f"[graph] 변경 없음, 생략: {folder}")
+            return False
+    relation = read_table(relation_path, columns=["itemID", "relation_itemID", "관계유형"], table="relation")
+    info = read_table(info_path, columns=["itemID"], table="info")
+    build_graph(relation, info["itemID"], folder, versions, logger)
+    return True
+
+
+class RelationGraph:
+    """관계 그래프 읽기 (배열은 memory-map) + 이웃/BFS/폐포 조회"""
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.manifest = json.loads((self.folder / MANIFEST_NAME).read_text(encoding="utf-8"))
+        load = lambda name: np.load(self.folder / name, mmap_mode="r")
+        self.nodes, self.in_info = load("nodes.npy"), load("in_info.npy")
+        self.csr = {
+            "out": (load("out_offsets.npy"), load("out_targets.npy"), load("out_types.npy")),
+            "in": (load("in_offsets.npy"), load("in_sources.npy"), load("in_types.npy")),
+        }
+        self.types = self.manifest["types"]
+        self._type_codes = {t.casefold(): i for i, t in enumerate(self.types)}
+
+    @classmethod
+    def open(cls, folder) -> "RelationGraph":
+        return cls(folder)
+
+    @property
+    def size(self) -> int:
+        return len(self.nodes)
+
+    def index(self, item_id) -> int:
+        """itemID → 노드 번호 (없으면 -1)"""
+        item_id = int(item_id)
+        i = int(np.searchsorted(self.nodes, item_id))
+        return i if i < len(self.nodes) and self.nodes[i] == item_id else -1
+
+    def type_codes(self, types) -> np.ndarray:
+        """관계유형 이름 목록 → 코드 배열 (대소문자 무시, None이면 전체)"""
+        if types is None:
+            return None
+        unknown = [t for t in types if t.strip().casefold() not in self._type_codes]
+        if unknown:
+            raise ValueError(f"알 수 없는 관계유형: {unknown}")
+        return np.array([self._type_codes[t.strip().casefold()] for t in types])
+
+    def _directions(self, direction: str) -> list:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction은 {DIRECTIONS} 중 하나: {direction}")
+        return ["out", "in"] if direction == "both" else [direction]
+
+    def _expand(self, direction: str, frontier: np.ndarray, codes) -> np.ndarray:
+        """frontier 노드들의 이웃 노드 번호 (중복 포함)"""
+        offsets, others, types = self.csr[direction]
+        if len(frontier) == 1:
+            start, end = offsets[frontier[0]], offsets[frontier[0] + 1]
+            idx = slice(start, end)
+        else:
+            starts = np.asarray(offsets[frontier])
+            counts = np.asarray(offsets[frontier + 1]) - starts
+            if not counts.sum():
+                return _EMPTY
+            # 구간들을 이어 붙인 위치: 각 구간 시작 위치 반복 + 구간 내 순번
+            idx = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        nbrs = np.asarray(others[idx])
+        return nbrs if codes is None else nbrs[np.isin(types[idx], codes)]
+
+    def neighbors(self, item_id, direction: str = "out", types=None) -> list:
+        """직접 연결된 문서 → [{"itemID", "관계유형", "direction", "in_info"}]"""
+        codes = self.type_codes(types)
+        directions = self._directions(direction)
+        i = self.index(item_id)
+        out = []
+        if i < 0:
+            return out
+        for d in directions:
+            offsets, others, type_arr = self.csr[d]
+            start, end = offsets[i], offsets[i + 1]
+            for node, code in zip(others[start:end].tolist(), type_arr[start:end].tolist()):
+                if codes is None or code in codes:
+                    out.append({"itemID": int(self.nodes[node]), "관계유형": self.types[code], "direction": d,
+                                "in_info": bool(self.in_info[node])})
+        return out
+
+    def bfs(self, item_id, direction: str = "out", types=None, max_depth: int = None) -> dict:
+        """너비 우선 탐색 → {itemID: 깊이} (시작 문서 0, 깊이 순 - 같은 깊이는 itemID 순)"""
+        codes = self.type_codes(types)
+        directions = self._directions(direction)
+        start = self.index(item_id)
+        if start < 0:
+            return {}
+        visited = np.zeros(len(self.nodes), dtype=bool)
+        visited[start] = True
+        result = {int(self.nodes[start]): 0}
+        frontier, depth = np.array([start]), 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            nbrs = np.concatenate([self._expand(d, frontier, codes) for d in directions])
+            frontier = np.unique(nbrs[~visited[nbrs]])
+            visited[frontier] = True
+            depth += 1
+            result.update(dict.fromkeys(np.asarray(self.nodes[frontier]).tolist(), depth))
+        return result
+
+    def closure(self, item_id, direction: str = "out", types=None) -> set:
+        """전이적으로 연결된 문서 itemID 집합 (시작 문서 제외)"""
+        reached = self.bfs(item_id, direction, types)
+        reached.pop(int(item_id), None)
+        return set(reached)
+
+    def dangling(self) -> pd.DataFrame:
+        """대상(relation_itemID)이 기본정보에 없는 관계 (itemID, relation_itemID, 관계유형)"""
+        return pd.read_csv(self.folder / DANGLING_NAME, dtype={"관계유형": str})
+
+    def query(self, params: dict) -> dict:
+        """HTTP 조회 파라미터 → 이웃 또는 BFS 결과
+
+        params: itemID, direction(out|in|both), type(유형1|유형2), depth (없으면 이웃, all이면 폐포)
+        """
+        if "itemID" not in params:
+            raise ValueError("itemID가 필요합니다")
+        try:
+            item_id = int(str(params["itemID"]).strip())
+        except ValueError:
+            raise ValueError(f"itemID는 정수여야 합니다: {params['itemID']}")
+        types = params["type"].split(TYPE_SEPARATOR) if params.get("type") else None
+        direction = params.get("direction", "both" if "depth" not in params else "out")
+        if "depth" not in params:
+            rows = self.neighbors(item_id, direction, types)
+            return {"itemID": item_id, "total": len(rows), "rows": rows}
+        depth = None if params["depth"] == "all" else int(params["depth"])
+        reached = self.bfs(item_id, direction, types, depth)
+        reached.pop(item_id, None)
+        rows = [{"itemID": k, "depth": v, "in_info": bool(self.in_info[self.index(k)])} for k, v in reached.items()]
+        return {"itemID": item_id, "total": len(rows), "rows": rows}
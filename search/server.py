@@ -0,0 +1,155 @@
+### search/server.py ###
+# law_combined 조회 HTTP/JSON 서버 - 인덱스는 메모리에, 병합이 끝나면(출력 파일 변경) 자동으로 다시 읽음
+#
+#   python -m vietscrap serve --port 8765
+#   GET /health                                   테이블별 행 수, delta 버전, 읽은 시각
+#   GET /info?itemID=123                          해시 인덱스 조회
+#   GET /info?발급기관=Chính phủ&문서유형=Nghị định&발행일_from=2020-01-01&sort=-발행일&limit=20
+#   GET /directive?문서코드=12/CT-TTg
+#   GET /info?q=nghi dinh thue&유효상태=Còn hiệu lực   제목 검색 (성조 무시, BM25 점수 순)
+#   GET /graph?itemID=123                         직접 연결된 문서 (양방향, 관계유형 포함)
+#   GET /graph?itemID=123&direction=in&depth=all&type=Văn bản sửa đổi, bổ sung   전이적으로 연결된 문서 (BFS 깊이)
+#   POST /reload                                  즉시 다시 읽기
+
+import json
+import threading
+import traceback
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit, unquote
+
+from search.corpus import Corpus, INDEXES, QueryError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+POLL_SECONDS = 2.0  # 출력 파일 변경 확인 주기
+
+
+def _stat(path: Path):
+    try:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+class SearchService:
+    """현재 Corpus 보관 + 출력 변경 감지 시 백그라운드에서 새 Corpus를 만들어 교체 (조회는 잠금 없음)"""
+
+    def __init__(self, paths: dict = None, poll: float = POLL_SECONDS, logger=None):
+        from merge_law_tables import OUTPUTS
+        from storage.columnar import parquet_path
+        from search.fulltext import index_dir
+        from search.graph import graph_dir
+        from storage.delta import delta_dir, MANIFEST_NAME
+
+        self.paths = paths or {t: OUTPUTS[t] for t in INDEXES}
+        self.poll = poll
+        self.logger = logger
+        # 변경 감지 대상: CSV, Parquet 폴더(교체 시 mtime 변경), delta / 제목 검색 manifest
+        self._watched = [p for t, out in self.paths.items()
+                         for p in (Path(out), parquet_path(out), delta_dir(out, t) / MANIFEST_NAME,
+                                   index_dir(out, t) / MANIFEST_NAME)]
+        if "info" in self.paths:
+            self._watched.append(graph_dir(self.paths["info"]) / MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._stop = threading.Event()
+        self.corpus = Corpus({})
+        self.reload(force=True)
+
+    def signature(self) -> tuple:
+        return tuple(_stat(p) for p in self._watched)
+
+    def reload(self, force: bool = False) -> bool:
+        """출력이 바뀌었으면 다시 읽어 교체 - 반환: 교체 여부"""
+        with self._lock:
+            signature = self.signature()
+            if not force and signature == self._signature:
+                return False
+            corpus = Corpus.load(self.paths, self.logger)
+            self.corpus, self._signature = corpus, signature
+        if self.logger:
+            self.logger.info(f"[search] 인덱스 교체: {corpus.summary()}")
+        return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll):
+            try:
+                self.reload()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"[search] 다시 읽기 실패 (이전 인덱스 유지): {e}")
+
+    def start(self) -> "SearchService":
+        threading.Thread(target=self._watch, name="search-reload", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def health(self) -> dict:
+        return {"status": "ok", "loaded_at": self.corpus.loaded_at, "tables": self.corpus.summary()}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: SearchService = None
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        name = unquote(url.path).strip("/")
+        if name == "health":
+            return self._send(200, self.service.health())
+        started = time.perf_counter()
+        corpus = self.service.corpus  # 요청 중 교체되어도 같은 Corpus로 응답
+        if name not in corpus.names:
+            return self._send(404, {"error": f"알 수 없는 테이블: {name}", "tables": corpus.names})
+        try:
+            result = corpus.query(name, dict(parse_qsl(url.query)))
+        except (QueryError, ValueError) as e:
+            return self._send(400, {"error": str(e)})
+        except Exception as e:
+            # 조회 중 내부 오류 (누락된 컬럼 등) - 잘못된 요청이 아니므로 500
+            if self.service.logger:
+                self.service.logger.error(f"[search] 조회 실패: {self.path} | {e}\n{traceback.format_exc()}")
+            return self._send(500, {"error": f"내부 오류: {type(e).__name__}: {e}"})
+        result["took_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self._send(200, result)
+
+    def do_POST(self):
+        if urlsplit(self.path).path.strip("/") != "reload":
+            return self._send(404, {"error": "POST /reload 만 지원"})
+        self._send(200, {"reloaded": self.service.reload(force=True), **self.service.health()})
+
+    def log_message(self, fmt, *args):
+        if self.service.logger:
+            self.service.logger.debug(f"[search] {self.address_string()} {fmt % args}")
+
+
+def make_server(service: SearchService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    handler = type("SearchHandler", (_Handler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, poll: float = POLL_SECONDS, logger=None):
+    """조회 서버 실행 (Ctrl+C로 종료)"""
+    service = SearchService(poll=poll, logger=logger).start()
+    server = make_server(service, host, port)
+    if logger:
+        logger.info(f"[search] http://{host}:{port} 대기 중 (테이블: {list(service.corpus.tables)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
@@ -54,10 +54,14 @@ def test_factory_functions():
         central_updater = make_law_updater("central", central_scraper)
         print(f"✅ 중앙 업데이터 생성: {central_updater.mode}")
         
-        # 드라이버 정리
-        central_scraper.driver.quit()
-        local_scraper.driver.quit()
-        undetected_scraper.driver.quit()
+        # 드라이버는 첫 사용 시 생성
+        assert not central_scraper.has_driver, "생성 시점에 드라이버가 실행됨"
+        print("✅ 드라이버 지연 생성")
+        
+        # 정리
+        central_scraper.close()
+        local_scraper.close()
+        undetected_scraper.close()
         
     except Exception as e:
         print(f"❌ 팩토리 함수 테스트 실패: {e}")
@@ -120,7 +124,9 @@ def test_merge_excel():
             
             print("✅ 정보량 점수 로직 적용됨 (문서코드+법령명 그룹)")
             
-            scraper.driver.quit()
+            # 병합만 수행했으므로 브라우저가 실행되지 않아야 함
+            assert not scraper.has_driver, "병합 중 드라이버가 실행됨"
+            scraper.close()
         
     except Exception as e:
         print(f"❌ merge_excel 테스트 실패: {e}")
@@ -128,6 +134,240 @@ def test_merge_excel():
         
     return True
 
+def test_aimd_controller():
+    """AIMD 동시성 제어기 테스트"""
+    print("\n=== AIMD 동시성 제어기 테스트 ===")
+    
+    try:
+        from scraper.concurrency import AIMDController, OK, TIMEOUT, BLOCKED
+        
+        controller = AIMDController(min_level=1, max_level=4, window=5, cooldown=0)
+        
+        # 정상 응답이 이어지면 가산 증가
+        for _ in range(15):
+            controller.record(OK, 1.0)
+        assert controller.level == 4, f"가산 증가 미작동: {controller.level}"
+        print(f"✅ 정상 응답 후 동시성: {controller.level}")
+        
+        # 타임아웃/차단 시 곱셈 감소
+        controller.record(TIMEOUT)
+        assert controller.level == 2, f"곱셈 감소 미작동: {controller.level}"
+        controller.record(BLOCKED)
+        assert controller.level == 1, f"최소값 유지 실패: {controller.level}"
+        print(f"✅ 타임아웃/차단 후 동시성: {controller.level}")
+        
+    except Exception as e:
+        print(f"❌ AIMD 제어기 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_metrics_export():
+    """단계별 계측 및 Prometheus textfile 테스트"""
+    print("\n=== 계측(metrics) 테스트 ===")
+    
+    try:
+        from metrics_util import Metrics, MetricsExporter
+        import tempfile
+        
+        metrics = Metrics()
+        with metrics.timer("go_to_law_list"):
+            pass
+        metrics.inc("docs_total", result="ok")
+        metrics.set_gauge("queue_depth", 7)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = MetricsExporter("smoke", metrics=metrics, metrics_dir=temp_dir, interval=60).start()
+            summary = exporter.stop()
+            text = (Path(temp_dir) / "smoke.prom").read_text(encoding="utf-8")
+        
+        assert 'vietscrap_stage_seconds_count{pipeline="smoke",stage="go_to_law_list"} 1' in text, "히스토그램 누락"
+        assert 'vietscrap_docs_total{pipeline="smoke",result="ok"} 1' in text, "카운터 누락"
+        assert summary["stages"][0]["stage"] == "go_to_law_list", "요약 단계 누락"
+        print(f"✅ textfile {len(text.splitlines())}줄, 요약 단계 {len(summary['stages'])}개")
+        
+    except Exception as e:
+        print(f"❌ 계측 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_doc_store():
+    """문서 저장소 업서트 및 merged_result.csv 내보내기 테스트"""
+    print("\n=== 문서 저장소 테스트 ===")
+    
+    try:
+        from storage import DocStore
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = DocStore(Path(temp_dir) / "store.sqlite")
+            info = {"regionID": "TW", "itemID": "1", "문서코드": "DOC1", "법령명": "법령A", "url": "u1"}
+            relation = {"regionID": "TW", "itemID": "1", "relation_itemID": "2", "관계유형": "A"}
+            store.upsert_docs([info], [relation])
+            
+            # 같은 문서를 다시 수집하면 기본정보는 교체, 관계정보는 새 결과로 대체
+            store.upsert_docs([dict(info, 법령명="법령A수정")], [dict(relation, relation_itemID="3")])
+            assert store.count("info") == 1, "키 기준 업서트 미작동"
+            assert [r["relation_itemID"] for r in store.records("relation")] == ["3"], "관계정보 교체 미작동"
+            
+            # 내용이 같은 문서를 다시 수집하면 다시 쓰지 않음 (내용 해시 비교, 버전 유지)
+            version = store.version("info")
+            saved = store.upsert_docs([dict(info, 법령명="법령A수정")], [dict(relation, relation_itemID="3")])
+            assert saved["unchanged"] == 1 and store.version("info") == version, "내용 해시 비교 미작동"
+            
+            # 관계정보 추출 실패(빈 결과)로 다시 수집된 문서는 기존 자식 행, 버전, 확인 기록 유지
+            checks = store.check_frame("info", ["itemID"])["checks"].iloc[0]
+            saved = store.upsert_docs([dict(info, 법령명="법령A수정")], [], incomplete=[info])
+            assert saved["skipped"] == 1 and saved["info"] == 0 and store.version("info") == version, "추출 실패 문서 갱신됨"
+            assert [r["relation_itemID"] for r in store.records("relation")] == ["3"], "추출 실패로 관계정보 삭제됨"
+            assert store.check_frame("info", ["itemID"])["checks"].iloc[0] == checks, "추출 실패 문서가 확인으로 기록됨"
+
+            out_path = Path(temp_dir) / "relation" / "merged_result.csv"
+            assert store.export("relation", out_path), "내보내기 실패"
+            assert not store.export("relation", out_path), "변경 없는 내보내기가 생략되지 않음"
+            merged_df = pd.read_csv(out_path)
+            assert list(merged_df["id"]) == [1], "일련번호 누락"
+
+            # 스키마 타입: 수집 문자열 "1"과 CSV 숫자 1이 같은 Int64, 반복 값 컬럼은 category
+            from storage.schema import read_csv
+            typed = read_csv(out_path, "relation")
+            assert str(typed["itemID"].dtype) == "Int64" and typed["itemID"].iloc[0] == 1, "ID 타입 불일치"
+            assert str(typed["관계유형"].dtype) == "category", "category 타입 미적용"
+            print(f"✅ 업서트/내보내기 완료: info {store.count('info')}건, relation {len(merged_df)}건")
+            store.close()
+        
+    except Exception as e:
+        print(f"❌ 문서 저장소 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_delta_export():
+    """law_combined 변경분(delta) 내보내기 테스트"""
+    print("\n=== 변경분(delta) 테스트 ===")
+    
+    try:
+        from storage.delta import write_delta, load_manifest, delta_dir
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = Path(temp_dir) / "info" / "베트남_법령_기본정보.csv"
+            df = pd.DataFrame({"regionID": ["TW", "TW", "hanoi"], "itemID": [1, 2, 3], "법령명": ["A", "B", "C"]})
+            assert write_delta(df, out_path, "info") == 1, "첫 버전 기록 실패"
+            assert write_delta(df, out_path, "info") is None, "변경 없는 병합이 새 버전을 만듦"
+            
+            # 2 변경, 3 삭제, 4 추가
+            df2 = pd.DataFrame({"regionID": ["TW", "TW", "hanoi"], "itemID": [1, 2, 4], "법령명": ["A", "B수정", "D"]})
+            assert write_delta(df2, out_path, "info") == 2, "버전 증가 실패"
+            folder = delta_dir(out_path, "info")
+            entry = load_manifest(folder)["deltas"][-1]
+            delta = pd.read_csv(folder / entry["file"])
+            assert sorted(zip(delta["_op"], delta["itemID"])) == [("add", 4), ("change", 2), ("remove", 3)], "변경분 불일치"
+            print(f"✅ 버전 {entry['version']}: 추가 {entry['added']}, 변경 {entry['changed']}, 삭제 {entry['removed']}")
+        
+    except Exception as e:
+        print(f"❌ 변경분 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_search_index():
+    """조회 서버 인덱스(해시/정렬/포스팅) 테스트"""
+    print("\n=== 조회 인덱스 테스트 ===")
+    
+    try:
+        from search import TableIndex
+        
+        df = pd.DataFrame({
+            "regionID": ["TW", "TW", "hanoi"], "itemID": [1, 2, 3], "문서코드": ["1/NĐ-CP", "2/QĐ", "3/QĐ"],
+            "문서유형": ["Nghị định", "Quyết định", "Quyết định"], "발급기관": ["Chính phủ", "Chính phủ", "UBND"],
+            "발행일": ["2020-01-05", "2021-03-01", "-"],
+        })
+        index = TableIndex("info", df)
+        assert [r["itemID"] for r in index.lookup("itemID", "2")] == [2], "해시 인덱스 조회 실패"
+        result = index.query({"발급기관": "chính phủ", "발행일_from": "2020-01-01", "sort": "-발행일"})
+        assert [r["itemID"] for r in result["rows"]] == [2, 1], "포스팅/정렬 조회 실패"
+        assert index.query({"문서유형": "Quyết định", "발행일_to": "2020-12-31"})["total"] == 0, "날짜 범위 조회 실패"
+        print(f"✅ 조회 완료: {result['total']}건")
+        
+    except Exception as e:
+        print(f"❌ 조회 인덱스 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_fulltext_index():
+    """제목 전문 검색(성조 무시, BM25, delta 증분 갱신) 테스트"""
+    print("\n=== 제목 검색 테스트 ===")
+    
+    try:
+        from storage.delta import write_delta
+        from search.fulltext import FullTextIndex, update_index, index_dir
+        import tempfile
+    
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = Path(temp_dir) / "info" / "베트남_법령_기본정보.csv"
+            titles = ["Nghị định về thuế", "Thông tư hướng dẫn thuế", "Quyết định phê duyệt"] + [f"Công văn số {i}" for i in range(7)]
+            df = pd.DataFrame({"regionID": "TW", "itemID": range(1, 11), "법령명": titles})
+            write_delta(df, out_path, "info")
+            assert update_index(df, out_path, "info"), "인덱스 구성 실패"
+            index = FullTextIndex.open(index_dir(out_path, "info"))
+            assert index.search("NGHI DINH thue")[0]["itemID"] == 1, "성조 무시/순위 불일치"
+            assert sorted(h["itemID"] for h in index.search("thuế")) == [1, 2], "검색 결과 불일치"
+    
+            # 2 제목 변경 → 새 세그먼트 추가 + 기존 문서 삭제 표시
+            df.loc[1, "법령명"] = "Thông tư sửa đổi"
+            write_delta(df, out_path, "info")
+            assert update_index(df, out_path, "info"), "증분 갱신 실패"
+            index = FullTextIndex.open(index_dir(out_path, "info"))
+            assert len(index.segments) == 2, "증분 세그먼트 없음"
+            assert [h["itemID"] for h in index.search("thuế")] == [1], "삭제 표시 미반영"
+            assert [h["itemID"] for h in index.search("sua doi")] == [2], "변경 문서 검색 실패"
+    
+            # q + 조건: 조건을 상위 N건 선택 전에 적용, total은 전체 일치 수
+            from search import TableIndex
+            table = TableIndex("info", df, fulltext=index)
+            assert table.query({"q": "cong van", "limit": 2})["total"] == 7, "전체 일치 수 불일치"
+            result = table.query({"q": "cong van", "itemID": "10", "limit": 1})
+            assert result["total"] == 1 and result["rows"][0]["itemID"] == 10, "조건 적용 검색 실패"
+            print(f"✅ 세그먼트 {len(index.segments)}개, 문서 {index.docs}건")
+    
+    except Exception as e:
+        print(f"❌ 제목 검색 테스트 실패: {e}")
+        return False
+    
+    return True
+
+def test_relation_graph():
+    """관계 그래프(CSR) 이웃/BFS/대상 없는 관계 테스트"""
+    print("\n=== 관계 그래프 테스트 ===")
+    
+    try:
+        from search.graph import RelationGraph, build_graph
+        import tempfile
+        
+        # 1 → 2 → 3 (개정), 4 → 1 (근거), 3 → 9 (기본정보에 없음)
+        relation = pd.DataFrame({
+            "itemID": [1, 2, 4, 3, 1], "relation_itemID": [2, 3, 1, 9, None],
+            "관계유형": ["Văn bản sửa đổi", "Văn bản sửa đổi", "Văn bản căn cứ", "Văn bản căn cứ", "Văn bản căn cứ"],
+        })
+        with tempfile.TemporaryDirectory() as temp_dir:
+            build_graph(relation, [1, 2, 3, 4], Path(temp_dir) / "graph")
+            graph = RelationGraph.open(Path(temp_dir) / "graph")
+            assert [n["itemID"] for n in graph.neighbors(1, "in")] == [4], "역방향 이웃 불일치"
+            assert graph.bfs(1, "out") == {1: 0, 2: 1, 3: 2, 9: 3}, "BFS 깊이 불일치"
+            assert graph.closure(1, "out", types=["văn bản sửa đổi"]) == {2, 3}, "관계유형 필터 미작동"
+            assert graph.closure(3, "in") == {1, 2, 4}, "역방향 폐포 불일치"
+            assert graph.dangling()["relation_itemID"].tolist() == [9], "대상 없는 관계 누락"
+            print(f"✅ 노드 {graph.size}개, 간선 {graph.manifest['edges']}개, 대상 없음 {graph.manifest['dangling']}건")
+        
+    except Exception as e:
+        print(f"❌ 관계 그래프 테스트 실패: {e}")
+        return False
+    
+    return True
+
 def test_output_directories():
     """출력 디렉토리 구조 테스트"""
     print("\n=== 출력 디렉토리 테스트 ===")
@@ -175,6 +415,13 @@ def main():
         ("임포트", test_imports),
         ("팩토리 함수", test_factory_functions), 
         ("merge_excel", test_merge_excel),
+        ("AIMD 제어기", test_aimd_controller),
+        ("계측", test_metrics_export),
+        ("문서 저장소", test_doc_store),
+        ("변경분", test_delta_export),
+        ("조회 인덱스", test_search_index),
+        ("제목 검색", test_fulltext_index),
+        ("관계 그래프", test_relation_graph),
         ("출력 디렉토리", test_output_directories),
         ("로그 파일", test_log_files)
     ]
@@ -0,0 +1,3 @@
+# storage/__init__.py
+from storage.doc_store import DocStore, STORE_NAME, TABLES, dedupe_info_by_score
+from storage.columnar import FORMATS, read_table, write_table, link_table, table_exists
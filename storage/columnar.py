@@ -0,0 +1,169 @@
+### storage/columnar.py ###
+# 출력 형식(CSV / Parquet) 선택과 표 읽기/쓰기 - pyarrow 설치 시 Parquet 사용 가능
+#
+#   VIETSCRAP_FORMAT=csv|parquet|both   (CLI: --format, 기본 csv)
+#   write_table(df, "output/central_law/info/merged_result.csv")
+#       → merged_result.csv 및/또는 merged_result.parquet/regionID=TW/part-0.parquet (zstd)
+#   read_table("output/central_law/info/merged_result.csv", columns=["url"], filters=[("regionID", "=", "TW")])
+#       → Parquet이 있으면 필요한 컬럼/파티션만 읽음 (없으면 CSV)
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from storage.schema import HAS_PYARROW, apply_schema, read_csv
+
+ENV_FORMAT = "VIETSCRAP_FORMAT"
+FORMATS = ("csv", "parquet", "both")
+DEFAULT_FORMAT = "csv"
+PARTITION_COL = "regionID"
+COMPRESSION = "zstd"
+_COLUMNS_KEY = b"vietscrap.columns"  # 원래 컬럼 순서 (파티션 컬럼은 읽을 때 맨 뒤로 붙으므로)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def set_format(fmt: str):
+    """CLI 옵션 → 환경변수 (spawn된 파이프라인 프로세스에도 전달됨)"""
+    os.environ[ENV_FORMAT] = fmt
+
+
+def resolve_format(fmt: str = None) -> str:
+    """출력 형식 결정 - Parquet 지정 시 pyarrow가 없으면 CSV로 대체"""
+    fmt = (fmt or os.environ.get(ENV_FORMAT) or DEFAULT_FORMAT).strip().lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"알 수 없는 출력 형식: {fmt} (선택: {', '.join(FORMATS)})")
+    if fmt != "csv" and not HAS_PYARROW:
+        LOGGER.warning(f"[columnar] pyarrow 미설치, {fmt} 대신 csv로 저장 (pip install pyarrow)")
+        return "csv"
+    return fmt
+
+
+def parquet_path(csv_path) -> Path:
+    """merged_result.csv → merged_result.parquet (데이터셋 폴더)"""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def table_exists(csv_path) -> bool:
+    return Path(csv_path).exists() or parquet_path(csv_path).exists()
+
+
+def to_arrow(df, table: str = None) -> "pa.Table":
+    """스키마 타입(storage.schema)으로 변환 - category는 dictionary, ID는 int64, 텍스트는 string"""
+    import pyarrow as pa
+
+    arrow = pa.Table.from_pandas(apply_schema(df, table), preserve_index=False)
+    order = json.dumps(list(df.columns), ensure_ascii=False).encode()
+    return arrow.replace_schema_metadata({**(arrow.schema.metadata or {}), _COLUMNS_KEY: order})
+
+
+def _write_parquet(df, path: Path, table: str = None):
+    """Parquet 데이터셋 저장 (regionID 컬럼이 있으면 파티션) - 임시 폴더에 쓴 뒤 교체"""
+    import pyarrow.parquet as pq
+
+    tmp = path.with_name(path.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    arrow = to_arrow(df, table)
+    partition_cols = [PARTITION_COL] if PARTITION_COL in df.columns and len(df) else None
+    pq.write_to_dataset(arrow, tmp, partition_cols=partition_cols, compression=COMPRESSION,
+                        basename_template="part-{i}.parquet")
+    _replace_dir(tmp, path)
+
+
+def _replace_dir(tmp: Path, path: Path):
+    """임시 폴더로 데이터셋 폴더 교체"""
+    old = path.with_name(path.name + ".old")
+    shutil.rmtree(old, ignore_errors=True)
+    if path.exists():
+        path.rename(old)
+    tmp.rename(path)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def write_table(df, csv_path, fmt: str = None, table: str = None):
+    """출력 형식에 따라 CSV 및/또는 Parquet 저장 (table: 스키마 이름, 없으면 컬럼 이름으로 타입 결정)"""
+    csv_path = Path(csv_path)
+    fmt = resolve_format(fmt)
+    df = apply_schema(df, table)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt in ("csv", "both"):
+        tmp = csv_path.with_name(csv_path.name + ".tmp")
+        df.to_csv(tmp, index=False, encoding='utf-8')
+        os.replace(tmp, csv_path)
+    if fmt in ("parquet", "both"):
+        _write_parquet(df, parquet_path(csv_path), table)
+
+
+def _link_file(src, dst):
+    """하드링크 (다른 파일시스템 등 링크할 수 없으면 복사)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def link_table(src_csv, dst_csv, fmt: str = None) -> bool:
+    """파싱/직렬화 없이 표 파일을 다른 이름으로 연결 (하드링크, 안 되면 복사)
+
+    출력 형식의 원본 파일이 모두 있을 때만 연결하고 True, 하나라도 없으면 False (write_table로 저장 필요)
+    저장은 항상 임시 파일 → 교체 방식이라 한쪽을 다시 저장해도 다른 쪽 내용은 바뀌지 않음
+    """
+    src_csv, dst_csv = Path(src_csv), Path(dst_csv)
+    fmt = resolve_format(fmt)
+    use_csv, use_parquet = fmt in ("csv", "both"), fmt in ("parquet", "both")
+    if (use_csv and not src_csv.exists()) or (use_parquet and not parquet_path(src_csv).exists()):
+        return False
+    dst_csv.parent.mkdir(parents=True, exist_ok=True)
+    if use_csv:
+        tmp = dst_csv.with_name(dst_csv.name + ".tmp")
+        tmp.unlink(missing_ok=True)
+        _link_file(src_csv, tmp)
+        os.replace(tmp, dst_csv)
+    if use_parquet:
+        dst = parquet_path(dst_csv)
+        tmp = dst.with_name(dst.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(parquet_path(src_csv), tmp, copy_function=_link_file)
+        _replace_dir(tmp, dst)
+    return True
+
+
+def _use_parquet(csv_path: Path) -> bool:
+    """Parquet이 있고 CSV보다 오래되지 않았으면 Parquet 사용"""
+    path = parquet_path(csv_path)
+    if not HAS_PYARROW or not path.exists():
+        return False
+    return not csv_path.exists() or path.stat().st_mtime >= csv_path.stat().st_mtime
+
+
+def read_table(csv_path, columns=None, filters=None, table: str = None):
+    """표 읽기 - Parquet이면 컬럼 프로젝션/조건 푸시다운, CSV면 usecols + 읽은 뒤 필터
+
+    filters: [(컬럼, "="|"!="|"in", 값), ...] (pyarrow filters 형식)
+    컬럼 타입은 어느 쪽이든 스키마(storage.schema)에 맞춰 반환
+    """
+    csv_path = Path(csv_path)
+    if _use_parquet(csv_path):
+        import pyarrow.parquet as pq
+
+        arrow = pq.read_table(parquet_path(csv_path), columns=columns, filters=filters or None)
+        df = arrow.to_pandas()
+        order = json.loads((arrow.schema.metadata or {}).get(_COLUMNS_KEY, b"[]"))
+        order = [c for c in order if c in df.columns]
+        return apply_schema(df[order + [c for c in df.columns if c not in order]], table)
+
+    cols = list(dict.fromkeys(list(columns or []) + [c for c, _, _ in filters or []])) or None
+    df = read_csv(csv_path, table, columns=cols)
+    for col, op, value in filters or []:
+        s = df[col].astype(str)
+        if op == "=":
+            df = df[s == str(value)]
+        elif op == "!=":
+            df = df[s != str(value)]
+        elif op == "in":
+            df = df[s.isin([str(v) for v in value])]
+        else:
+            raise ValueError(f"지원하지 않는 조건: {op}")
+    return df[columns].reset_index(drop=True) if columns else df.reset_index(drop=True)
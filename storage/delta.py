@@ -0,0 +1,164 @@
+### storage/delta.py ###
+# law_combined 변경분(delta) 내보내기 - 병합할 때마다 직전 출력과 비교해 추가/변경/삭제 행을 버전 번호와 함께 기록
+#
+#   output/law_combined/delta/{table}/
+#     manifest.json   {"table", "key", "version", "deltas": [{"version", "file", "added", "changed", "removed", ...}]}
+#     v000012.csv     _op(add|change|remove) + 출력 컬럼 (remove 행은 키 컬럼만)
+#     state.csv       키별 내용 해시 (다음 병합의 비교 기준)
+#
+#   소비 측: 가진 버전이 v이면 manifest의 v+1 … version delta를 순서대로 적용
+#            (add/change: 해당 키의 행을 delta 행으로 교체, remove: 해당 키의 행 삭제)
+#            v+1 delta가 없거나 full이면 law_combined 전체 파일을 다시 읽음
+#   관계정보/다운로드링크는 문서(regionID+itemID) 단위 - 문서의 행 중 하나라도 바뀌면 그 문서의 행 전체가 change
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+DELTA_DIR = "delta"
+MANIFEST_NAME = "manifest.json"
+STATE_NAME = "state.csv"
+OP = "_op"
+KEEP = 100  # 보관할 delta 파일 수 (더 오래된 버전의 소비자는 전체 파일을 다시 읽음)
+HASH_ROWS = 16384  # 행 해시를 한 번에 계산할 행 수
+
+# 테이블 → 변경 단위 키
+KEYS = {
+    "info": ["regionID", "itemID"],
+    "relation": ["regionID", "itemID"],
+    "download_link": ["regionID", "itemID"],
+    "directive": ["docid"],
+}
+IGNORE_COLUMNS = {"id"}  # 병합 때마다 다시 매기는 일련번호 - 비교에서 제외
+
+LOGGER = logging.getLogger(__name__)
+
+
+def delta_dir(out_path, table: str) -> Path:
+    """output/law_combined/{sub}/{이름}.csv → output/law_combined/delta/{table}"""
+    return Path(out_path).parent.parent / DELTA_DIR / table
+
+
+def load_manifest(folder, table: str = None) -> dict:
+    path = Path(folder) / MANIFEST_NAME
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"table": table, "key": KEYS.get(table, []), "version": 0, "deltas": []}
+
+
+def _replace_text(path: Path, write):
+    """임시 파일에 쓴 뒤 교체"""
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_manifest(folder: Path, manifest: dict):
+    _replace_text(folder / MANIFEST_NAME,
+                  lambda p: p.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"))
+
+
+def hash_rows(df: pd.DataFrame) -> np.ndarray:
+    """행별 내용 해시 - HASH_ROWS행씩 (문자열 컬럼은 해시할 때 파이썬 객체로 풀리므로 한 번에 풀리는 양을 제한, 값은 같음)"""
+    if len(df) <= HASH_ROWS:
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return np.concatenate([pd.util.hash_pandas_object(df.iloc[i:i + HASH_ROWS], index=False).to_numpy()
+                           for i in range(0, len(df), HASH_ROWS)])
+
+
+def _hashes(df: pd.DataFrame, keys):
+    """(행별 키 해시, 정렬된 고유 키 해시, 키별 내용 해시, 키별 첫 행 위치)
+
+    같은 키의 행이 여러 개면 행 해시를 더해 문서 단위 해시로 (행 순서와 무관)
+    """
+    row_key = hash_rows(df[keys])
+    row_hash = hash_rows(df[[c for c in df.columns if c not in IGNORE_COLUMNS]])
+    order = np.argsort(row_key, kind="stable")
+    key = row_key[order]
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]]) if len(key) else np.array([], dtype=np.intp)
+    digest = np.add.reduceat(row_hash[order], starts) if len(key) else np.array([], dtype=np.uint64)
+    return row_key, key[starts], digest, order[starts]
+
+
+def _read_state(folder: Path, keys=()) -> Optional[pd.DataFrame]:
+    """비교 기준 (_key, _hash) + keys 컬럼"""
+    path = folder / STATE_NAME
+    if not path.exists():
+        return None
+    dtype = {"_key": "uint64", "_hash": "uint64", **{c: str for c in keys}}
+    return pd.read_csv(path, dtype=dtype, usecols=list(dtype), keep_default_na=False)
+
+
+def delta_source(out_path, table: str) -> Optional[str]:
+    """마지막 write_delta에 넘긴 입력 식별자 (같으면 입력을 다시 읽어 비교할 필요 없음)"""
+    return load_manifest(delta_dir(out_path, table), table).get("source")
+
+
+def write_delta(df: pd.DataFrame, out_path, table: str, logger=None, source: str = None) -> Optional[int]:
+    """직전 병합 결과와 비교해 delta 파일과 새 버전 기록 - 반환: 새 버전 (변경 없으면 None)
+
+    첫 병합(비교 기준 없음)은 delta 파일 없이 full 버전으로 기록
+    source: 입력 식별자 (저장소 버전, 파일 크기/수정 시각 등) - manifest에 기록, delta_source로 조회
+    """
+    logger = logger or LOGGER
+    keys = [c for c in KEYS.get(table, []) if c in df.columns]
+    if not keys:
+        return None
+    folder = delta_dir(out_path, table)
+    folder.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(folder, table)
+    prev = _read_state(folder) if manifest["version"] else None
+
+    row_key, key, digest, first = _hashes(df, keys)
+    version = manifest["version"] + 1
+    entry = {"version": version, "rows": len(df), "created": datetime.now().isoformat(timespec="seconds")}
+    if prev is None:
+        entry.update(file=None, full=True)
+    else:
+        prev_key, prev_hash = prev["_key"].to_numpy(), prev["_hash"].to_numpy()
+        pos = np.searchsorted(prev_key, key).clip(max=max(len(prev_key) - 1, 0))
+        found = (prev_key[pos] == key) if len(prev_key) else np.zeros(len(key), dtype=bool)
+        added = key[~found]
+        changed = key[found & (prev_hash[pos] != digest)]
+        removed = ~np.isin(prev_key, key)
+        if not (len(added) or len(changed) or removed.any()):
+            logger.info(f"[delta] {table} 변경 없음 (버전 {manifest['version']} 유지)")
+            if source is not None and manifest.get("source") != source:
+                manifest["source"] = source
+                _write_manifest(folder, manifest)
+            return None
+
+        parts = [df[np.isin(row_key, added)].assign(**{OP: "add"}),
+                 df[np.isin(row_key, changed)].assign(**{OP: "change"})]
+        if removed.any():  # 키 컬럼(문자열)은 삭제 행이 있을 때만 읽음
+            parts.append(_read_state(folder, keys).loc[removed, keys].assign(**{OP: "remove"}))
+        delta = pd.concat([p for p in parts if len(p)], ignore_index=True)
+        delta = delta[[OP] + [c for c in delta.columns if c != OP]]
+        entry.update(file=f"v{version:06d}.csv", added=len(added), changed=len(changed), removed=int(removed.sum()))
+        _replace_text(folder / entry["file"], lambda p: delta.to_csv(p, index=False, encoding="utf-8"))
+
+    # delta 파일 → manifest → 비교 기준 순서로 저장 (중간에 끊기면 다음 delta가 이번 변경분을 다시 포함)
+    deltas = manifest["deltas"] + [entry]
+    for old in deltas[:-KEEP]:
+        if old.get("file"):
+            (folder / old["file"]).unlink(missing_ok=True)
+    manifest.update(table=table, key=keys, version=version, deltas=deltas[-KEEP:], source=source)
+    _write_manifest(folder, manifest)
+
+    state = pd.DataFrame({"_key": key, "_hash": digest})
+    for c in keys:
+        state[c] = df[c].iloc[first].to_numpy()
+    _replace_text(folder / STATE_NAME, lambda p: state.to_csv(p, index=False, encoding="utf-8"))
+
+    if entry.get("full"):
+        logger.info(f"[delta] {table} 버전 {version}: 전체 기준 ({len(df)}행)")
+    else:
+        logger.info(f"[delta] {table} 버전 {version}: 추가 {entry['added']}, 변경 {entry['changed']}, "
+                    f"삭제 {entry['removed']} → {folder / entry['file']}")
+    return version
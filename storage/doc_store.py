@@ -0,0 +1,482 @@
+### storage/doc_store.py ###
+# SQLite(WAL) 문서 저장소 - 수집 결과의 원본, merged_result.csv는 여기서 내보내는 결과물
+#
+#   store = DocStore("output/central_law/store.sqlite")
+#   store.upsert_docs(infos, relations, download_links)   # 청크 단위 1 트랜잭션
+#   store.export("info", "output/central_law/info/merged_result.csv")
+#
+# 키: info (regionID, itemID) / relation, download_link는 문서 (regionID, itemID) 아래 자식 행 / directive (docid)
+# 같은 키는 나중에 저장한 값으로 교체되므로, 갱신 비용은 전체 건수가 아니라 바뀐 문서 수에 비례합니다.
+# 문서 테이블(info, directive)은 내용 해시를 함께 저장 - 다시 수집한 문서가 그대로면 다시 쓰지 않고 확인 기록만 남김
+
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from storage.columnar import resolve_format, write_table, table_exists
+from storage.schema import TEXT, apply_schema, read_csv
+
+STORE_NAME = "store.sqlite"
+BATCH_ROWS = 5000  # CSV 가져오기 시 트랜잭션당 행 수
+
+# 테이블 → 키 필드 (수집 레코드의 컬럼명, 순서대로 SQL 키 컬럼 k0, k1.. 에 저장)
+TABLES = {
+    "info": ("regionID", "itemID"),
+    "relation": ("regionID", "itemID", "relation_itemID", "관계유형"),
+    "download_link": ("regionID", "itemID", "다운로드 링크"),
+    "directive": ("docid",),
+}
+CHILD_TABLES = ("relation", "download_link")  # 문서 재수집 시 통째로 교체, 내보낼 때 id 부여
+DOC_TABLES = ("info", "directive")  # 문서 단위 테이블 - 내용 해시, 재검증 기록(확인 시각/횟수, 변경 횟수)
+_DOC_COLUMNS = {"hash": "TEXT", "checked_at": "REAL", "checks": "INTEGER NOT NULL DEFAULT 0",
+                "changes": "INTEGER NOT NULL DEFAULT 0"}
+HASH_EXCLUDE = {"id"}  # 내보낼 때 다시 매기는 일련번호
+
+# 가져오기(import)에서 제외 - 내보내기 결과물과 업데이트 기록 (업데이트는 저장소에 직접 반영됨)
+EXPORT_NAME = "merged_result.csv"
+UPDATE_PREFIX = "updated_result"
+
+
+def _table_sql(table: str, keys) -> str:
+    cols = ", ".join(f"k{i} TEXT NOT NULL" for i in range(len(keys)))
+    pk = ", ".join(f"k{i}" for i in range(len(keys)))
+    extra = "".join(f", {c} {t}" for c, t in _DOC_COLUMNS.items()) if table in DOC_TABLES else ""
+    return (f"CREATE TABLE IF NOT EXISTS {table} ({cols}, data TEXT NOT NULL, "
+            f"updated_at REAL NOT NULL{extra}, UNIQUE ({pk}));")
+
+
+_SCHEMA = "\n".join([_table_sql(t, k) for t, k in TABLES.items()] + [
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);",
+    "CREATE TABLE IF NOT EXISTS imports (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, rows INTEGER);",
+])
+
+
+def key_value(value) -> str:
+    """키 값 정규화 - CSV에서 읽은 숫자(123, 123.0)와 수집한 문자열('123')을 같은 키로, 빈 값 표시 '-'는 빈 키로"""
+    if value is None or value == "-":
+        return ""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    return str(value).strip()
+
+
+def doc_hash(record: dict, *children) -> str:
+    """문서 내용 해시 - 기본정보 + 자식 행(관계정보, 다운로드링크) 목록, 키 값처럼 정규화하고 행 순서와 무관"""
+    h = hashlib.blake2b(digest_size=16)
+    for rows in ([record],) + children:
+        lines = sorted(json.dumps({k: key_value(v) for k, v in r.items() if k not in HASH_EXCLUDE},
+                                  ensure_ascii=False, sort_keys=True, default=_json_default) for r in rows if r)
+        h.update("\n".join(lines).encode())
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+def _json_default(value):
+    # numpy 스칼라 등 (CSV 가져오기 시)
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def dedupe_info_by_score(combined):
+    """법령 info - 문서코드+법령명 그룹에서 '정보가 많은' 행만 남김 (컬럼이 없으면 그대로 반환)"""
+    import numpy as np
+    import pandas as pd
+
+    if not {"문서코드", "법령명"}.issubset(combined.columns):
+        return combined
+
+    # 문자열 연산은 스키마 텍스트 타입 그대로 (string[pyarrow]면 Arrow 연산 - 파이썬 문자열 객체로 풀지 않음)
+    def _norm(s):
+        s = s.astype(TEXT).str.strip().str.replace(r"\s+", " ", regex=True).str.lower()
+        return s.mask(s.isin(["-", "", "none"]))
+
+    # 그룹 키(정규화)
+    code_norm = _norm(combined["문서코드"])
+    title_norm = _norm(combined["법령명"])
+    mask = (code_norm.notna() & title_norm.notna()).to_numpy()
+
+    # '정보량 점수' 계산: 값이 채워진 컬럼 수 + 가중치
+    filled_cols = [
+        "문서코드","법령명","문서유형","발급기관","유효상태",
+        "발행일","발효일","서명자 직위","서명자","유효범위",
+        "itemID","regionID","url"
+    ]
+    def _is_filled(col: pd.Series) -> pd.Series:
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            # category는 카테고리 값만 검사 후 코드로 펼침 (코드 -1 = 빈 값)
+            cats = pd.Series(col.cat.categories.astype(str)).str.strip().str.lower()
+            filled = (~cats.isin({"", "-", "none"})).astype(int).to_numpy().tolist() + [0]
+            return pd.Series(pd.Series(filled).to_numpy()[col.cat.codes.to_numpy()], index=col.index)
+        s = col.astype(TEXT).fillna("").str.strip().str.lower()
+        return (~s.isin(["", "-", "none"])).astype(int)
+
+    # 기본 점수: 채워진 컬럼 수
+    filled_df = combined.reindex(columns=filled_cols, fill_value=pd.NA)
+    filled_mask = filled_df.apply(_is_filled, axis=0)
+    base_score = filled_mask.sum(axis=1)
+
+    # 중요 필드 가중치
+    bonus = (
+        _is_filled(combined.get("발행일", pd.Series(index=combined.index))) +
+        _is_filled(combined.get("발효일", pd.Series(index=combined.index))) +
+        _is_filled(combined.get("유효상태", pd.Series(index=combined.index))) +
+        _is_filled(combined.get("발급기관", pd.Series(index=combined.index)))
+    )
+
+    # 길이 힌트
+    def _str_len(col: pd.Series) -> pd.Series:
+        # astype(str).str.len()과 같은 값 - category는 카테고리만 계산 (빈 값은 "nan"), 텍스트는 Arrow 연산
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            lens = col.cat.categories.astype(str).str.len().to_numpy().tolist() + [len("nan")]
+            return pd.Series(pd.Series(lens).to_numpy()[col.cat.codes.to_numpy()], index=col.index)
+        return col.astype(TEXT).str.len().fillna(0)
+
+    len_hint = (
+        _str_len(combined["법령명"]) +
+        (_str_len(combined["발급기관"]) if "발급기관" in combined.columns else 0)
+    )
+
+    score = (base_score + bonus).to_numpy()
+    len_hint = np.asarray(len_hint, dtype=np.int64)
+
+    # 그룹(정규화 키 순) 내에서 점수 → 길이 힌트 → 뒤쪽 행 순으로 최고점 선택 후 키 없는 행을 뒤에
+    # 키는 정렬된 정수 코드로 바꿔 lexsort - 프레임 전체를 정렬/복사하지 않고 남길 행만 한 번 take
+    pos = np.flatnonzero(mask)
+    code = pd.factorize(code_norm.iloc[pos], sort=True)[0]
+    title = pd.factorize(title_norm.iloc[pos], sort=True)[0]
+    order = np.lexsort((-pos, -len_hint[pos], -score[pos], title, code))
+    code, title = code[order], title[order]
+    first = np.r_[True, (code[1:] != code[:-1]) | (title[1:] != title[:-1])] if len(order) else np.zeros(0, dtype=bool)
+    rows = np.concatenate([pos[order[first]], np.flatnonzero(~mask)])
+    return combined.take(rows).reset_index(drop=True)
+
+
+class DocStore:
+    """테이블별 키 업서트 저장소 (스레드별 연결, 여러 프로세스가 같은 파일을 써도 WAL + BEGIN IMMEDIATE로 직렬화)"""
+
+    def __init__(self, path, logger=None):
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self._local = threading.local()
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """해시 도입 전 저장소 - 문서 테이블에 컬럼 추가 (기존 문서의 해시는 처음 다시 수집할 때 계산)"""
+        conn = self._conn()
+        for table in DOC_TABLES:
+            have = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for col, sql_type in _DOC_COLUMNS.items():
+                if col in have:
+                    continue
+                try:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {sql_type}")
+                except sqlite3.OperationalError:
+                    pass  # 다른 프로세스가 먼저 추가함
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=60000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ----- 쓰기 -----
+    @staticmethod
+    def _row(table: str, record: dict, now: float) -> tuple:
+        keys = tuple(key_value(record.get(f)) for f in TABLES[table])
+        return keys + (json.dumps(record, ensure_ascii=False, default=_json_default), now)
+
+    def _put(self, conn, table: str, records) -> int:
+        now = time.time()
+        rows = [self._row(table, r, now) for r in records if r]
+        if not rows:
+            return 0
+        n = len(TABLES[table])
+        cols = ", ".join(f"k{i}" for i in range(n))
+        # REPLACE는 기존 행을 지우고 새로 넣으므로 내보내기 순서도 '마지막 저장' 기준 (drop_duplicates keep='last'와 동일)
+        conn.executemany(f"INSERT OR REPLACE INTO {table} ({cols}, data, updated_at) "
+                         f"VALUES ({', '.join('?' * (n + 2))})", rows)
+        self._bump(conn, table)
+        return len(rows)
+
+    @staticmethod
+    def _bump(conn, table: str):
+        """테이블 변경 버전 +1 (내보내기 생략 판단용)"""
+        conn.execute("INSERT INTO meta (key, value) VALUES (?, 1) "
+                     "ON CONFLICT(key) DO UPDATE SET value = value + 1", (f"version:{table}",))
+
+    def upsert(self, table: str, records) -> int:
+        """레코드(dict) 목록을 키 기준으로 삽입/교체, 저장 건수 반환"""
+        with self._transaction() as conn:
+            return self._put(conn, table, records)
+
+    def _stored(self, conn, table: str, keys: tuple):
+        """저장된 문서의 (해시, 확인 횟수, 변경 횟수) - 없으면 None, 해시 도입 전 문서는 저장된 내용으로 계산"""
+        where = " AND ".join(f"k{i}=?" for i in range(len(keys)))
+        row = conn.execute(f"SELECT hash, checks, changes, data FROM {table} WHERE {where}", keys).fetchone()
+        if row is None:
+            return None
+        digest, checks, changes, data = row
+        if digest is None:
+            children = [[json.loads(d) for (d,) in conn.execute(f"SELECT data FROM {child} WHERE k0=? AND k1=? "
+                                                                 f"ORDER BY rowid", keys)]
+                        for child in CHILD_TABLES] if table == "info" else []
+            digest = doc_hash(json.loads(data), *children)
+        return digest, checks, changes
+
+    def _put_docs(self, conn, table: str, docs, children=None):
+        """문서 저장 - 내용 해시가 같은 문서는 확인 기록만 갱신
+
+        children: {(regionID, itemID): [자식 행 목록, ...]} (info만)
+        반환: (바뀐/새 문서 레코드, 그대로인 문서 수)
+        """
+        now = time.time()
+        changed, unchanged, stats = [], [], {}
+        for doc in docs:
+            if not doc:
+                continue
+            keys = tuple(key_value(doc.get(f)) for f in TABLES[table])
+            digest = doc_hash(doc, *(children or {}).get(keys, ()))
+            stored = self._stored(conn, table, keys)
+            if stored is not None and stored[0] == digest:
+                unchanged.append((now, digest) + keys)
+                continue
+            checks, changes = stored[1:] if stored else (0, -1)
+            stats[keys] = (digest, now, checks + 1, changes + 1)
+            changed.append(doc)
+
+        where = " AND ".join(f"k{i}=?" for i in range(len(TABLES[table])))
+        if unchanged:
+            conn.executemany(f"UPDATE {table} SET checked_at=?, checks=checks+1, hash=? WHERE {where}", unchanged)
+        if changed:
+            self._put(conn, table, changed)
+            conn.executemany(f"UPDATE {table} SET hash=?, checked_at=?, checks=?, changes=? WHERE {where}",
+                             [stat + keys for keys, stat in stats.items()])
+        return changed, len(unchanged)
+
+    def upsert_docs(self, infos, relations=(), download_links=(), incomplete=()) -> dict:
+        """법령 문서 묶음 저장 (1 트랜잭션) - 다시 수집한 문서의 관계정보/다운로드링크는 새 결과로 교체
+
+        기본정보+관계정보+다운로드링크 내용 해시가 저장된 것과 같은 문서는 다시 쓰지 않음 (버전도 그대로)
+        incomplete: 관계정보/다운로드링크 추출에 실패한 문서의 기본정보 - 이미 저장된 문서는 기본정보, 자식 행,
+        확인 기록 모두 그대로 둠 (실패한 빈 결과로 자식 행을 지우지 않도록, 새 문서는 수집한 만큼 저장)
+        """
+        def doc_key(r):
+            return key_value(r.get("regionID")), key_value(r.get("itemID"))
+
+        def by_doc(rows):
+            grouped = {}
+            for r in rows:
+                if r:
+                    grouped.setdefault(doc_key(r), []).append(r)
+            return grouped
+
+        rels, links = by_doc(relations), by_doc(download_links)
+        with self._transaction() as conn:
+            skipped = {k for k in {doc_key(i) for i in incomplete if i}
+                       if conn.execute("SELECT 1 FROM info WHERE k0=? AND k1=?", k).fetchone()}
+            for k in skipped:
+                rels.pop(k, None)
+                links.pop(k, None)
+            infos = [i for i in infos if i and doc_key(i) not in skipped]
+            doc_keys = {doc_key(i) for i in infos}
+            children = {k: (rels.get(k, []), links.get(k, [])) for k in doc_keys}
+            changed, unchanged = self._put_docs(conn, "info", infos, children)
+            changed_keys = {doc_key(i) for i in changed}
+            for table in CHILD_TABLES:
+                if conn.executemany(f"DELETE FROM {table} WHERE k0=? AND k1=?", changed_keys).rowcount > 0:
+                    self._bump(conn, table)
+            # 그대로인 문서의 자식 행은 이미 같은 내용으로 저장되어 있음 (기본정보 없이 온 자식 행은 그대로 저장)
+            keep = lambda rows: [r for k, group in rows.items() if k in changed_keys or k not in doc_keys for r in group]
+            return {"info": len(changed),
+                    "relation": self._put(conn, "relation", keep(rels)),
+                    "download_link": self._put(conn, "download_link", keep(links)),
+                    "unchanged": unchanged, "skipped": len(skipped)}
+
+    def upsert_checked(self, table: str, records) -> dict:
+        """문서 테이블(directive 등) 업서트 - 내용 해시가 같은 문서는 다시 쓰지 않고 확인 기록만 갱신"""
+        with self._transaction() as conn:
+            changed, unchanged = self._put_docs(conn, table, records)
+            return {table: len(changed), "unchanged": unchanged}
+
+    def import_frame(self, table: str, df) -> int:
+        """DataFrame 가져오기 (BATCH_ROWS 단위 트랜잭션)"""
+        if df.empty:
+            return 0
+        if table in CHILD_TABLES and "id" in df.columns:
+            df = df.drop(columns=["id"])  # 내보낼 때 다시 부여
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        total = 0
+        for start in range(0, len(records), BATCH_ROWS):
+            total += self.upsert(table, records[start:start + BATCH_ROWS])
+        return total
+
+    def import_csv_dir(self, table: str, folder) -> int:
+        """폴더의 새/변경된 CSV를 가져옴 (이전 방식의 청크 CSV, 샤드 결과 등)
+
+        저장소가 비어 있으면 기존 merged_result.csv도 가져오므로, 저장소 도입 전 결과가 내보내기에서 사라지지 않습니다.
+        """
+        folder = Path(folder)
+        if not folder.exists():
+            return 0
+        files = sorted((f for f in folder.glob("*.csv")
+                        if f.name != EXPORT_NAME and not f.name.startswith(UPDATE_PREFIX)),
+                       key=lambda f: (f.stat().st_mtime, f.name))
+        merged = folder / EXPORT_NAME
+        if merged.exists() and not self.count(table):
+            files.insert(0, merged)
+
+        conn = self._conn()
+        total = 0
+        for f in files:
+            stat = f.stat()
+            seen = conn.execute("SELECT mtime, size FROM imports WHERE path=?", (str(f),)).fetchone()
+            if seen == (stat.st_mtime, stat.st_size) or stat.st_size == 0:
+                continue
+            try:
+                n = self.import_frame(table, read_csv(f, table))
+            except Exception as e:
+                self.logger.warning(f"[store] 가져오기 실패: {f} | {e}")
+                continue
+            conn.execute("INSERT OR REPLACE INTO imports (path, mtime, size, rows) VALUES (?, ?, ?, ?)",
+                         (str(f), stat.st_mtime, stat.st_size, n))
+            total += n
+        if total:
+            self.logger.info(f"[store] {folder} CSV {total}행 가져옴 → {table}")
+        return total
+
+    # ----- 읽기 -----
+    def count(self, table: str) -> int:
+        return self._conn().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def version(self, table: str) -> int:
+        row = self._conn().execute("SELECT value FROM meta WHERE key=?", (f"version:{table}",)).fetchone()
+        return int(row[0]) if row else 0
+
+    def urls(self, table: str) -> set:
+        """저장된 문서 URL 집합 (업데이트 시 신규 URL 판별)"""
+        return set(self.frame(table, columns=["url"])["url"].dropna())
+
+    def records(self, table: str):
+        """저장 순서대로 레코드(dict) 반복"""
+        for (data,) in self._conn().execute(f"SELECT data FROM {table} ORDER BY rowid"):
+            yield json.loads(data)
+
+    def frame(self, table: str, columns=None, where: dict = None):
+        """레코드 DataFrame - columns 지정 시 해당 필드만 추출, where는 키 필드 조건 (예: {"regionID": "TW"})"""
+        import pandas as pd
+
+        sql, params = "SELECT data FROM {table}", []
+        if columns:
+            sql = "SELECT " + ", ".join("json_extract(data, ?)" for _ in columns) + " FROM {table}"
+            params = [f'$."{c}"' for c in columns]
+        conds = []
+        for field, value in (where or {}).items():
+            if field not in TABLES[table]:
+                raise ValueError(f"키 필드만 조건으로 사용할 수 있습니다: {field} (키: {TABLES[table]})")
+            conds.append(f"k{TABLES[table].index(field)}=?")
+            params.append(key_value(value))
+        if conds:
+            sql += " WHERE " + " AND ".join(conds)
+        rows = self._conn().execute(sql.format(table=table) + " ORDER BY rowid", params)
+        if columns:
+            df = pd.DataFrame.from_records(list(rows), columns=list(columns))
+        else:
+            df = pd.DataFrame.from_records([json.loads(data) for (data,) in rows])
+        return apply_schema(df, table)
+
+    def check_frame(self, table: str, fields=("url",)):
+        """문서 테이블의 재검증 기록 - 지정 필드 + checked_at(없으면 저장 시각), checks, changes"""
+        import pandas as pd
+
+        cols = ", ".join("json_extract(data, ?)" for _ in fields)
+        rows = self._conn().execute(f"SELECT {cols}, COALESCE(checked_at, updated_at), checks, changes "
+                                    f"FROM {table} ORDER BY rowid", [f'$."{f}"' for f in fields])
+        return pd.DataFrame.from_records(list(rows), columns=list(fields) + ["checked_at", "checks", "changes"])
+
+    def merged_frame(self, table: str):
+        """merged_result.csv와 같은 형태 - info는 정보량 점수 중복 제거, 자식 테이블은 id(1..N) 부여"""
+        df = self.frame(table)
+        if df.empty:
+            return df
+        if table == "info":
+            df = dedupe_info_by_score(df)
+        elif table in CHILD_TABLES:
+            df.insert(0, "id", range(1, len(df) + 1))
+        return df
+
+    def _exported_key(self, table: str, out_path, fmt: str) -> str:
+        return f"exported:{table}:{Path(out_path)}:{fmt}"
+
+    def is_exported(self, table: str, out_path, fmt: str = None) -> bool:
+        """out_path가 현재 버전으로 이미 저장되어 있는지 (merged_result 및 이 테이블로 만든 law_combined 출력)"""
+        fmt = resolve_format(fmt)
+        row = self._conn().execute("SELECT value FROM meta WHERE key=?",
+                                   (self._exported_key(table, out_path, fmt),)).fetchone()
+        return bool(row) and int(row[0]) == self.version(table) and table_exists(out_path)
+
+    def mark_exported(self, table: str, out_path, version: int, fmt: str = None):
+        """out_path를 version 시점 데이터로 저장했음을 기록"""
+        self._conn().execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             (self._exported_key(table, out_path, resolve_format(fmt)), version))
+
+    def export(self, table: str, out_path, fmt: str = None, df=None, version: int = None) -> bool:
+        """merged_result.csv(및/또는 .parquet) 내보내기 - 마지막 내보내기 이후 변경이 없으면 생략
+
+        df/version: 이미 만든 merged_frame과 그 시점 버전 (최종 병합에서 같은 프레임으로 law_combined도 저장할 때)
+        """
+        out_path = Path(out_path)
+        fmt = resolve_format(fmt)
+        if self.is_exported(table, out_path, fmt):
+            self.logger.info(f"[store] 변경 없음, 내보내기 생략: {out_path}")
+            return False
+
+        if df is None:
+            version, df = self.version(table), self.merged_frame(table)
+        if df.empty:
+            self.logger.info(f"[store] 내보낼 데이터 없음: {table}")
+            return False
+        write_table(df, out_path, fmt, table)
+        self.mark_exported(table, out_path, self.version(table) if version is None else version, fmt)
+        self.logger.info(f"[store] 내보내기 완료: {out_path} ({fmt}, rows={len(df)})")
+        return True
+
+    def sync_dir(self, table: str, folder) -> bool:
+        """폴더의 새 CSV 반영 후 {folder}/merged_result.csv 내보내기"""
+        self.import_csv_dir(table, folder)
+        return self.export(table, Path(folder) / EXPORT_NAME)
@@ -0,0 +1,173 @@
+### storage/schema.py ###
+# 테이블별 컬럼 타입 - 읽기/쓰기 때마다 같은 타입으로 맞춤 (itemID가 int/str로 바뀌는 문제 방지, 메모리 절감)
+#
+#   category : 값 종류가 적은 컬럼 (regionID, 문서유형, 발급기관, 유효상태, 관계유형 ...)
+#   TEXT     : 고유값이 많은 텍스트 (문서코드, 법령명, url ...) - pyarrow 설치 시 string[pyarrow]
+#   Int64    : ID (숫자가 아닌 값, 예: 빈 값 표시 "-"는 <NA>)
+#
+#   df = schema.read_csv("output/central_law/info/merged_result.csv", "info")
+#   df = schema.apply_schema(df, "relation")
+
+from importlib.util import find_spec
+
+# pyarrow 설치 여부만 확인 (임포트는 실제로 읽을 때 - 임포트 시간이 큼)
+HAS_PYARROW = find_spec("pyarrow") is not None
+TEXT = "string[pyarrow]" if HAS_PYARROW else "string"
+
+CATEGORY = "category"
+ID = "Int64"
+
+# 테이블 → 컬럼 → 타입 (수집 레코드 컬럼 순서대로, 같은 이름의 컬럼은 모든 테이블에서 같은 타입)
+SCHEMAS = {
+    "info": {
+        "regionID": CATEGORY, "itemID": ID, "문서코드": TEXT, "법령명": TEXT,
+        "문서유형": CATEGORY, "발급기관": CATEGORY, "유효상태": CATEGORY,
+        "발행일": TEXT, "발효일": TEXT, "서명자 직위": CATEGORY, "서명자": CATEGORY,
+        "유효범위": CATEGORY, "url": TEXT,
+    },
+    "relation": {
+        "id": ID, "regionID": CATEGORY, "itemID": ID, "신규문서코드": TEXT,
+        "relation_itemID": ID, "관계유형": CATEGORY,
+    },
+    "download_link": {
+        "id": ID, "regionID": CATEGORY, "itemID": ID, "문서코드": TEXT, "다운로드 링크": TEXT,
+    },
+    "directive": {
+        "docid": ID, "문서코드": TEXT, "발행일": TEXT, "발효일": TEXT, "문서유형": CATEGORY,
+        "발급기관": CATEGORY, "서명자": CATEGORY, "문서명": TEXT, "다운로드링크": TEXT, "url": TEXT,
+    },
+}
+# 테이블을 모를 때 (컬럼 이름으로 조회)
+DTYPES = {col: dtype for schema in SCHEMAS.values() for col, dtype in schema.items()}
+
+
+def dtype_of(col: str, table: str = None) -> str:
+    """컬럼 타입 (스키마에 없는 컬럼은 TEXT)"""
+    return SCHEMAS.get(table, {}).get(col) or DTYPES.get(col, TEXT)
+
+
+def _ids(s):
+    """ID 컬럼 → Int64 (123, 123.0, "123" 모두 같은 값)"""
+    import pandas as pd
+
+    if pd.api.types.is_integer_dtype(s.dtype):
+        return s.astype(ID)
+    values = pd.to_numeric(s, errors="coerce")
+    return values.where(values % 1 == 0).astype(ID)
+
+
+def _texts(s):
+    """텍스트 컬럼 → TEXT (CSV에서 숫자로 읽힌 123.0은 "123")"""
+    import pandas as pd
+
+    if pd.api.types.is_float_dtype(s.dtype) and (s.dropna() % 1 == 0).all():
+        s = s.astype(ID)
+    return s.astype(TEXT)
+
+
+def apply_schema(df, table: str = None):
+    """DataFrame 컬럼 타입을 스키마에 맞춤 (이미 맞는 컬럼은 그대로)"""
+    df = df.copy(deep=False)  # 바꾸는 컬럼만 새로 할당
+    for col in df.columns:
+        dtype = dtype_of(col, table)
+        if str(df[col].dtype) == dtype:
+            continue
+        if dtype == ID:
+            df[col] = _ids(df[col])
+        elif dtype == CATEGORY:
+            df[col] = _texts(df[col]).astype(CATEGORY)
+        else:
+            df[col] = _texts(df[col])
+    return df
+
+
+def concat(dfs, table: str = None):
+    """타입을 유지하며 합치기 - category 컬럼은 카테고리를 합친 뒤 연결 (pd.concat은 카테고리가 다르면 object로 풀림)"""
+    import pandas as pd
+
+    dfs = [apply_schema(d, table) for d in dfs if not d.empty]
+    if not dfs:
+        return pd.DataFrame()
+    for col in {c for d in dfs for c in d.columns if dtype_of(c, table) == CATEGORY}:
+        cats = pd.Index(sorted({v for d in dfs if col in d.columns for v in d[col].cat.categories}))
+        for i, d in enumerate(dfs):
+            if col in d.columns:
+                dfs[i] = d.copy(deep=False)
+                dfs[i][col] = d[col].cat.set_categories(cats)
+    df = pd.concat(dfs, ignore_index=True)
+    # 일부 입력에만 있는 컬럼은 빈 값이 채워지며 타입이 바뀜 - 그 컬럼만 다시 맞춤 (전체 apply_schema 생략)
+    for col in [c for c in df.columns if str(df[c].dtype) != dtype_of(c, table)]:
+        df[col] = apply_schema(df[[col]], table)[col]
+    return df
+
+
+def _read_arrow(path, columns=None):
+    """pyarrow CSV 파서 - 스키마 컬럼은 모두 문자열로 (파이썬 객체를 거치지 않아 최대 메모리가 작음)"""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    convert = pacsv.ConvertOptions(column_types={col: pa.string() for col in DTYPES},
+                                   strings_can_be_null=True, include_columns=columns)
+    return pacsv.read_csv(path, read_options=pacsv.ReadOptions(use_threads=False),
+                          parse_options=pacsv.ParseOptions(newlines_in_values=True), convert_options=convert)
+
+
+def _encode_categories(arrow, table: str = None):
+    """category 컬럼 Arrow dictionary 인코딩 (pandas Categorical로 바로 변환, 원래 문자열 컬럼은 해제)"""
+    for i, name in enumerate(arrow.column_names):
+        if dtype_of(name, table) == CATEGORY:
+            arrow = arrow.set_column(i, name, arrow.column(i).dictionary_encode())
+    return arrow
+
+
+def _arrow_frame(parts: list, table: str = None):
+    """파일별 Arrow 표 → DataFrame (parts 목록은 비움 - 변환한 컬럼부터 Arrow 쪽을 해제해 둘을 함께 들고 있지 않음)"""
+    import pandas as pd
+    import pyarrow as pa
+
+    arrow = pa.concat_tables(parts, promote_options="permissive")
+    parts.clear()
+    df = arrow.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get,
+                         split_blocks=True, self_destruct=True)
+    del arrow
+    return apply_schema(df, table)
+
+
+def read_csvs(paths, table: str = None, columns=None, on_error=None):
+    """여러 CSV를 스키마 타입으로 읽어 합치기 - on_error(path, e)가 있으면 읽기 실패 파일은 건너뜀
+
+    pyarrow: 파일마다 category 컬럼을 바로 인코딩하고 파싱 버퍼로 늘어난 메모리 풀을 OS에 반환
+    (mimalloc 풀은 해제한 메모리를 보관 - 반환하지 않으면 최대 RSS가 파싱한 문자열 전체만큼 늘어남)
+    """
+    import pandas as pd
+
+    pool = None
+    if HAS_PYARROW:
+        import pyarrow as pa
+
+        pool = pa.default_memory_pool()
+    parts = []
+    for path in paths:
+        try:
+            if pool is not None:
+                parts.append(_encode_categories(_read_arrow(path, columns), table))
+                pool.release_unused()
+            else:
+                dtype = {col: str for col, t in DTYPES.items() if t != ID}
+                parts.append(pd.read_csv(path, dtype=dtype, usecols=columns))
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(path, e)
+    if not parts:
+        return pd.DataFrame()
+    if pool is not None:
+        df = _arrow_frame(parts, table)
+        pool.release_unused()
+        return df
+    return apply_schema(pd.concat(parts, ignore_index=True), table)
+
+
+def read_csv(path, table: str = None, columns=None):
+    """스키마 타입으로 CSV 읽기 (pyarrow가 없으면 pandas 파서)"""
+    return read_csvs([path], table, columns)
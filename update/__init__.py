@@ -2,6 +2,11 @@
 from typing import Literal
 from log_util import setup_logger
 
+# 업데이트 시 확인할 최신 목록 페이지 수
+UPDATE_PAGES = 20
+# 업데이트마다 다시 수집해 변경 여부를 확인할 기존 문서 수 (0이면 재검증 안 함)
+REVALIDATE_BUDGET = 100
+
 def make_law_updater(mode: Literal["central", "local"], scraper, **kwargs) -> "LawUpdater":
     """법령 업데이터 팩토리 함수"""
     from update.law_updater import LawUpdater
@@ -12,4 +17,6 @@ def make_law_updater(mode: Literal["central", "local"], scraper, **kwargs) -> "L
         f"output/{mode}_law/log/{mode}_law_updater.log"
     )
     
-    return LawUpdater(mode=mode, scraper=scraper, logger=logger)
\ No newline at end of file
+    return LawUpdater(mode=mode, scraper=scraper, logger=logger,
+                      update_pages=kwargs.get('update_pages', UPDATE_PAGES),
+                      revalidate=kwargs.get('revalidate', REVALIDATE_BUDGET))
\ No newline at end of file
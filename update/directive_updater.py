@@ -3,6 +3,8 @@
 
 from scraper.directive_scraper import DirectiveScraper
 from log_util import setup_logger
+from scraper.frontier import FAILED
+from update.revalidation import RevalidationScheduler
 import pandas as pd
 import os
 import time
@@ -10,24 +12,26 @@ from pathlib import Path
 from datetime import datetime
 
 class DirectiveUpdater:
-    def __init__(self, scraper:DirectiveScraper):
+    def __init__(self, scraper:DirectiveScraper, update_pages=20, revalidate=100):
         self.scraper = scraper
+        self.update_pages = update_pages  # 확인할 최신 목록 페이지 수 (0이면 실패 URL 재시도만)
+        self.revalidate = revalidate      # 다시 수집해 변경을 확인할 기존 문서 수
         self.logger = setup_logger(__name__, f"output/directive/log/directive_updater.log")
     def run(self):
-        self.scraper.driver.delete_all_cookies()
+        self.scraper.reset_session()
+        self.scraper.frontier.recover()
         # ---------- 수집된 행정지시문서 url 목록 로드 ----------
-        directive_info_merged_file = Path(self.scraper.output_dir)/"info"/"merged_result.csv"
-        directive_existing_urls = set([])
-        if directive_info_merged_file.exists():
-            directive_df_existing = pd.read_csv(directive_info_merged_file)
-            directive_existing_urls = set(directive_df_existing["url"].dropna().unique())
+        # 저장소 기준 (저장소 도입 전 CSV 결과는 먼저 가져옴)
+        store = self.scraper.store
+        store.import_csv_dir("directive", Path(self.scraper.output_dir)/"info")
+        directive_existing_urls = store.urls("directive")
         
         try:
             try:
-                self.scraper.driver.get(self.scraper.start_url)
+                self.scraper.navigate(self.scraper.start_url)
             except Exception as e:
                 self.logger.info(f"[directive_updater.py, line 26] 첫 페이지 접근 실패 : {e}")
-            all_urls = self.scraper.get_all_directive_urls(20) # 최신 20개 페이지만 수집
+            all_urls = self.scraper.get_all_directive_urls(self.update_pages) # 최신 update_pages개 페이지만 수집
             urls_to_collect = [url for url in all_urls if url not in directive_existing_urls]
             self.logger.error(f"directive_updater.py | 신규 업데이트된 url: {len(urls_to_collect)}건")
 
@@ -46,21 +50,41 @@ class DirectiveUpdater:
                     self.logger.error(f"failed_urls.csv 불러오기 실패: {e}")
             else:
                 self.logger.info("failed_urls.csv 파일 없음 (처음 실행 또는 모든 수집 성공)")
+
+            # 기존 문서 재검증 대상 추가 (실패 URL 재시도만 할 때는 생략)
+            if self.update_pages > 0 and self.revalidate > 0:
+                try:
+                    scheduler = RevalidationScheduler(store, "directive", self.revalidate, logger=self.logger)
+                    revalidate_urls = scheduler.select(exclude=urls_to_collect)
+                    urls_to_collect = urls_to_collect + revalidate_urls
+                    self.logger.info(f"directive_updater.py | 재검증 url: {len(revalidate_urls)}건")
+                except Exception as e:
+                    self.logger.error(f"재검증 대상 선정 실패: {e}")
+
+            # frontier 최종 실패 URL 포함, 등록 후 리스 (중단된 이전 업데이트도 함께 재개)
+            frontier = self.scraper.frontier
+            frontier.requeue(list(set(urls_to_collect + frontier.urls(FAILED))), kind="update")
+            urls_to_collect = frontier.lease(limit=None, kind="update")
             self.logger.error(f"directive_updater.py | 신규 업데이트된 url과 기존 수집실패했던 url 중 중복을 제거한 {len(urls_to_collect)}건의 url 수집시도")
 
-            for i, url in enumerate(urls_to_collect):
-                self.logger.info(f"[{i+1}/{len(urls_to_collect)}] {url} 수집 시작")
+            # 적응형 워커 풀로 상세정보 수집
+            def extract(worker, item):
+                i, url = item
+                return worker.safe_extract(worker.extract_details, url, 0, i+1, len(urls_to_collect))
+
+            results = self.scraper.pool.map(extract, list(enumerate(urls_to_collect)))
+            collected = []
+
+            for i, (url, info) in enumerate(zip(urls_to_collect, results)):
                 try:
-                    info = self.scraper.safe_extract(self.scraper.extract_details, url, 0, i+1, len(urls_to_collect))
                     if info:
                         self.scraper.info_results.append(info)
+                        collected.append(url)
                         self.logger.info(f"[{i+1}/{len(urls_to_collect)}] 세부정보 처리 완료 : {url}")
                     else:
+                        frontier.fail(url, "세부정보 없음")
                         msg = f"[{i+1}/{len(urls_to_collect)}] 세부정보 없음 : {url}"
                         self.logger.info(msg)
-
-                    self.scraper.driver.back()
-                    time.sleep(1)
                 except Exception as e:
                     msg = f"[{i+1}/{len(urls_to_collect)}] 예외 발생 : {url} ({e})"
                     self.logger.error(msg)
@@ -76,11 +100,15 @@ class DirectiveUpdater:
 
                 df1.to_csv(file_path, index=False, encoding='utf-8')
                 self.logger.error(f"수집 대상 {len(urls_to_collect)}건 중 {len(self.scraper.info_results)}건 수집 성공 ({len(self.scraper.info_results) / len(urls_to_collect) * 100:.1f}%)")
-                #엑셀 병합
+                # 저장소 반영 (내용 해시가 같은 문서는 확인 기록만) 후 merged_result.csv 내보내기
+                saved = store.upsert_checked("directive", self.scraper.info_results)
+                self.logger.info(f"저장소 반영: 변경/신규 문서 {saved['directive']}건, 변경 없음 {saved['unchanged']}건")
                 self.logger.info("directive info 병합 시작")
-                self.scraper.merge_excel("info", ['docid'])
+                self.scraper.merge_excel("info")
             else:
                 self.logger.error(f"업데이트할 세부정보 데이터 없음: {file_path}")
+            frontier.complete(collected)
+            self.logger.info(f"업데이트 진행 상황: {frontier.progress(kind='update')}")
             
             # 수집 실패한 url csv 저장
             if self.scraper.failed_urls:
@@ -88,4 +116,4 @@ class DirectiveUpdater:
                 pd.DataFrame({"url": self.scraper.failed_urls}).to_csv(failed_path, index=False, encoding="utf-8")
                 self.logger.warning(f"수집 실패한 URL {len(self.scraper.failed_urls)}건 저장됨: {failed_path}")
         finally:
-            self.scraper.driver.quit()
\ No newline at end of file
+            self.scraper.close()
\ No newline at end of file
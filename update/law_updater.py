@@ -8,19 +8,24 @@ from pathlib import Path
 from datetime import datetime
 from typing import Literal
 import time
+from scraper.frontier import FAILED
+from update.revalidation import RevalidationScheduler
 
 class LawUpdater:
     """중앙/지방 법령정보 통합 업데이터"""
     
-    def __init__(self, mode: Literal["central", "local"], scraper, logger=None):
+    def __init__(self, mode: Literal["central", "local"], scraper, logger=None, update_pages=20, revalidate=100):
         self.mode = mode
         self.scraper = scraper
         self.logger = logger or scraper.logger
+        self.update_pages = update_pages  # 확인할 최신 목록 페이지 수 (0이면 실패 URL 재시도만)
+        self.revalidate = revalidate      # 다시 수집해 변경을 확인할 기존 문서 수
 
     def run(self):
         """업데이터 실행"""
         try:
-            self.scraper.driver.delete_all_cookies()
+            self.scraper.reset_session()
+            self.scraper.frontier.recover()
             
             if self.mode == "central":
                 self._run_central_update()
@@ -28,7 +33,7 @@ class LawUpdater:
                 self._run_local_update()
                 
         finally:
-            self.scraper.driver.quit()
+            self.scraper.close()
 
     def _run_central_update(self):
         """중앙정부 법령 업데이트"""
@@ -36,15 +41,18 @@ class LawUpdater:
         existing_urls = self._load_existing_urls()
         
         try:
-            self.scraper.driver.get(self.scraper.start_url)
-            
-            # 최신 20페이지 URL 수집
-            all_urls = self.scraper.get_all_law_urls(20)
-            urls_to_collect = [url for url in all_urls if url not in existing_urls]
-            self.logger.info(f"[{self.mode}] 신규 업데이트된 url: {len(urls_to_collect)}건")
+            urls_to_collect = []
+            if self.update_pages > 0:
+                self.scraper.navigate(self.scraper.start_url)
+
+                # 최신 update_pages 페이지 URL 수집
+                all_urls = self.scraper.get_all_law_urls(self.update_pages)
+                urls_to_collect = [url for url in all_urls if url not in existing_urls]
+                self.logger.info(f"[{self.mode}] 신규 업데이트된 url: {len(urls_to_collect)}건")
             
-            # 실패 URL 추가
+            # 실패 URL, 재검증 대상 추가
             urls_to_collect = self._add_failed_urls(urls_to_collect)
+            urls_to_collect = self._add_revalidation_urls(urls_to_collect)
             
             # URL 수집 및 처리
             self._process_update_urls(urls_to_collect)
@@ -58,12 +66,11 @@ class LawUpdater:
         existing_urls = self._load_existing_urls()
         
         try:
-            self.scraper.driver.get(self.scraper.start_url)
-            
-            # 지역 링크 수집
-            self._collect_region_links()
-            
             urls_to_collect = []
+
+            # 지역 링크 수집 (센서스 캐시 우선, 재시도만 할 때는 생략 → 지역 루프 없음)
+            if self.update_pages > 0 and not self.scraper._collect_region_links():
+                return
             
             # 각 지역별 URL 수집
             for region_idx, (region_code, region_url) in enumerate(self.scraper.region_links):
@@ -73,16 +80,17 @@ class LawUpdater:
                     self.logger.error(f"[{region_code}] 문서목록으로 이동 실패")
                     continue
                 
-                self.logger.info(f"[{region_code}] 업데이트를 위해 최신 20개 페이지를 확인합니다.")
-                current_urls = self.scraper.get_all_law_urls(20)
+                self.logger.info(f"[{region_code}] 업데이트를 위해 최신 {self.update_pages}개 페이지를 확인합니다.")
+                current_urls = self.scraper.get_all_law_urls(self.update_pages)
                 current_urls_to_collect = [url for url in current_urls if url not in existing_urls]
                 self.logger.info(f"[{region_code}] 신규 업데이트된 url: {len(current_urls_to_collect)}건")
                 urls_to_collect.extend(current_urls_to_collect)
             
             self.logger.info(f"[{self.mode}] 전체 지역 신규 업데이트된 url: {len(urls_to_collect)}건")
             
-            # 실패 URL 추가
+            # 실패 URL, 재검증 대상 추가
             urls_to_collect = self._add_failed_urls(urls_to_collect)
+            urls_to_collect = self._add_revalidation_urls(urls_to_collect)
             
             # URL 수집 및 처리
             self._process_update_urls(urls_to_collect)
@@ -90,42 +98,17 @@ class LawUpdater:
         except Exception as e:
             self.logger.error(f"[{self.mode}] 업데이트 중 오류: {e}")
 
-    def _collect_region_links(self):
-        """지역 링크 수집 (지방정부용)"""
-        try:
-            li_tags = self.scraper.driver.find_elements(By.CSS_SELECTOR, 
-                "div.list-diaphuong div.container tr:nth-child(2) li")
-            for li in li_tags:
-                try:
-                    a_tag = li.find_element(By.TAG_NAME, "a")
-                    href = a_tag.get_attribute("href")
-                    full_url = urljoin(self.scraper.base_url, href)
-                    
-                    parsed = urlparse(full_url)
-                    region_code = parsed.path.strip("/")
-                    
-                    if not region_code or region_code.lower() == "tw":
-                        continue
-                        
-                    self.scraper.region_links.append((region_code, full_url))
-                except:
-                    self.logger.info(f"지방 {li.text} <li>태그 데이터 추출 실패")
-                    continue
-        except Exception as e:
-            self.logger.error(f"지역 링크 수집 실패: {e}")
-
     def _load_existing_urls(self):
-        """기존 수집된 URL 목록 로드"""
-        merged_file = Path(self.scraper.output_dir) / "info" / "merged_result.csv"
+        """기존 수집된 URL 목록 로드 (저장소 기준, 저장소 도입 전 CSV 결과는 먼저 가져옴)"""
         existing_urls = set()
         
-        if merged_file.exists():
-            try:
-                df_existing = pd.read_csv(merged_file)
-                existing_urls = set(df_existing["url"].dropna().unique())
-                self.logger.info(f"기존 수집된 URL: {len(existing_urls)}건")
-            except Exception as e:
-                self.logger.error(f"기존 URL 로드 실패: {e}")
+        try:
+            store = self.scraper.store
+            store.import_csv_dir("info", Path(self.scraper.output_dir) / "info")
+            existing_urls = store.urls("info")
+            self.logger.info(f"기존 수집된 URL: {len(existing_urls)}건")
+        except Exception as e:
+            self.logger.error(f"기존 URL 로드 실패: {e}")
         
         return existing_urls
 
@@ -143,102 +126,102 @@ class LawUpdater:
                 self.logger.error(f"failed_urls.csv 불러오기 실패: {e}")
         else:
             self.logger.info("failed_urls.csv 파일 없음 (처음 실행 또는 모든 수집 성공)")
+
+        # frontier에서 최종 실패 처리된 URL도 재시도 대상
+        frontier_failed = self.scraper.frontier.urls(FAILED)
+        if frontier_failed:
+            urls_to_collect = list(set(urls_to_collect + frontier_failed))
+            self.logger.info(f"[{self.mode}] frontier 실패 url: {len(frontier_failed)}건")
         
         self.logger.info(f"[{self.mode}] 총 수집 대상 url: {len(urls_to_collect)}건")
         return urls_to_collect
 
+    def _add_revalidation_urls(self, urls_to_collect):
+        """기존 문서 재검증 대상 추가 (실패 URL 재시도만 할 때는 생략)"""
+        if self.update_pages <= 0 or self.revalidate <= 0:
+            return urls_to_collect
+        try:
+            scheduler = RevalidationScheduler(self.scraper.store, "info", self.revalidate, logger=self.logger)
+            revalidate_urls = scheduler.select(exclude=urls_to_collect)
+        except Exception as e:
+            self.logger.error(f"[{self.mode}] 재검증 대상 선정 실패: {e}")
+            return urls_to_collect
+        self.logger.info(f"[{self.mode}] 재검증 url: {len(revalidate_urls)}건")
+        return urls_to_collect + revalidate_urls
+
     def _process_update_urls(self, urls_to_collect):
-        """업데이트 URL 처리"""
+        """업데이트 URL 처리 - frontier에 등록 후 리스한 URL만 수집 (중단된 이전 업데이트 포함)"""
+        frontier = self.scraper.frontier
+        frontier.requeue(urls_to_collect, kind="update")
+        urls_to_collect = frontier.lease(limit=None, kind="update")
+
         if not urls_to_collect:
             self.logger.info(f"[{self.mode}] 업데이트할 URL이 없습니다.")
             return
 
-        # URL별 상세정보 수집
-        for i, url in enumerate(urls_to_collect):
-            self.logger.info(f"[{i+1}/{len(urls_to_collect)}] {url} 수집 시작")
-            info, relations, download_link = self.scraper.safe_extract(
-                self.scraper.extract_law_details, url)
+        # URL별 상세정보 수집 (적응형 워커 풀)
+        def extract(worker, url):
+            return worker.safe_extract(worker.extract_law_details, url)
+
+        results = self.scraper.pool.map(extract, urls_to_collect)
+        collected, incomplete = [], []
+
+        for i, (url, result) in enumerate(zip(urls_to_collect, results)):
+            self.logger.info(f"[{i+1}/{len(urls_to_collect)}] {url} 수집 완료")
+            info, relations, download_link = result or ({}, [], [])
             
             if info:
                 self.scraper.info_results.append(info)
+                collected.append(url)
+                if relations is None or download_link is None:
+                    incomplete.append(info)
+            else:
+                frontier.fail(url, "상세정보 추출 실패")
             if relations:
                 self.scraper.relations_results.extend(relations)
             if download_link:
                 self.scraper.download_link_results.extend(download_link)
 
-        # 결과 저장
-        self._save_update_results(urls_to_collect)
-
-    def _save_update_results(self, urls_to_collect):
-        """업데이트 결과 저장"""
-        
-        # 기본정보 저장
-        if self.scraper.info_results:
-            df_info = pd.DataFrame(self.scraper.info_results)
-            updated_file = Path(self.scraper.output_dir) / "info" / f"updated_result.csv"
-            df_info.to_csv(updated_file, index=False, encoding='utf-8')
-            
-            success_rate = len(self.scraper.info_results) / len(urls_to_collect) * 100
+        # 결과 저장 후 완료 처리
+        self._save_update_results(urls_to_collect, incomplete)
+        frontier.complete(collected)
+        self.logger.info(f"[{self.mode}] 업데이트 진행 상황: {frontier.progress(kind='update')}")
+
+    def _save_update_results(self, urls_to_collect, incomplete=()):
+        """업데이트 결과 저장 - 저장소에 반영 후 merged_result.csv 내보내기, 이번 실행분은 updated_result.csv로도 남김
+
+        incomplete: 관계정보/다운로드링크 추출에 실패한 문서 - 이미 저장된 문서는 그대로 둠 (변경/확인으로 세지 않음)
+        """
+        scraper = self.scraper
+        updates = {
+            "info": scraper.info_results,
+            "relation": scraper.relations_results,
+            "download_link": scraper.download_link_results,
+        }
+        labels = {"info": "기본정보", "relation": "관계정보", "download_link": "다운로드 링크"}
+
+        for sub, data in updates.items():
+            if data:
+                updated_file = Path(scraper.output_dir) / sub / "updated_result.csv"
+                updated_file.parent.mkdir(parents=True, exist_ok=True)
+                pd.DataFrame(data).to_csv(updated_file, index=False, encoding='utf-8')
+                self.logger.info(f"새로운 {labels[sub]} {len(data)}건 저장 완료: {updated_file}")
+            else:
+                self.logger.error(f"업데이트할 {labels[sub]} 데이터 없음")
+
+        if scraper.info_results:
+            success_rate = len(scraper.info_results) / len(urls_to_collect) * 100
             self.logger.info(f"수집 대상 {len(urls_to_collect)}건 중 "
-                           f"{len(self.scraper.info_results)}건 수집 성공 ({success_rate:.1f}%)")
-            
-            # 병합
-            self.logger.info("info 병합 시작")
-            self.scraper.merge_excel("info", ['itemID'])
-        else:
-            self.logger.error("업데이트할 기본정보 데이터 없음")
-
-        # 관계정보 저장
-        if self.scraper.relations_results:
-            df_relation = pd.DataFrame(self.scraper.relations_results)
-            updated_file = Path(self.scraper.output_dir) / "relation" / f"updated_result.csv"
-            df_relation.to_csv(updated_file, index=False, encoding='utf-8')
-            self.logger.info(f"새로운 관계정보 {len(df_relation)}건 저장 완료: {updated_file}")
-            
-            # 병합
-            self.logger.info("relations 병합 시작")
-            self.scraper.merge_excel("relation", ['regionID', 'itemID', 'relation_itemID', '관계유형'])
-        else:
-            self.logger.error("업데이트할 관계정보 데이터 없음")
-
-        # 다운로드 링크 저장
-        if self.scraper.download_link_results:
-            df_download_link = pd.DataFrame(self.scraper.download_link_results)
-            updated_file = Path(self.scraper.output_dir) / "download_link" / f"updated_result.csv"
-            df_download_link.to_csv(updated_file, index=False, encoding='utf-8')
-            self.logger.info(f"새로운 다운로드링크 {len(df_download_link)}건 저장 완료: {updated_file}")
-            
-            # 병합
-            self.logger.info("download_links 병합 시작")
-            self.scraper.merge_excel("download_link", ['itemID', '다운로드 링크'])
-        else:
-            self.logger.error("업데이트할 다운로드 링크 데이터 없음")
-
-        self.scraper._add_primary_keys()
-
-        # 관계정보, 다운로드 링크 테이블에 일련번호 추가
-        # def add_primary_key_column(file_path, pk_name="id"):
-        #     df = pd.read_csv(file_path)
-
-        #     # 기존 pk 컬럼 제거
-        #     if pk_name in df.columns:
-        #         df = df.drop(columns=[pk_name])
-
-        #     # 1..N 일련번호 부여
-        #     df.insert(0, pk_name, range(1, len(df) + 1))
-
-        #     # 저장
-        #     df.to_csv(file_path, index=False, encoding='utf-8')
-
-        # # 병합 후 일련번호 추가
-        # merged_relation_path = Path(self.scraper.output_dir) / "relation" / "merged_result.csv"
-        # merged_download_path = Path(self.scraper.output_dir) / "download_link" / "merged_result.csv"
-
-        # if merged_relation_path.exists():
-        #     add_primary_key_column(merged_relation_path)
-
-        # if merged_download_path.exists():
-        #     add_primary_key_column(merged_download_path)
+                           f"{len(scraper.info_results)}건 수집 성공 ({success_rate:.1f}%)")
+
+        # 바뀐 문서만 저장소에 반영 (1 트랜잭션, 내용 해시가 같은 문서는 확인 기록만) → 변경된 테이블만 다시 내보냄
+        saved = scraper.store.upsert_docs(scraper.info_results, scraper.relations_results,
+                                          scraper.download_link_results, incomplete=incomplete)
+        self.logger.info(f"[{self.mode}] 저장소 반영: 변경/신규 문서 {saved['info']}건, 변경 없음 {saved['unchanged']}건, "
+                         f"일부 추출 실패로 유지 {saved['skipped']}건")
+        for sub in updates:
+            self.logger.info(f"{sub} 병합 시작")
+            scraper.merge_excel(sub)
 
         # 실패 URL 저장
         if self.scraper.failed_urls:
@@ -0,0 +1,82 @@
+### update/revalidation.py ###
+# 재검증 스케줄러 - 이미 수집한 문서 중 일부(예산)를 매 업데이트마다 다시 수집할 대상으로 선정
+#
+# 업데이터는 처음 보는 URL만 수집하므로 유효상태 변경(còn hiệu lực → hết hiệu lực), 기존 문서의 새 관계정보는
+# 전체 재수집 없이는 반영되지 않습니다. 다시 수집한 문서는 저장소에서 내용 해시를 비교해 바뀐 문서만 다시 씁니다.
+#
+# 우선순위 = 마지막 확인 후 경과 일수 × 유효상태 가중치 × 같은 문서유형의 변경 비율
+#   - 아직 발효 전(chưa có hiệu lực) 문서는 곧 상태가 바뀌므로 높게, 전체 실효(hết hiệu lực toàn bộ) 문서는 낮게
+#   - 변경 비율은 문서유형별 (재검증에서 바뀐 횟수 + 1) / (재검증 횟수 + 10) - 기록이 없으면 10%
+#
+#   scheduler = RevalidationScheduler(store, "info", budget=100)
+#   urls = scheduler.select(exclude=urls_to_collect)
+
+import logging
+import time
+
+import pandas as pd
+
+MIN_AGE_DAYS = 1.0  # 이보다 최근에 확인한 문서는 제외
+PRIOR_CHANGES = 1   # 변경 비율 사전값 (기록이 적은 문서유형의 비율이 0 또는 1로 치우치지 않도록)
+PRIOR_CHECKS = 10
+
+# 유효상태(소문자) → 가중치 (목록에 없는 값/빈 값은 1.0)
+STATUS_WEIGHTS = {
+    "chưa có hiệu lực": 3.0,       # 발효 전
+    "ngưng hiệu lực": 1.5,         # 효력 정지
+    "còn hiệu lực": 1.0,           # 유효
+    "hết hiệu lực một phần": 1.0,  # 일부 실효
+    "không còn phù hợp": 0.5,
+    "hết hiệu lực toàn bộ": 0.2,   # 전체 실효
+}
+DEFAULT_STATUS_WEIGHT = 1.0
+
+
+class RevalidationScheduler:
+    """저장소의 문서 테이블(info, directive)에서 재검증할 문서 URL 선정"""
+
+    def __init__(self, store, table: str = "info", budget: int = 100, min_age_days: float = MIN_AGE_DAYS,
+                 logger=None):
+        self.store = store
+        self.table = table
+        self.budget = budget
+        self.min_age_days = min_age_days
+        self.logger = logger or logging.getLogger(__name__)
+
+    def candidates(self) -> pd.DataFrame:
+        """문서별 url, 유효상태, 문서유형, 마지막 확인 시각, 재검증/변경 횟수"""
+        df = self.store.check_frame(self.table, ("url", "유효상태", "문서유형"))
+        df = df.rename(columns={"유효상태": "status", "문서유형": "doc_type"})
+        # 첫 수집도 확인 1회로 기록되므로 재검증 횟수는 checks - 1
+        df["revalidations"] = (df["checks"] - 1).clip(lower=0)
+        return df
+
+    def scores(self, df: pd.DataFrame, now: float = None) -> pd.Series:
+        """우선순위 점수 (클수록 먼저)"""
+        now = time.time() if now is None else now
+        age_days = ((now - df["checked_at"]) / 86400).clip(lower=0)
+        status = df["status"].fillna("").astype(str).str.strip().str.lower()
+        weight = status.map(STATUS_WEIGHTS).fillna(DEFAULT_STATUS_WEIGHT)
+        doc_type = df["doc_type"].fillna("").astype(str).str.strip()
+        grouped = df.groupby(doc_type)[["changes", "revalidations"]].sum()
+        rate = (grouped["changes"] + PRIOR_CHANGES) / (grouped["revalidations"] + PRIOR_CHECKS)
+        return age_days * weight * doc_type.map(rate).to_numpy()
+
+    def select(self, exclude=()) -> list:
+        """재검증할 URL 최대 budget개 (exclude: 이번 실행에서 이미 수집할 URL)"""
+        if self.budget <= 0:
+            return []
+        df = self.candidates()
+        if df.empty:
+            return []
+        now = time.time()
+        df["score"] = self.scores(df, now)
+        exclude = set(exclude)
+        df = df[df["url"].notna() & (df["url"] != "") & ~df["url"].isin(exclude)
+                & (now - df["checked_at"] >= self.min_age_days * 86400)].drop_duplicates("url")
+        picked = df.nlargest(self.budget, "score")
+        if len(picked):
+            age_days = (now - picked["checked_at"]) / 86400
+            self.logger.info(f"[재검증] {self.table}: 후보 {len(df)}건 중 {len(picked)}건 선정 "
+                             f"(경과 {age_days.min():.1f}~{age_days.max():.1f}일)")
+        return picked["url"].tolist()
@@ -1,26 +1,29 @@
 ### update_manager.py ###
-# 모든 업데이터의 실행을 담당하는 파일 (팩토리 함수 사용)
-from scraper import make_law_scraper
-from update import make_law_updater
-from scraper.directive_scraper import DirectiveScraper
-from update.directive_updater import DirectiveUpdater
-from merge_law_tables import main as merge_main
+# 모든 업데이터의 실행을 담당하는 파일 (파이프라인별 프로세스로 동시 실행)
+import argparse
+from log_util import setup_logger
+from pipeline_runner import run_pipelines, update_law, update_directive, defer_exports
 
-if __name__ == "__main__":
-    # 중앙정부 법령 업데이트
-    central_scraper = make_law_scraper("central")
-    central_updater = make_law_updater("central", central_scraper)
-    central_updater.run()
 
-    # 지방정부 법령 업데이트
-    local_scraper = make_law_scraper("local")
-    local_updater = make_law_updater("local", local_scraper)
-    local_updater.run()
+def parse_args():
+    parser = argparse.ArgumentParser(description="법령/행정지시문서 업데이트")
+    parser.add_argument("--sequential", action="store_true",
+                        help="파이프라인을 동시에 실행하지 않고 순서대로 실행")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logger = setup_logger("update_manager", "output/log/update_manager.log")
 
-    # 행정지시문서 업데이트
-    directive_scraper = DirectiveScraper()
-    directive_updater = DirectiveUpdater(directive_scraper)
-    directive_updater.run()
+    # 중앙정부/지방정부 법령, 행정지시문서 업데이트 (한 파이프라인 실패해도 나머지는 계속)
+    jobs = [
+        ("central", update_law, {"mode": "central"}),
+        ("local", update_law, {"mode": "local"}),
+        ("directive", update_directive, {}),
+    ]
+    run_pipelines(defer_exports(jobs), parallel=not args.sequential, logger=logger)
 
-    # 업데이트 후 전체 병합
-    merge_main()
\ No newline at end of file
+    # 업데이트 후 전체 병합 (merged_result도 여기서 저장)
+    from merge_law_tables import main as merge_main
+    merge_main()
@@ -0,0 +1,2 @@
+# vietscrap/__init__.py
+# 통합 CLI 패키지 (python -m vietscrap) - 실제 구현은 scraper/, update/, merge_law_tables.py
@@ -0,0 +1,5 @@
+# python -m vietscrap 진입점
+import sys
+from vietscrap.cli import main
+
+sys.exit(main())
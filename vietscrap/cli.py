@@ -0,0 +1,270 @@
+# 통합 CLI - python -m vietscrap crawl|update|merge|census|retry|serve
+#   python -m vietscrap crawl --pipelines local --regions hanoi,backan --pages 1-50 --workers 6
+#   python -m vietscrap update --pages 5 --engine undetected
+#   python -m vietscrap update --revalidate 500
+#   python -m vietscrap retry --pipelines central
+#   python -m vietscrap merge --shards
+#   python -m vietscrap census --force
+#   python -m vietscrap crawl --pipelines central --profile sample --profile-pages 5
+#   python -m vietscrap merge --format both
+#   python -m vietscrap serve --port 8765
+
+import argparse
+import re
+import sys
+import time
+
+PIPELINES = ("central", "local", "directive")
+ENGINES = ("selenium", "undetected")
+PROFILERS = ("sample", "cprofile")
+OUTPUT_FORMATS = ("csv", "parquet", "both")
+DEFAULT_WORKERS = 4
+UPDATE_PAGES = 20
+
+
+def parse_list(text: str) -> list:
+    """'a,b' → ['a', 'b']"""
+    return [t.strip() for t in text.split(",") if t.strip()]
+
+
+def parse_pipelines(text: str) -> list:
+    names = parse_list(text)
+    unknown = [n for n in names if n not in PIPELINES]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(f"알 수 없는 파이프라인: {unknown} (선택: {', '.join(PIPELINES)})")
+    return list(dict.fromkeys(names))
+
+
+def parse_page_range(text: str) -> tuple:
+    """'1-50' → (1, 50), '100-' → (100, None), '7' → (7, 7)"""
+    m = re.fullmatch(r"\s*(\d+)\s*(-\s*(\d*))?\s*", text)
+    if not m or int(m.group(1)) < 1:
+        raise argparse.ArgumentTypeError(f"페이지 범위 형식 오류 (예: 1-50, 100-, 7): {text}")
+    lo = int(m.group(1))
+    hi = lo if m.group(2) is None else (int(m.group(3)) if m.group(3) else None)
+    if hi is not None and hi < lo:
+        raise argparse.ArgumentTypeError(f"페이지 범위 오류: {text}")
+    return lo, hi
+
+
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {text}")
+    return value
+
+
+def non_negative_int(text: str) -> int:
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"0 이상이어야 합니다: {text}")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from scraper.sharding import parse_shard
+    from scraper.time_budget import parse_duration
+
+    # 수집 계열 명령 공통 옵션
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--pipelines", type=parse_pipelines, default=list(PIPELINES),
+                        help="실행할 파이프라인 (예: central,local) - 기본 전체")
+    common.add_argument("--engine", choices=ENGINES, default="selenium",
+                        help="브라우저 엔진 (undetected: undetected_chromedriver)")
+    common.add_argument("--workers", type=positive_int, default=DEFAULT_WORKERS,
+                        help="파이프라인별 상세 수집 최대 동시 브라우저 수 (AIMD 상한)")
+    common.add_argument("--chunk-size", type=positive_int, default=None,
+                        help="중간 저장 단위 페이지 수 (기본 10)")
+    common.add_argument("--docs-per-page", type=positive_int, default=None,
+                        help="법령 목록 페이지당 문서 수 (기본 30, 사이트 설정이 바뀐 경우에만 지정)")
+    common.add_argument("--sequential", action="store_true",
+                        help="파이프라인을 동시에 실행하지 않고 순서대로 실행")
+    common.add_argument("--no-merge", action="store_true", help="수집 후 law_combined 병합 생략")
+
+    # 단계별 프로파일링 (환경변수 VIETSCRAP_PROFILE* 로도 지정 가능)
+    profiling = argparse.ArgumentParser(add_help=False)
+    profiling.add_argument("--profile", choices=PROFILERS, default=None,
+                           help="단계별 프로파일링 (sample: flamegraph용 collapsed stack, cprofile: .prof) "
+                                "- 결과는 output/*/log/profile/")
+    profiling.add_argument("--profile-stages", type=parse_list, default=None,
+                           help="프로파일링할 단계 (예: extract_law_details,merge_info) - 기본 전체")
+    profiling.add_argument("--profile-pages", type=positive_int, default=None,
+                           help="처음 N개 목록 페이지까지만 프로파일링 (오버헤드 제한)")
+
+    # 출력 형식 (환경변수 VIETSCRAP_FORMAT 으로도 지정 가능)
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                        help="merged_result/law_combined 출력 형식 (parquet: zstd, regionID 파티션 - pyarrow 필요, 기본 csv)")
+
+    parser = argparse.ArgumentParser(prog="vietscrap", description="베트남 법령/행정지시문서 수집기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    crawl = sub.add_parser("crawl", parents=[common, profiling, output],
+                           help="전체 수집 (frontier 기준으로 이어서 수집, 처음부터는 --fresh)")
+    crawl.add_argument("--regions", type=parse_list, default=None, help="지방 법령 지역 코드 (예: hanoi,backan)")
+    crawl.add_argument("--pages", type=parse_page_range, default=None,
+                       help="수집할 목록 페이지 범위 - 지역마다 적용 (예: 1-50, 100-)")
+    crawl.add_argument("--region-workers", type=positive_int, default=1,
+                       help="지방 법령 지역/페이지 범위 작업을 병렬 처리할 브라우저 수")
+    crawl.add_argument("--shard", type=parse_shard, default=None, help="다중 노드 분할 실행 시 담당 샤드 (예: 1/4)")
+    crawl.add_argument("--counts", default=None, help="샤드 분할 기준 문서 수 스냅샷(JSON)")
+    crawl.add_argument("--time-budget", type=parse_duration, default=None,
+                       help="실행 시간 예산 (예: 8h) - 마감 전에 저장 후 중단")
+    crawl.add_argument("--fresh", action="store_true",
+                       help="이전 수집 기록(output/*/log/frontier.sqlite)을 지우고 처음부터 수집 "
+                            "- 기본은 완료된 목록 페이지/URL을 건너뛰고 이어서 수집")
+    crawl.set_defaults(func=cmd_crawl)
+
+    update = sub.add_parser("update", parents=[common, profiling, output], help="최신 목록 페이지의 신규 문서 + 실패 URL 수집")
+    update.add_argument("--pages", type=positive_int, default=UPDATE_PAGES,
+                        help=f"확인할 최신 목록 페이지 수 (기본 {UPDATE_PAGES})")
+    update.add_argument("--regions", type=parse_list, default=None, help="지방 법령 지역 코드 (예: hanoi,backan)")
+    update.add_argument("--revalidate", type=non_negative_int, default=None,
+                        help="파이프라인별로 다시 수집해 변경(유효상태, 관계정보 등)을 확인할 기존 문서 수 "
+                             "(경과 시간/유효상태/변경 빈도 순, 0이면 안 함, 기본 100)")
+    update.set_defaults(func=cmd_update)
+
+    retry = sub.add_parser("retry", parents=[common, profiling, output], help="실패 URL(failed_urls.csv, frontier failed)만 재수집")
+    retry.set_defaults(func=cmd_retry)
+
+    merge = sub.add_parser("merge", parents=[profiling, output], help="law_combined 병합")
+    merge.add_argument("--shards", action="store_true", help="샤드 결과(output/*_law/shards)를 먼저 병합")
+    merge.set_defaults(func=cmd_merge)
+
+    census = sub.add_parser("census", help="지역별 법령 문서 수 센서스")
+    census.add_argument("--force", action="store_true", help="캐시와 무관하게 전체 다시 수집")
+    census.add_argument("--workers", type=positive_int, default=4, help="동시 드라이버 수")
+    census.add_argument("--max-age", type=float, default=24, help="캐시 유효 시간(시간)")
+    census.set_defaults(func=cmd_census)
+
+    serve = sub.add_parser("serve", help="law_combined 조회 HTTP/JSON 서버 (병합 후 자동으로 다시 읽음)")
+    serve.add_argument("--host", default="127.0.0.1", help="바인딩 주소")
+    serve.add_argument("--port", type=positive_int, default=8765, help="포트")
+    serve.add_argument("--poll", type=float, default=2.0, help="출력 파일 변경 확인 주기(초)")
+    serve.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+# ----- 파이프라인 옵션 -----
+def _scraper_options(args, page_range=None) -> dict:
+    """법령/행정지시 스크래퍼 공통 kwargs (None은 각 스크래퍼 기본값 사용)"""
+    options = {"use_undetected": args.engine == "undetected", "max_workers": args.workers,
+               "chunk_size": args.chunk_size, "page_range": page_range}
+    return {k: v for k, v in options.items() if v is not None}
+
+
+def _law_options(args, page_range=None) -> dict:
+    options = dict(_scraper_options(args, page_range), docs_per_page=args.docs_per_page,
+                   regions=getattr(args, "regions", None))
+    return {k: v for k, v in options.items() if v is not None}
+
+
+def _run(args, jobs, deadline=None) -> int:
+    from pipeline_runner import run_pipelines, defer_exports
+    from log_util import setup_logger
+
+    logger = setup_logger("vietscrap", "output/log/vietscrap.log")
+    merge = not args.no_merge and not getattr(args, "shard", None)
+    results = run_pipelines(defer_exports(jobs) if merge else jobs, parallel=not args.sequential,
+                            deadline=deadline, logger=logger)
+
+    if merge:
+        from merge_law_tables import main as merge_main
+        merge_main()
+    return 0 if all(results.values()) else 1
+
+
+# ----- 명령 -----
+def cmd_crawl(args) -> int:
+    from pipeline_runner import crawl_law, crawl_directive
+
+    jobs = []
+    for name in args.pipelines:
+        if name == "directive":
+            # 행정지시문서 수집 (샤드 실행 시 1번 샤드만 담당)
+            if args.shard is None or args.shard[0] == 1:
+                jobs.append((name, crawl_directive, dict(_scraper_options(args, args.pages), fresh=args.fresh)))
+            continue
+        kwargs = dict(_law_options(args, args.pages), mode=name, shard=args.shard, counts_path=args.counts,
+                      fresh=args.fresh)
+        if name == "local":
+            kwargs["region_workers"] = args.region_workers
+        jobs.append((name, crawl_law, kwargs))
+
+    deadline = time.time() + args.time_budget if args.time_budget else None
+    return _run(args, jobs, deadline)
+
+
+def _update_jobs(args, update_pages: int) -> list:
+    from pipeline_runner import update_law, update_directive
+
+    revalidate = getattr(args, "revalidate", None)
+    jobs = []
+    for name in args.pipelines:
+        if name == "directive":
+            jobs.append((name, update_directive, dict(_scraper_options(args), update_pages=update_pages,
+                                                      revalidate=revalidate)))
+        else:
+            jobs.append((name, update_law, dict(_law_options(args), mode=name, update_pages=update_pages,
+                                                revalidate=revalidate)))
+    return jobs
+
+
+def cmd_update(args) -> int:
+    return _run(args, _update_jobs(args, args.pages))
+
+
+def cmd_retry(args) -> int:
+    # 최신 목록 확인 없이 실패 URL만 재수집
+    return _run(args, _update_jobs(args, 0))
+
+
+def cmd_merge(args) -> int:
+    if args.shards:
+        from scraper.sharding import merge_shards
+        merge_shards("central")
+        merge_shards("local")
+    from merge_law_tables import main as merge_main
+    merge_main()
+    return 0
+
+
+def cmd_census(args) -> int:
+    from log_util import setup_logger
+    from scraper.census import RegionCensus, CACHE_PATH
+
+    logger = setup_logger("census", "output/census/log/census.log")
+    census = RegionCensus(CACHE_PATH, max_age_hours=args.max_age, workers=args.workers, logger=logger)
+    census.refresh(force=args.force)
+
+    counts = census.counts("local")
+    for region, total_docs in counts.items():
+        print(f"[{region}]총 문서 수: {total_docs}")
+    print(f"지방 {len(counts)}개 지역 합계: {sum(counts.values())}, 중앙: {census.total('central')}")
+    return 0
+
+
+def cmd_serve(args) -> int:
+    from log_util import setup_logger
+    from search import serve
+
+    logger = setup_logger("search", "output/log/search.log")
+    serve(args.host, args.port, args.poll, logger=logger)
+    return 0
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "profile", None):
+        # spawn된 파이프라인 프로세스도 환경변수로 프로파일링 설정을 이어받음
+        import profile_util
+        profile_util.set_env(args.profile, args.profile_stages, args.profile_pages)
+    if getattr(args, "format", None):
+        from storage.columnar import set_format
+        set_format(args.format)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())